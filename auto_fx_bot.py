@@ -2,105 +2,41 @@
 # -*- coding: utf-8 -*-
 
 import os
-import csv
-import requests
-from datetime import datetime, timedelta, timezone
-import tweepy
+import argparse
 from tweepy.errors import Forbidden, TooManyRequests
 
+from fx_engine import get_engine, snapshot
+import fx_series
+import x_client
+
 # --- Modlar / env ---
 DRY = os.environ.get("DRY_MODE", "false").lower() == "true"
+# Gün içi değişim (|%|) bu eşiğin altındaysa tweet atlanır; 0 = her zaman at
+MIN_MOVE_PCT = float(os.environ.get("FX_MIN_MOVE_PCT", "0"))
+# Kur kartını (fx_card.CARD_PATH) tweet'e ekle
+ATTACH_CARD = os.environ.get("FX_ATTACH_CARD", "false").lower() == "true"
 
-# v1.1 anahtarları
-API_KEY = os.environ.get("API_KEY")
-API_SECRET = os.environ.get("API_SECRET")
-ACCESS_TOKEN = os.environ.get("ACCESS_TOKEN")
-ACCESS_TOKEN_SECRET = os.environ.get("ACCESS_TOKEN_SECRET")
-
-# v2 için ayrıca bearer da gerekli
-BEARER_TOKEN = os.environ.get("BEARER_TOKEN")
-
-# --- Tweepy client'lar ---
+# --- Tweepy client'lar (anahtarlar x_client'tan) ---
 def tweepy_api_v11():
-    auth = tweepy.OAuth1UserHandler(API_KEY, API_SECRET, ACCESS_TOKEN, ACCESS_TOKEN_SECRET)
-    return tweepy.API(auth)
+    return x_client.api_v11()
 
 def tweepy_client_v2():
-    return tweepy.Client(
-        bearer_token=BEARER_TOKEN,
-        consumer_key=API_KEY,
-        consumer_secret=API_SECRET,
-        access_token=ACCESS_TOKEN,
-        access_token_secret=ACCESS_TOKEN_SECRET,
-        wait_on_rate_limit=False,
-    )
+    return x_client.client()
 
 # --- Veri kaynakları ---
-STOOQ_URL = "https://stooq.com/q/l/?s={symbols}&i=d"
-
-def fetch_stooq_latest(symbols):
-    url = STOOQ_URL.format(symbols=",".join(symbols))
-    r = requests.get(url, timeout=10)
-    r.raise_for_status()
-    out = {}
-    for row in csv.reader(r.text.strip().splitlines()):
-        if len(row) < 7:
-            continue
-        sym = row[0].strip().lower()
-        try:
-            close = float(row[6])
-        except Exception:
-            continue
-        out[sym] = close
-    return out
-
-def fetch_erapi(base):
-    url = f"https://open.er-api.com/v6/latest/{base}"
-    r = requests.get(url, timeout=10)
-    r.raise_for_status()
-    data = r.json()
-    if data.get("result") != "success":
-        raise RuntimeError("er-api fail")
-    rate = data["rates"].get("TRY")
-    if not rate:
-        raise RuntimeError("TRY not in er-api")
-    return float(rate)
-
-def safe_try(func, *args, **kwargs):
-    try:
-        return func(*args, **kwargs)
-    except Exception:
-        return None
+def series_keys():
+    """Ekran adı -> sembol (geçmiş serisi anahtarı), config sırasıyla."""
+    return {d["label"]: d["key"] for d in get_engine()["display"]}
 
 def fetch_fx_snapshot():
-    """Önce Stooq, olmazsa er-api; altın opsiyonel."""
-    usd = eur = gbp = xau_usd = None
-
-    stooq = safe_try(fetch_stooq_latest, ["usdntry", "eurtry", "gbptry", "xauusd"])
-    if stooq:
-        usd = stooq.get("usdntry") or usd
-        eur = stooq.get("eurtry") or eur
-        gbp = stooq.get("gbptry") or gbp
-        xau_usd = stooq.get("xauusd") or xau_usd
+    """Semboller assets/fx_symbols.json'dan; sağlayıcılar yarışır, türetilenler tek geçişte hesaplanır."""
+    values, source, ts = snapshot()
+    print(f"[FX] Kaynak: {source}")
 
-    if usd is None: usd = safe_try(fetch_erapi, "USD")
-    if eur is None: eur = safe_try(fetch_erapi, "EUR")
-    if gbp is None: gbp = safe_try(fetch_erapi, "GBP")
-
-    if usd is None and eur is None:
+    if values.get("usdtry") is None and values.get("eurtry") is None:
         raise RuntimeError("Kurlar alınamadı (Stooq/er-api)")
 
-    gram_altin = None
-    if xau_usd is not None and usd is not None:
-        gram_altin = (xau_usd * usd) / 31.1035
-
-    return {
-        "Dolar": usd,
-        "Euro": eur,
-        "Pound": gbp,
-        "Gram Altın": gram_altin,
-        "Ons Altın (USD)": xau_usd,
-    }
+    return {label: values.get(key) for label, key in series_keys().items()}, ts
 
 # --- Metin ---
 def format_price(x):
@@ -108,43 +44,84 @@ def format_price(x):
         return "-"
     return f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
 
-def build_text(data):
+def format_change(pct):
+    if pct is None:
+        return ""
+    arrow = "▲" if pct > 0 else "▼" if pct < 0 else "▬"
+    return f" {arrow} %{format_price(abs(pct))}"
+
+# --- Geçmiş ---
+def record_and_diff(data, ts=None):
+    """
+    Snapshot'ı seriye yaz (ts: fiyatların alınma zamanı; önbellekten gelen aynı fiyat yeni
+    gözlem diye tekrar yazılmaz), gün açılışına göre yüzde değişimleri döndür.
+    """
+    keys = series_keys()
+    values = {keys[k]: v for k, v in data.items() if v is not None}
+    fx_series.append_snapshot(values, ts)
+    return {k: fx_series.day_change(keys[k], v) for k, v in data.items()}
+
+def moved_enough(changes, threshold=MIN_MOVE_PCT):
+    if threshold <= 0:
+        return True
+    return any(c is not None and abs(c) >= threshold for c in changes.values())
+
+def build_text(data, changes=None):
+    ch = lambda k: format_change((changes or {}).get(k))
+    shown = [d for d in get_engine()["display"] if data.get(d["label"]) is not None]
+    kur = [d for d in shown if d.get("section", "kur") == "kur"]
+    extras = [d for d in shown if d.get("section") == "ek"]
+
+    def row(d, width, sep):
+        unit = f" {d['unit']}" if d.get("unit") else ""
+        return f"{d['label'].ljust(width)}{sep}{format_price(data[d['label']])}{unit}{ch(d['label'])}"
+
     lines = ["Güncel Kurlar:"]
-    if data["Dolar"] is not None:  lines.append(f"• Dolar : {format_price(data['Dolar'])}")
-    if data["Euro"]  is not None:  lines.append(f"• Euro  : {format_price(data['Euro'])}")
-    if data["Pound"] is not None:  lines.append(f"• Pound : {format_price(data['Pound'])}")
-
-    extras = []
-    if data["Gram Altın"] is not None:
-        extras.append(f"Gram Altın: {format_price(data['Gram Altın'])} TL")
-    if data["Ons Altın (USD)"] is not None:
-        extras.append(f"Ons Altın : {format_price(data['Ons Altın (USD)'])} $")
+    w = max((len(d["label"]) for d in kur), default=0)
+    lines.extend("• " + row(d, w, " : ") for d in kur)
+
     if extras:
+        w = max(len(d["label"]) for d in extras)
         lines.append("")
-        lines.extend(extras)
+        lines.extend(row(d, w, ": ") for d in extras)
 
     return "\n".join(lines)
 
 # --- Tweet at ---
-def post_tweet(text: str) -> bool:
-    # 1) v1.1 dene
+def upload_media(path):
+    """Görseli v1.1 media_upload ile yükle; media_id ya da None."""
     try:
-        api = tweepy_api_v11()
-        api.update_status(status=text)
-        print("[TWITTER v1.1] ✅ Tweet gönderildi.")
-        return True
-    except Forbidden as e:
-        # 453 → v2'ye düş
-        print("[TWITTER v1.1] 403/453 — v2 create_tweet'e geçiliyor.")
-    except TooManyRequests:
-        print("[TWITTER v1.1] Rate limit — v2'yi deniyorum.")
+        media = tweepy_api_v11().media_upload(filename=path)
+        return media.media_id
     except Exception as e:
-        print(f"[TWITTER v1.1 ERROR] {e} — v2'yi deniyorum.")
+        print(f"[TWITTER MEDIA ERROR] {e} — görselsiz devam.")
+        return None
+
+def post_tweet(text: str, media_path=None, client=None) -> bool:
+    media_ids = None
+    if media_path:
+        media_id = upload_media(media_path)
+        media_ids = [media_id] if media_id else None
+
+    # 1) v1.1 dene (ortak istemci verildiyse atlanır: gönderi zamanlayıcıdan geçmeli)
+    if client is None:
+        try:
+            api = tweepy_api_v11()
+            api.update_status(status=text, media_ids=media_ids)
+            print("[TWITTER v1.1] ✅ Tweet gönderildi.")
+            return True
+        except Forbidden as e:
+            # 453 → v2'ye düş
+            print("[TWITTER v1.1] 403/453 — v2 create_tweet'e geçiliyor.")
+        except TooManyRequests:
+            print("[TWITTER v1.1] Rate limit — v2'yi deniyorum.")
+        except Exception as e:
+            print(f"[TWITTER v1.1 ERROR] {e} — v2'yi deniyorum.")
 
     # 2) v2 ile dene
     try:
-        client = tweepy_client_v2()
-        client.create_tweet(text=text)
+        client = client or tweepy_client_v2()
+        client.create_tweet(text=text, media_ids=media_ids)
         print("[TWITTER v2] ✅ Tweet gönderildi.")
         return True
     except Forbidden as e:
@@ -159,22 +136,35 @@ def post_tweet(text: str) -> bool:
         return False
 
 # --- Main ---
-def main():
+def main(argv=None, client=None):
+    argparse.ArgumentParser(description="Döviz/altın kur tweet'i").parse_args(argv)
     try:
-        data = fetch_fx_snapshot()
+        data, ts = fetch_fx_snapshot()
     except Exception as e:
         print(f"Veri alınamadı: {e}")
         print("⚠️ Veriler alınamadı, tweet atlanıyor.")
         return
 
-    text = build_text(data)
+    changes = record_and_diff(data, ts)
+    text = build_text(data, changes)
+
+    if not moved_enough(changes):
+        print(f"ℹ️ Gün içi hareket %{MIN_MOVE_PCT} eşiğinin altında, tweet atlanıyor.")
+        print(text)
+        return
+
+    card = None
+    if ATTACH_CARD:
+        from fx_card import save_card
+        card = save_card(data, changes)
+        print(f"🖼️ Kart hazır: {card}")
 
     if DRY:
         print("— DRY RUN —")
         print(text)
         return
 
-    ok = post_tweet(text)
+    ok = post_tweet(text, card, client)
     if ok:
         print("✅ Tamam.")
     else:
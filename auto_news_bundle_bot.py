@@ -3,43 +3,56 @@
 
 import os
 import re
+import sys
+import json
 import html
+import time
 import argparse
-from urllib.parse import urlparse
+import xml.etree.ElementTree as ET
+from urllib.parse import urlparse, urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
 from bs4 import BeautifulSoup
-import tweepy
+from lxml import etree
+
+from page_parser import get_backend
+import posted_index
+import http_pool
+import state_store
+import x_client
+import tweet_text
 
 # ---- Ayarlar ----
 UA = {"User-Agent": "Mozilla/5.0 (compatible; BundleScraper/2.0)"}
 TIMEOUT = 12
-MAX_TWEET = 280
-TCO_RESERVE = 25  # t.co kısalması için kaba rezerv
 DRY = os.environ.get("DRY_MODE", "false").lower() == "true"
+STATE_PATH = "bundle_state.json"
+SEEN_CAP = 5000  # state'te tutulacak en fazla URL
+PENDING_CAP = 2000  # sonraki tura kalan (işlenemeyen/taşan) en fazla URL
+MAX_TRIES = 3    # hata veren URL en fazla bu kadar tur denenir
+WORKERS = 8      # eşzamanlı sayfa indirme
+PARSER = os.environ.get("BUNDLE_PARSER")  # bs4 | lxml (boşsa PARSER_BACKEND)
 
-# ---- Twitter v2 ----
-API_KEY = os.environ.get("API_KEY")
-API_SECRET = os.environ.get("API_SECRET")
-ACCESS_TOKEN = os.environ.get("ACCESS_TOKEN")
-ACCESS_TOKEN_SECRET = os.environ.get("ACCESS_TOKEN_SECRET")
-BEARER_TOKEN = os.environ.get("BEARER_TOKEN")
+# Tüm thread'ler aynı bağlantı havuzunu kullansın (süreç geneli; başlık istekte verilir)
+SESSION = http_pool.session()
 
+# ---- Twitter v2 ----
 def tw_client_v2():
-    return tweepy.Client(
-        bearer_token=BEARER_TOKEN,
-        consumer_key=API_KEY,
-        consumer_secret=API_SECRET,
-        access_token=ACCESS_TOKEN,
-        access_token_secret=ACCESS_TOKEN_SECRET,
-        wait_on_rate_limit=True,
-    )
+    return x_client.client(wait_on_rate_limit=True)
 
 # ---- Yardımcılar ----
-def get_html(url: str) -> BeautifulSoup:
-    r = requests.get(url, headers=UA, timeout=TIMEOUT)
+def get_page(url: str) -> str:
+    r = SESSION.get(url, headers=UA, timeout=TIMEOUT)
     r.raise_for_status()
-    return BeautifulSoup(r.text, "lxml")
+    return r.text
+
+def get_html(url: str, parser=None):
+    P = parser or get_backend(PARSER)
+    return P.parse_html(get_page(url))
+
+def parse_tree(page: str):
+    """lxml.html ağacı (extract_ai_summary_fast için)."""
+    return get_backend("lxml").parse_html(page)
 
 def clean(s: str) -> str:
     s = html.unescape(s or "")
@@ -48,16 +61,18 @@ def clean(s: str) -> str:
     s = re.sub(r"^[•\u2022\-–—]\s*", "", s)
     return s
 
-def extract_title(doc: BeautifulSoup) -> str:
-    for sel in [["h1"], ["h2"]]:
-        el = doc.find(sel[0])
-        if el and el.get_text(strip=True):
-            return clean(el.get_text(" ", strip=True))
-    m = doc.find("meta", attrs={"property": "og:title"}) or doc.find("meta", attrs={"name": "og:title"})
-    if m and m.get("content"):
-        return clean(m["content"])
-    if doc.title and doc.title.string:
-        return clean(doc.title.string)
+def extract_title(doc, parser=None) -> str:
+    P = parser or get_backend(PARSER)
+    for tag in ("h1", "h2"):
+        found = P.find_all(doc, tag, limit=1)
+        if found and P.text(found[0]):
+            return clean(P.text(found[0]))
+    og = P.meta(doc, "og:title")
+    if og:
+        return clean(og)
+    title = P.title(doc)
+    if title:
+        return clean(title)
     return ""
 
 def collect_following_texts(anchor) -> list[str]:
@@ -123,14 +138,85 @@ def extract_ai_summary(doc: BeautifulSoup) -> list[str]:
 
     return []
 
-def fallback_description(doc: BeautifulSoup) -> str:
+# ---- Hedefli (lxml/XPath) özet çıkarımı ----
+# XPath'ler bir kez derlenir; tarama C tarafında yapılır, BeautifulSoup ağacı kurulmaz.
+RE_NS = {"re": "http://exslt.org/regular-expressions"}
+# find_all(string=...) yorumları da (Comment) tarar; aynı çapalar için //comment() da aranır
+XP_ANCHOR_TEXT = etree.XPath(r"(//text() | //comment())[re:test(., '(Bundle\s*AI|özet|özetliyor)', 'i')]",
+                             namespaces=RE_NS)
+XP_NEXT_10 = etree.XPath("(descendant::* | following::*)[position() <= 10]")
+XP_SUMMARY_BLOCKS = etree.XPath("//*[re:test(@class, 'summary|ai', 'i')]", namespaces=RE_NS)
+XP_LI = etree.XPath(".//li")
+XP_P = etree.XPath(".//p")
+# get_text(" ", strip=True) eşleniği: yorum/script/style metni hariç
+XP_TEXT = etree.XPath(".//text()[not(parent::script) and not(parent::style)]")
+
+def node_text(el) -> str:
+    return " ".join(t.strip() for t in XP_TEXT(el) if t.strip())
+
+def text_parent(t):
+    """Metin/yorum düğümünün BeautifulSoup'taki ebeveyni (tail metni kapsayan elemana aittir)."""
+    if isinstance(t, etree._Comment):
+        return t.getparent()
+    parent = t.getparent()
+    return parent.getparent() if t.is_tail else parent
+
+def collect_following_texts_fast(anchor) -> list[str]:
+    """collect_following_texts ile aynı kurallar, lxml ağacı üzerinde."""
+    out = []
+    for sib in XP_NEXT_10(anchor):
+        if sib.tag in ("h1", "h2", "h3"):
+            break
+        if sib.tag in ("ul", "ol"):
+            for li in XP_LI(sib):
+                t = clean(node_text(li))
+                if len(t) >= 3:
+                    out.append(t)
+        if sib.tag in ("p", "div"):
+            t = clean(node_text(sib))
+            if len(t) >= 3:
+                parts = [clean(x) for x in re.split(r"[•\u2022]\s*", t) if x.strip()]
+                if parts:
+                    out.extend(parts)
+                else:
+                    out.append(t)
+        if len(out) >= 6:
+            break
+    return list(dict.fromkeys(out))
+
+def extract_ai_summary_fast(tree) -> list[str]:
+    """extract_ai_summary'nin lxml/XPath karşılığı; aynı maddeleri döndürür."""
+    tried = set()
+    for t in XP_ANCHOR_TEXT(tree):
+        anc = text_parent(t)
+        if anc is None or anc in tried:
+            continue
+        tried.add(anc)
+        texts = collect_following_texts_fast(anc)
+        if texts:
+            return texts
+
+    for div in XP_SUMMARY_BLOCKS(tree):
+        lis = [clean(node_text(li)) for li in XP_LI(div)]
+        lis = [x for x in lis if x]
+        if lis:
+            return lis
+        ps = [clean(node_text(p)) for p in XP_P(div)]
+        ps = [x for x in ps if x]
+        if ps:
+            return ps
+
+    return []
+
+def fallback_description(doc, parser=None) -> str:
+    P = parser or get_backend(PARSER)
     for key in ("og:description", "twitter:description", "description"):
-        m = doc.find("meta", attrs={"property": key}) or doc.find("meta", attrs={"name": key})
-        if m and m.get("content"):
-            return clean(m["content"])
+        content = P.meta(doc, key)
+        if content:
+            return clean(content)
     # ilk uzun paragrafa düş
-    for p in doc.find_all("p"):
-        txt = clean(p.get_text(" ", strip=True))
+    for p in P.find_all(doc, "p"):
+        txt = clean(P.text(p))
         if len(txt) > 120:
             return txt
     return ""
@@ -151,42 +237,29 @@ def smart_join(paragraphs: list[str]) -> str:
     joined = re.sub(r"\s+", " ", joined).strip()
     return joined
 
-def natural_truncate(text: str, max_len: int) -> str:
-    if len(text) <= max_len:
-        return text
-    # Noktalama/bosluk sınırında kesmeyi dene
-    cut = text[:max_len]
-    # En yakın doğal sınır: nokta, noktalı virgül, iki nokta, tire, virgül, boşluk
-    m = re.search(r"[\.!?…;:\-–—,]\s+\S*?$", cut)
-    if m:
-        cut = cut[:m.start()].rstrip()
-    else:
-        # kelime sınırı
-        if " " in cut:
-            cut = cut[:cut.rfind(" ")].rstrip()
-    return (cut + "…").rstrip()
-
 def compose_tweet(full_summary: str, url: str) -> str:
+    """Özet + kaynak; kuyruk kesilmez, URL t.co ağırlığıyla (23) sayılır (tweet_text)."""
     host = urlparse(url).netloc.replace("www.", "")
-    tail = f" — Kaynak: {host} {url}"
-    room = MAX_TWEET - len(tail) - 1  # 1 boşluk payı
-    # t.co payını zaten kuyrukta gerçek URL var diye ayrıca TCO_RESERVE eklemiyoruz;
-    # güvenli tarafta kalmak istersen: room -= TCO_RESERVE
-    if room < 60:
-        room = 60  # minimum biraz metin kalsın
-    text = natural_truncate(full_summary, room)
-    return f"{text}{tail}"
-
-def make_tweet_from_bundle(url: str) -> str:
-    doc = get_html(url)
-    title = extract_title(doc)
-    bullets = extract_ai_summary(doc)
+    return tweet_text.compose(full_summary, f" — Kaynak: {host} {url}")
+
+def extract_summary(doc, parser=None) -> list[str]:
+    """Arka uca göre özet çıkarıcı: lxml'de XPath yolu, bs4'te klasik tarama."""
+    P = parser or get_backend(PARSER)
+    if P.name == "lxml":
+        return extract_ai_summary_fast(doc)
+    return extract_ai_summary(doc)
+
+def make_tweet_from_bundle(url: str, parser=None) -> str:
+    P = parser or get_backend(PARSER)
+    doc = P.parse_html(get_page(url))
+    bullets = extract_summary(doc, P)
 
     if bullets:
         full = smart_join(bullets)
     else:
         # AI özet bulunamadı; fallback'e düş
-        desc = fallback_description(doc)
+        title = extract_title(doc, P)
+        desc = fallback_description(doc, P)
         if not desc and not title:
             raise RuntimeError("Sayfadan özet çekilemedi")
         full = desc or title
@@ -196,23 +269,235 @@ def make_tweet_from_bundle(url: str) -> str:
     tweet = compose_tweet(full, url)
     return tweet
 
+# ---- Tarama (sitemap / liste sayfası) ----
+def load_state():
+    st = state_store.load(STATE_PATH)
+    st.setdefault("seen", [])
+    st.setdefault("sitemap_lastmod", {})
+    st.setdefault("pending", [])      # [[url, sitemap, lastmod, deneme], ...]
+    return st
+
+def save_state(st):
+    del st["seen"][:-SEEN_CAP]
+    state_store.save(STATE_PATH, st)
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+def discover_sitemap(url: str, since: str = "", depth: int = 0) -> list[tuple[str, str]]:
+    """
+    Sitemap'ten (loc, lastmod) çiftleri; lastmod < since olanları atla.
+    sitemapindex ise alt sitemap'lere (yine lastmod filtresiyle) in.
+    ISO-8601 lastmod'lar metin olarak sıralanabilir.
+    """
+    r = SESSION.get(url, headers=UA, timeout=TIMEOUT)
+    r.raise_for_status()
+    root = ET.fromstring(r.content)
+    out = []
+    for node in root:
+        loc = lastmod = ""
+        for child in node:
+            name = _local(child.tag)
+            if name == "loc":
+                loc = (child.text or "").strip()
+            elif name == "lastmod":
+                lastmod = (child.text or "").strip()
+        if not loc or (since and lastmod and lastmod < since):
+            continue
+        if _local(node.tag) == "sitemap" and depth < 2:
+            out.extend(discover_sitemap(loc, since, depth + 1))
+        elif _local(node.tag) == "url":
+            out.append((loc, lastmod))
+    return out
+
+def discover_listing(url: str, pattern: str = "") -> list[str]:
+    """Liste sayfasındaki aynı host'a ait haber linkleri (sayfa sırasıyla, tekrarsız)."""
+    P = get_backend(PARSER)
+    doc = get_html(url, P)
+    host = urlparse(url).netloc
+    rx = re.compile(pattern) if pattern else None
+    out, seen = [], set()
+    for a in P.find_all(doc, "a"):
+        href = P.attr(a, "href")
+        if href is None:
+            continue
+        link = urljoin(url, href).split("#", 1)[0]
+        p = urlparse(link)
+        if p.netloc != host or link in seen:
+            continue
+        if rx and not rx.search(link):
+            continue
+        # desen yoksa: en az iki segmentli, tireli slug içeren yollar
+        if not rx and not (p.path.count("/") >= 2 and "-" in p.path.rsplit("/", 1)[-1]):
+            continue
+        seen.add(link)
+        out.append(link)
+    return out
+
+def discover_new(args, state) -> list[list]:
+    """
+    -> [[url, sitemap, lastmod, deneme], ...]: önce önceki turdan kalanlar, sonra yeniler.
+    Filigran burada ilerletilmez; sadece işlenen URL'lere göre (advance_state).
+    """
+    seen = set(state["seen"])
+    items = [list(p) for p in state["pending"]]
+    for sm in args.sitemap or []:
+        since = state["sitemap_lastmod"].get(sm, "")
+        try:
+            found = discover_sitemap(sm, since)
+        except Exception as e:
+            print(f"[SITEMAP] {sm} okunamadı: {e}")
+            continue
+        items.extend([u, sm, lm, 0] for u, lm in found)
+    for lst in args.listing or []:
+        try:
+            items.extend([u, "", "", 0] for u in discover_listing(lst, args.pattern))
+        except Exception as e:
+            print(f"[LISTE] {lst} okunamadı: {e}")
+    items.extend([u, "", "", 0] for u in args.url or [])
+    out = []
+    for it in items:
+        if it[0] not in seen:
+            seen.add(it[0])
+            out.append(it)
+    return out
+
+def advance_state(state, items, handled, failed):
+    """
+    Sitemap filigranı sadece işlenen URL'lerin en yeni lastmod'una ilerler; işlenmeyenler
+    (--max taşması, gönderi sınırı, hata) pending'de sonraki tura kalır. Hata veren URL
+    MAX_TRIES turdan sonra bırakılır.
+    """
+    marks = state["sitemap_lastmod"]
+    pending = []
+    for it in items:
+        url, sm, lm, tries = it
+        if url in handled:
+            if sm and lm and lm > marks.get(sm, ""):
+                marks[sm] = lm
+            continue
+        if url in failed:
+            tries += 1
+            if tries >= MAX_TRIES:
+                print(f"[HATA] {url}: {tries} denemede işlenemedi, bırakıldı.")
+                continue
+        pending.append([url, sm, lm, tries])
+    if len(pending) > PENDING_CAP:
+        print(f"[TUR] {len(pending) - PENDING_CAP} bekleyen URL sınır nedeniyle bırakıldı.")
+    state["pending"] = pending[:PENDING_CAP]
+
+def process_batch(urls, args, state, client=None, out=None):
+    """
+    Sayfaları sınırlı havuzla eşzamanlı işle; hazır olan tweet'i hemen akıt (ve gönder).
+    Tur başına en fazla args.max_posts gönderi; sınırdan sonrakiler işlenmemiş sayılır.
+    -> (hazırlanan, gönderilen, {işlenen url}, {hata veren url})
+    """
+    done = posted = 0
+    handled, failed = set(), set()
+    history = posted_index.load()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futs = {pool.submit(make_tweet_from_bundle, u): u for u in urls}
+        for fut in as_completed(futs):
+            url = futs[fut]
+            try:
+                tweet = fut.result()
+            except Exception as e:
+                failed.add(url)
+                print(f"[HATA] {url}: {e}")
+                continue
+            done += 1
+            if out:
+                out.write(json.dumps({"url": url, "tweet": tweet}, ensure_ascii=False) + "\n")
+                out.flush()
+            print(f"\n--- {url}\n{tweet}")
+            dup = history.find(tweet)
+            if dup is not None:
+                print(f"→ Daha önce paylaşılmış ({dup}), atlandı.")
+            elif client is not None and posted >= args.max_posts:
+                print(f"→ Tur gönderi sınırı ({args.max_posts}), sonraki tura kaldı.")
+                continue
+            elif client is not None:
+                try:
+                    client.create_tweet(text=tweet)
+                    history.add(tweet, "bundle")
+                    posted += 1
+                except Exception as e:
+                    failed.add(url)
+                    print(f"→ Gönderim hatası: {e}")
+                    continue
+            state["seen"].append(url)
+            handled.add(url)
+    return done, posted, handled, failed
+
 # ---- CLI ----
-def main():
+def main(argv=None, client=None):
     ap = argparse.ArgumentParser()
-    ap.add_argument("--url", required=True, help="Bundle haber URL")
+    ap.add_argument("--url", action="append", help="Bundle haber URL (birden fazla verilebilir)")
+    ap.add_argument("--sitemap", action="append", help="Takip edilecek sitemap URL (lastmod filigranı)")
+    ap.add_argument("--listing", action="append", help="Takip edilecek liste sayfası URL")
+    ap.add_argument("--pattern", default="", help="Liste sayfasında haber linki regex'i")
+    ap.add_argument("--workers", type=int, default=WORKERS, help="Eşzamanlı indirme sayısı")
+    ap.add_argument("--max", type=int, default=500, help="Tur başına en fazla URL (kalanı sonraki tura)")
+    ap.add_argument("--max-posts", type=int, default=5, help="Tur başına en fazla gönderi")
+    ap.add_argument("--out", help="Tweet'leri JSONL olarak bu dosyaya akıt")
+    ap.add_argument("--watch", type=int, default=0, help="Sürekli takip: turlar arası bekleme (sn)")
     ap.add_argument("--dry", action="store_true", help="Sadece yazdır, tweet atma")
-    args = ap.parse_args()
+    ap.add_argument("--parser", choices=["bs4", "lxml"], help="HTML ayrıştırıcı (varsayılan: BUNDLE_PARSER/PARSER_BACKEND)")
+    args = ap.parse_args(argv)
+
+    global PARSER
+    if args.parser:
+        PARSER = args.parser
+
+    if not (args.url or args.sitemap or args.listing):
+        ap.error("--url, --sitemap ya da --listing gerekli")
 
-    tweet = make_tweet_from_bundle(args.url)
+    dry = DRY or args.dry
 
-    if DRY or args.dry:
-        print("— DRY RUN —")
-        print(tweet)
+    # Tek URL: eski davranış (state'e dokunmadan)
+    if args.url and len(args.url) == 1 and not (args.sitemap or args.listing or args.watch):
+        tweet = make_tweet_from_bundle(args.url[0])
+        dup = posted_index.load().find(tweet)
+        if dup is not None:
+            print(tweet)
+            print(f"→ Daha önce paylaşılmış ({dup}), gönderilmedi.")
+            return
+        if dry:
+            print("— DRY RUN —")
+            print(tweet)
+            return
+        client = client or tw_client_v2()
+        client.create_tweet(text=tweet)
+        posted_index.load().add(tweet, "bundle")
+        print("✅ Tweet gönderildi.")
         return
 
-    client = tw_client_v2()
-    client.create_tweet(text=tweet)
-    print("✅ Tweet gönderildi.")
+    client = None if dry else (client or tw_client_v2())
+    out = open(args.out, "a", encoding="utf-8") if args.out else None
+    try:
+        while True:
+            state = load_state()
+            items = discover_new(args, state)
+            batch = items[: args.max]
+            print(f"[TUR] {len(batch)} yeni URL" + (f" ({len(items) - len(batch)} sonraki tura)" if len(items) > len(batch) else ""))
+            handled = failed = set()
+            try:
+                if batch:
+                    t0 = time.time()
+                    done, posted, handled, failed = process_batch([it[0] for it in batch], args, state, client, out)
+                    print(f"[TUR] hazırlanan: {done} | gönderilen: {posted} | hata: {len(failed)} | {time.time() - t0:.1f} sn")
+            finally:
+                advance_state(state, items, handled, failed)
+                save_state(state)
+            if not args.watch:
+                break
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        print("\nİptal edildi.")
+        sys.exit(0)
+    finally:
+        if out:
+            out.close()
 
 if __name__ == "__main__":
     main()
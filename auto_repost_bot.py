@@ -1,130 +1,175 @@
-import os
-import tweepy
-import requests
-from bs4 import BeautifulSoup
+import argparse
 from unidecode import unidecode
 from rapidfuzz import fuzz
 
-# ENV
-API_KEY = os.getenv("TW_API_KEY")
-API_SECRET = os.getenv("TW_API_SECRET")
-ACCESS_TOKEN = os.getenv("TW_ACCESS_TOKEN")
-ACCESS_SECRET = os.getenv("TW_ACCESS_SECRET")
-BEARER_TOKEN = os.getenv("BEARER_TOKEN")
+from feed_stream import read_feed
+from page_parser import get_backend
+from source_registry import Registry
+import langid
+import posted_index
+import http_pool
+import x_client
+import og_image
+import tweet_text
 
 # --- CLIENTS ---
+# Anahtarlar TW_API_KEY / TW_ACCESS_SECRET... ya da API_KEY / ACCESS_TOKEN_SECRET... (x_client)
 def get_client_v2():
-    return tweepy.Client(
-        consumer_key=API_KEY,
-        consumer_secret=API_SECRET,
-        access_token=ACCESS_TOKEN,
-        access_token_secret=ACCESS_SECRET,
-        wait_on_rate_limit=True
-    )
-
-def get_ro_client_v2():
-    # read-only (app-only)
-    return tweepy.Client(
-        bearer_token=BEARER_TOKEN,
-        wait_on_rate_limit=True
-    )
+    # okumalar bearer (app-only), gönderim kullanıcı bağlamıyla
+    return x_client.client(wait_on_rate_limit=True)
 
 # --- UTILS ---
 def clean_text(text):
     text = unidecode(text)
-    text = text.replace("\n", " ").strip()
-    if len(text) > 270:
-        text = text[:267] + "..."
-    return text
+    return text.replace("\n", " ").strip()
+
+def keep_turkish(posts, what):
+    """
+    posts: [(ham metin, X lang ipucu, gönderi)] -> açıkça başka dilde olmayan gönderiler (tek
+    toplu dil tanıma; kısa/kararsız metin tutulur).
+    """
+    flags = langid.load().foreign([p[0] for p in posts], [p[1] for p in posts])
+    kept = [p[2] for p, (other, _) in zip(posts, flags) if not other]
+    if len(kept) < len(posts):
+        print(f"Dil filtresi: {len(posts) - len(kept)} {what} Türkçe değil, atlandı.")
+    return kept
 
 def valid_image(url):
     # filtre: logo veya site adı içeren görselleri atla
     bad_kw = ["logo", "banner", "haber", "7com", "cnn", "ntv", "tv", "watermark"]
     return not any(k in url.lower() for k in bad_kw)
 
-def fetch_latest_tweet_from_users(limit_each=3):
-    cl_ro = get_ro_client_v2()
-    users = []
-    with open("sources.txt") as f:
-        users = [x.strip().replace("@", "") for x in f if x.strip()]
+def fetch_latest_tweet_from_users(registry, limit_each=3, client=None):
+    # okuma kotası katmanlara bölünür; sığmayan hesaplar sonraki çalıştırmaya kalır
+    sources, deferred = registry.plan_reads(registry.due("x"))
+    if deferred:
+        print(f"Okuma kotası ({registry.read_quota}): ertelenen hesaplar:", ", ".join(s.ident for s in deferred))
+    if not sources:
+        return []
+    by_name = {s.ident.lower(): s for s in sources}
+    cl_ro = client or get_client_v2()
 
     tweets = []
-    ids_resp = cl_ro.get_users(usernames=users)
+    ids_resp = cl_ro.get_users(usernames=[s.ident for s in sources])
     if not ids_resp.data:
         print("Kullanıcılar bulunamadı.")
         return []
 
     for u in ids_resp.data:
+        src = by_name.get(u.username.lower())
+        if src is None:
+            continue
+        registry.mark(src)
         tws = cl_ro.get_users_tweets(
             id=u.id,
             max_results=limit_each,
             expansions="attachments.media_keys",
-            media_fields="url"
+            media_fields="url",
+            tweet_fields="lang"
         )
         if not tws.data:
             continue
 
         for t in tws.data:
-            txt = clean_text(t.text)
+            txt = tweet_text.fit(clean_text(t.text))
             media_url = None
             if hasattr(tws, "includes") and "media" in tws.includes:
                 for m in tws.includes["media"]:
                     if m.type == "photo" and valid_image(m.url):
                         media_url = m.url
                         break
-            tweets.append({"text": txt, "media": media_url})
-    return tweets
+            # dil, unidecode öncesi ham metinden (Türkçe harfler ayırt edici)
+            tweets.append((t.text, getattr(t, "lang", None),
+                           {"text": txt, "media": media_url, "priority": src.priority}))
+    return keep_turkish(tweets, "tweet")
 
-def fetch_rss_items(limit=5):
-    urls = []
-    with open("rss_sources.txt") as f:
-        urls = [x.strip() for x in f if x.strip()]
+def fetch_rss_items(registry, limit=5):
     items = []
-    for url in urls:
+    for src in registry.due("rss"):
+        url = src.ident
+        registry.mark(src)
         try:
-            r = requests.get(url, timeout=10)
-            soup = BeautifulSoup(r.content, "xml")
-            for item in soup.find_all("item")[:limit]:
-                title = clean_text(item.title.text)
-                desc = clean_text(item.description.text if item.description else "")
-                link = item.link.text if item.link else ""
+            # ilk `limit` kayıttan sonra akış kesilir, beslemenin kalanı okunmaz
+            entries, _ = read_feed(url, limit=limit, timeout=10, session=http_pool.session())
+            for e in entries:
+                title = clean_text(e.title)
+                desc = clean_text(e.summary)
+                link = e.link
                 if fuzz.ratio(title, desc) < 70:
-                    text = f"{title} — {desc[:150]}"
+                    text = tweet_text.fit(f"{title} — {tweet_text.fit(desc, 150)}")
                 else:
-                    text = title
-                items.append({"text": text, "link": link})
+                    text = tweet_text.fit(title)
+                items.append((f"{e.title} {e.summary}", None,
+                              {"text": text, "link": link, "priority": src.priority}))
         except Exception as e:
             print("RSS error:", e)
-    return items
+    return keep_turkish(items, "haber")
+
+def post_media(media_url=None, link=None):
+    """
+    Tweet'in kendi fotoğrafı; yoksa (ATTACH_OG_IMAGE) haber sayfasının paylaşım görseli
+    (sayfanın sadece başı indirilir). -> media_ids ya da None. Yükleme v1.1 API ile.
+    """
+    data, name = None, "media.jpg"
+    if media_url:
+        try:
+            r = http_pool.get(media_url, timeout=10)
+            r.raise_for_status()
+            data = r.content
+        except Exception as e:
+            print("Görsel alınamadı:", e)
+    elif link and og_image.ATTACH_OG_IMAGE:
+        img = og_image.from_page_head(link, get_backend())
+        if img is not None:
+            print("Görsel:", img)
+            data, name = og_image.fetch(img), img.filename
+    media_id = x_client.upload_media(data=data, filename=name) if data else None
+    return [media_id] if media_id else None
 
-def post_tweet(client, text, media_url=None):
+def post_tweet(client, text, media_url=None, link=None):
     try:
-        if media_url:
-            img = requests.get(media_url, timeout=10)
-            with open("temp.jpg", "wb") as f:
-                f.write(img.content)
-            media = client.media_upload(filename="temp.jpg")
-            client.create_tweet(text=text, media_ids=[media.media_id])
-        else:
-            client.create_tweet(text=text)
+        # zamanlayıcı erteleyecekse (ya da dry) görsel hiç yüklenmez
+        media_ids = post_media(media_url, link) if x_client.can_post(client) else None
+        client.create_tweet(text=text, media_ids=media_ids)
         print("✅ Tweet gönderildi:", text[:60])
+        return True
     except Exception as e:
         print("Tweet hatası:", e)
+        return False
 
-def main():
-    cl = get_client_v2()
-    print("🔍 Twitter hesaplarından veri çekiliyor...")
-    tweets = fetch_latest_tweet_from_users(limit_each=2)
-    print("📰 RSS kaynakları taranıyor...")
-    news = fetch_rss_items(limit=3)
+def main(argv=None, client=None):
+    argparse.ArgumentParser(description="X hesapları + RSS'ten tekrar paylaşım").parse_args(argv)
+    cl = client or get_client_v2()
+    registry = Registry.load(scope="repost")
+    try:
+        print("🔍 Twitter hesaplarından veri çekiliyor...")
+        tweets = fetch_latest_tweet_from_users(registry, limit_each=2, client=cl)
+        print("📰 RSS kaynakları taranıyor...")
+        news = fetch_rss_items(registry, limit=3)
+    finally:
+        registry.save()
+    print(registry.report())
 
-    all_posts = tweets + news
+    # katman önceliği yüksek olan önce (eşitlikte okuma sırası korunur)
+    all_posts = sorted(tweets + news, key=lambda p: p["priority"], reverse=True)
     if not all_posts:
         print("Hiç içerik bulunamadı.")
         return
 
-    for post in all_posts[:5]:
-        post_tweet(cl, post["text"], post.get("media"))
+    # daha önce (bu ya da başka bot) atılmış olanlar atlanır, yerine sıradaki gelir
+    posted = posted_index.load()
+    tried = 0
+    for post in all_posts:
+        if tried >= 5:
+            break
+        dup = posted.find(post["text"])
+        if dup is not None:
+            print(f"Tekrar, atlandı ({dup}):", post["text"][:60])
+            continue
+        if post_tweet(cl, post["text"], post.get("media"), post.get("link")):
+            posted.add(post["text"], "repost")
+        tried += 1
+    print("Gönderi geçmişi:", posted.report())
 
 if __name__ == "__main__":
     main()
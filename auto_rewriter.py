@@ -6,90 +6,67 @@ auto_rewriter.py - Free plan uyumlu, no-wait versiyon
 - Tek hesap / az istekle güvenli çalışır.
 """
 
-import os, json, re, sys, time
+import re, sys, time
 import argparse
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
 import tweepy
 
+from source_registry import Registry
+import paraphrase
+import langid
+import posted_index
+import state_store
+import x_client
+import tweet_text
+
 STATE_PATH = "state.json"
-SOURCES_PATH = "sources.txt"
-MAX_TWEET_LEN = 280
 
 def load_env():
-    load_dotenv()
-    need = ["API_KEY","API_SECRET","ACCESS_TOKEN","ACCESS_TOKEN_SECRET","BEARER_TOKEN"]
-    vals = {k: os.getenv(k) for k in need}
-    missing = [k for k,v in vals.items() if not v]
+    vals = x_client.credentials()
+    missing = x_client.missing(vals)
     if missing:
         raise RuntimeError(f".env eksik: {', '.join(missing)}")
     return vals
 
-def get_client(vals):
-    return tweepy.Client(
-        consumer_key=vals["API_KEY"],
-        consumer_secret=vals["API_SECRET"],
-        access_token=vals["ACCESS_TOKEN"],
-        access_token_secret=vals["ACCESS_TOKEN_SECRET"],
-        bearer_token=vals["BEARER_TOKEN"],
-        wait_on_rate_limit=False
-    )
-
-def load_sources() -> List[str]:
-    if not os.path.exists(SOURCES_PATH):
-        raise RuntimeError(f"{SOURCES_PATH} yok.")
-    with open(SOURCES_PATH, "r", encoding="utf-8") as f:
-        lines = [re.sub(r"^@","",x.strip()) for x in f if x.strip()]
-    if not lines:
-        raise RuntimeError(f"{SOURCES_PATH} boş.")
-    return lines
+def get_client(vals=None):
+    return x_client.client()
+
+def load_registry() -> Registry:
+    registry = Registry.load(scope="rewriter")
+    if not registry.of("x"):
+        raise RuntimeError("X kaynağı yok (assets/sources.yaml / sources.txt).")
+    return registry
 
 def load_state() -> Dict[str, str]:
-    if not os.path.exists(STATE_PATH):
-        return {}
-    try:
-        with open(STATE_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
+    return state_store.load(STATE_PATH)
 
 def save_state(state: Dict[str,str]) -> None:
-    with open(STATE_PATH, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+    state_store.save(STATE_PATH, state)
 
 def is_turkish_text(text: str, lang_hint: Optional[str]) -> bool:
-    if lang_hint and lang_hint.lower() == "tr":
-        return True
-    if re.search(r"[çğıöşüİ]", text): return True
-    common = [" ve ", " ile ", "bugün", "yarın", "TRT", "maçı", "Türkiye", "son dakika", "güncelleme"]
-    return any(w in text.lower() for w in common)
+    return langid.is_turkish(text, lang_hint)
+
+def turkish_items(items: List[Dict]) -> List[Dict]:
+    """Türkçe tweet'ler (tek toplu dil tanıma; X'in lang=tr ipucu doğrudan kabul)."""
+    flags = langid.load().turkish([it["text"] for it in items], [it.get("lang") for it in items])
+    return [it for it, (ok, _) in zip(items, flags) if ok]
+
+# RT öneki, bağlantılar ve hashtag'ler tek geçişte; boşluklar ikinci geçişte
+CLEAN_RE = re.compile(r"^RT\s+@|https?://\S+|\s+#\S+")
+
+def _clean_swap(m) -> str:
+    return "@" if m.group().startswith("RT") else ""
 
 def clean_text(text: str) -> str:
-    text = re.sub(r"^RT\s+@", "@", text)
-    text = re.sub(r"https?://\S+", "", text)
-    text = re.sub(r"\s+#\S+", "", text)
-    text = re.sub(r"\s{2,}", " ", text).strip()
-    return text
+    return paraphrase.MULTI_SPACE.sub(" ", CLEAN_RE.sub(_clean_swap, text)).strip()
 
 def simple_paraphrase(text: str) -> str:
-    t = text
-    swaps = [
-        (r"\bson dakika\b", "gelişme"),
-        (r"\bbugün\b", "bugün itibarıyla"),
-        (r"\bduyurdu\b", "bildirdi"),
-        (r"\bmaçı\b", "karşılaşması"),
-        (r"\byayınlanacak\b", "ekrana gelecek"),
-        (r"\byayınlanıyor\b", "ekrana geliyor"),
-        (r"\bcanlı\b", "canlı olarak"),
-    ]
-    for pat, rep in swaps:
-        t = re.sub(pat, rep, t, flags=re.IGNORECASE)
-    if len(t) < 40 and not t.endswith(("!","?",".")):
-        t += "."
-    return re.sub(r"\s{2,}", " ", t).strip()
-
-def clamp_280(text: str) -> str:
-    return text if len(text) <= MAX_TWEET_LEN else text[: MAX_TWEET_LEN - 1] + "…"
+    """Kurallar assets/paraphrase.tsv'den, tek geçiş; harf biçimi korunur."""
+    return paraphrase.load().rewrite(text)
+
+def paraphrase_batch(texts: List[str]) -> List[str]:
+    """clean_text + simple_paraphrase, liste halinde (tek regex taraması)."""
+    return paraphrase.load().rewrite_many([clean_text(t) for t in texts])
 
 def fetch_new_from_user(client, username: str, since_id: Optional[str], max_results: int):
     u = client.get_user(username=username)
@@ -125,12 +102,14 @@ def fetch_new_from_user(client, username: str, since_id: Optional[str], max_resu
     return out
 
 def build_output(original: str, username: str, credit: bool) -> str:
-    base = clean_text(original)
-    para = simple_paraphrase(base)
-    out = f"{para} — Kaynak: @{username}" if credit else para
-    return clamp_280(out)
+    return build_outputs([original], username, credit)[0]
 
-def main():
+def build_outputs(originals: List[str], username: str, credit: bool) -> List[str]:
+    outs = paraphrase_batch(originals)
+    tail = f" — Kaynak: @{username}" if credit else ""
+    return [tweet_text.compose(para, tail) for para in outs]
+
+def main(argv=None, client=None):
     ap = argparse.ArgumentParser(description="Auto rewriter bot (Free plan safe mode)")
     ap.add_argument("--post", action="store_true", help="Gerçekten gönder")
     ap.add_argument("--limit", type=int, default=1, help="Kaynak başına kaç tweet işlensin")
@@ -138,76 +117,86 @@ def main():
     ap.add_argument("--only", type=str, help="Sadece bu kullanıcı(lar) (virgülle ayır)")
     ap.add_argument("--cooldown", type=int, default=900, help="Kaynaklar arası bekleme (sn)")
     ap.add_argument("--max-results", type=int, default=1, help="API çağrısında getirilecek tweet sayısı")
-    args = ap.parse_args()
+    ap.add_argument("--read-quota", type=int, help="Çalıştırma başına okunacak hesap sayısı (varsayılan: sources.yaml read_quota)")
+    args = ap.parse_args(argv)
 
-    vals = load_env()
-    client = get_client(vals)
+    if client is None:
+        client = get_client(load_env())
     me = client.get_me()
     me_user = me.data.username if me and me.data else "me"
     print(f"Giriş (v2): @{me_user}")
 
-    sources = load_sources()
+    registry = load_registry()
     if args.only:
-        wanted = [re.sub(r"^@","",s.strip()) for s in args.only.split(",") if s.strip()]
-        sources = [s for s in sources if s in wanted]
+        wanted = {re.sub(r"^@","",s.strip()).lower() for s in args.only.split(",") if s.strip()}
+        sources = [s for s in registry.of("x") if s.ident.lower() in wanted]
         if not sources:
-            print("Seçtiğin --only listesi sources.txt ile eşleşmiyor.")
+            print("Seçtiğin --only listesi kaynak listesiyle eşleşmiyor.")
             sys.exit(0)
+    else:
+        # katman sırası + okuma kotası; sığmayan hesaplar sonraki çalıştırmaya kalır
+        sources, deferred = registry.plan_reads(registry.due("x"), args.read_quota)
+        if deferred:
+            print("Ertelenen hesaplar:", ", ".join(s.ident for s in deferred))
 
     state = load_state()
     total_posted = 0
+    posted = posted_index.load()
 
-    for idx, username in enumerate(sources, 1):
-        since_id = state.get(username)
-        try:
-            items = fetch_new_from_user(client, username, since_id, args.max_results)
-        except tweepy.TooManyRequests:
-            print(f"[{username}] Rate limit. Çıkılıyor (no-wait).")
-            sys.exit(0)
-
-        if not items:
-            print(f"[{username}] yeni tweet yok.")
-            continue
-
-        processed = 0
-        for item in items:
-            if processed >= args.limit:
-                continue
-            if not is_turkish_text(item["text"], item.get("lang")):
+    try:
+        for idx, src in enumerate(sources, 1):
+            username = src.ident
+            since_id = state.get(username)
+            registry.mark(src)
+            try:
+                items = fetch_new_from_user(client, username, since_id, args.max_results)
+            except tweepy.TooManyRequests:
+                print(f"[{username}] Rate limit. Çıkılıyor (no-wait).")
+                sys.exit(0)
+
+            if not items:
+                print(f"[{username}] yeni tweet yok.")
                 continue
 
-            out = build_output(item["text"], username, args.credit)
-
-            print("\n--- KAYNAK ---------------------------------")
-            print(f"@{username} | {item['created_at']} | id={item['id']}")
-            print(item["text"])
-            print("--- ÖNERİLEN --------------------------------")
-            print(out)
-            print("---------------------------------------------")
-
-            if args.post:
-                try:
-                    r = client.create_tweet(text=out)
-                    tid = r.data.get("id") if r and r.data else "unknown"
-                    print(f"→ Gönderildi (v2). ID: {tid}")
-                    total_posted += 1
-                except tweepy.TooManyRequests:
-                    print("→ Gönderimde rate limit. Çıkılıyor (no-wait).")
-                    sys.exit(0)
-                except tweepy.TweepyException as te:
-                    print(f"→ Gönderim hatası: {te}")
-                except Exception as e:
-                    print(f"→ Hata: {e}")
-            else:
-                print("→ Dry-run (gönderilmedi).")
-
-            processed += 1
-            time.sleep(1.0)
-
-        state[username] = items[-1]["id"]
-        save_state(state)
+            picked = turkish_items(items)[:args.limit]
+            outs = build_outputs([it["text"] for it in picked], username, args.credit)
+            for item, out in zip(picked, outs):
+                print("\n--- KAYNAK ---------------------------------")
+                print(f"@{username} | {item['created_at']} | id={item['id']}")
+                print(item["text"])
+                print("--- ÖNERİLEN --------------------------------")
+                print(out)
+                print("---------------------------------------------")
+
+                dup = posted.find(out)
+                if dup is not None:
+                    print(f"→ Daha önce paylaşılmış ({dup}), atlandı.")
+                elif args.post:
+                    try:
+                        r = client.create_tweet(text=out)
+                        tid = r.data.get("id") if r and r.data else "unknown"
+                        print(f"→ Gönderildi (v2). ID: {tid}")
+                        posted.add(out, "rewriter")
+                        total_posted += 1
+                    except tweepy.TooManyRequests:
+                        print("→ Gönderimde rate limit. Çıkılıyor (no-wait).")
+                        sys.exit(0)
+                    except tweepy.TweepyException as te:
+                        print(f"→ Gönderim hatası: {te}")
+                    except Exception as e:
+                        print(f"→ Hata: {e}")
+                else:
+                    print("→ Dry-run (gönderilmedi).")
+
+                time.sleep(1.0)
+
+            state[username] = items[-1]["id"]
+            save_state(state)
+    finally:
+        registry.save()
 
     print(f"\nBitti. Toplam gönderilen: {total_posted}")
+    print(f"Gönderi geçmişi: {posted.report()}")
 
 if __name__ == "__main__":
     try:
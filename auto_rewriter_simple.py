@@ -13,6 +13,8 @@ Free plana uygun sade versiyon (format koru + cevapta kaynak).
 import os, re, sys, time, json, tweepy, argparse
 from dotenv import load_dotenv
 
+import posted_index
+
 load_dotenv()
 for key in ["API_KEY", "API_SECRET", "ACCESS_TOKEN", "ACCESS_TOKEN_SECRET", "BEARER_TOKEN"]:
     if not os.getenv(key):
@@ -80,6 +82,7 @@ def main():
             print("Seçtiğin --only sources.txt ile eşleşmiyor.")
             sys.exit(0)
 
+    posted = posted_index.load()
     for username in sources:
         tweets = fetch(username, limit=args.limit)
         for tw in tweets:
@@ -92,6 +95,11 @@ def main():
             print("1) Ana tweet: (kaynak metin aynen)")
             print("2) Cevap: '— Kaynak: @%s'" % username)
 
+            dup = posted.find(original)
+            if dup is not None:
+                print(f"→ Daha önce paylaşılmış ({dup}), atlandı.")
+                continue
+
             if not args.post:
                 print("→ Dry-run (gönderilmedi).")
                 continue
@@ -101,6 +109,7 @@ def main():
                 r1 = client.create_tweet(text=original)
                 main_id = r1.data.get("id") if r1 and r1.data else None
                 print(f"→ Ana tweet gönderildi. ID: {main_id}")
+                posted.add(original, "simple")
             except tweepy.TooManyRequests:
                 print("→ Rate limit (ana tweet). Çıkılıyor.")
                 sys.exit(0)
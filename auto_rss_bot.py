@@ -2,12 +2,32 @@
 # -*- coding: utf-8 -*-
 
 import os, sys, re, time, json, argparse
-import requests, feedparser, tweepy
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
+from urllib.parse import urljoin
+import requests, tweepy
+
+from page_parser import get_backend
+from feed_stream import read_feed, detect_order
+from host_health import HostBook, CircuitOpen, host_of
+from deadline import Deadline, DeadlineExceeded
+from source_registry import Registry
+from pipeline import Pipeline
+from mem_budget import MemoryBudget, MEM_PROFILE, MEM_CEILING_MB
+import gazetteer
+import langid
+import posted_index
+import gnews
+import http_pool
+import state_store
+import x_client
+import og_image
+import tweet_text
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; ValctkNewsBot/2.0)"}
 STATE_PATH = "rss_state.json"
+SEEN_KEEP = 500       # besleme başına tutulan son uid'ler (state'te)
+PENDING_KEEP = 50     # besleme başına saklanan ertelenmiş aday uid'leri (state'te)
+PARSER = os.getenv("RSS_PARSER")  # bs4 | lxml (boşsa PARSER_BACKEND)
+HOSTS = HostBook()  # run_bot'ta host_health.json'dan yüklenir
 
 RSS_SOURCES_FALLBACK = [
     "http://sondakika.haber7.com/sondakika.rss",
@@ -22,44 +42,55 @@ RSS_SOURCES_FALLBACK = [
 # ——— Yardımcılar ————————————————————————————————————————
 
 def load_env_or_die():
-    load_dotenv()
-    need = ["API_KEY","API_SECRET","ACCESS_TOKEN","ACCESS_TOKEN_SECRET","BEARER_TOKEN"]
-    miss = [k for k in need if not os.getenv(k)]
+    miss = x_client.missing()
     if miss:
         raise SystemExit("Eksik .env: " + ", ".join(miss))
 
 def tw_client():
-    return tweepy.Client(
-        consumer_key=os.getenv("API_KEY"),
-        consumer_secret=os.getenv("API_SECRET"),
-        access_token=os.getenv("ACCESS_TOKEN"),
-        access_token_secret=os.getenv("ACCESS_TOKEN_SECRET"),
-        bearer_token=os.getenv("BEARER_TOKEN"),
-        wait_on_rate_limit=False
-    )
-
-def load_sources(path="rss_sources.txt"):
-    if os.path.exists(path):
-        out = []
-        for line in open(path,"r",encoding="utf-8"):
-            s = line.strip()
-            if s and not s.startswith("#"):
-                out.append(s)
-        if out: return out
-    return RSS_SOURCES_FALLBACK
+    return x_client.client()
+
+def load_registry():
+    """assets/sources.yaml (yoksa rss_sources.txt); hiç besleme yoksa yedek liste ilk katmana."""
+    registry = Registry.load(scope="rss")
+    if not registry.of("rss"):
+        registry.extend("rss", RSS_SOURCES_FALLBACK)
+    return registry
 
 def load_state():
-    if not os.path.exists(STATE_PATH): return {}
-    try:
-        return json.load(open(STATE_PATH,"r",encoding="utf-8"))
-    except Exception:
-        return {}
+    return state_store.load(STATE_PATH)
 
 def save_state(st):
-    json.dump(st, open(STATE_PATH,"w",encoding="utf-8"), ensure_ascii=False, indent=2)
+    state_store.save(STATE_PATH, st)
 
-def fetch(url, timeout=12):
-    return requests.get(url, headers=HEADERS, timeout=timeout)
+def fetch(url, timeout=None, deadline=None, max_bytes=None):
+    """
+    Host sağlık kaydı üzerinden GET: devre açıksa CircuitOpen, zaman aşımı host'un p95'inden.
+    deadline verilirse zaman aşımı kalan bütçeye kısılır ve gövde parça parça okunur;
+    bütçe okuma sırasında biterse bağlantı kapatılıp DeadlineExceeded atılır.
+    max_bytes verilirse gövdenin ilk max_bytes baytı alınır, gerisi indirilmez.
+    """
+    with HOSTS.guard(url) as host_timeout:
+        timeout = timeout or host_timeout
+        if deadline is None and not max_bytes:
+            r = http_pool.get(url, headers=HEADERS, timeout=timeout)
+            r.raise_for_status()
+            return r
+        if deadline is not None:
+            timeout = deadline.clip(timeout)
+        r = http_pool.get(url, headers=HEADERS, timeout=timeout, stream=True)
+        with r:
+            r.raise_for_status()
+            chunks, size = [], 0
+            for chunk in r.iter_content(64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceeded(f"{host_of(url)}: okuma bütçe sonunda kesildi")
+                if max_bytes and size >= max_bytes:
+                    break
+            body = b"".join(chunks)
+            r._content = body[:max_bytes] if max_bytes else body  # r.text/r.content normal çalışsın
+    return r
 
 def clean_boiler(s: str) -> str:
     if not s: return ""
@@ -68,37 +99,82 @@ def clean_boiler(s: str) -> str:
     s = re.sub(r"\s+", " ", s).strip()
     return s
 
-def fetch_article(link: str) -> str:
-    try:
-        r = fetch(link)
-        r.raise_for_status()
-    except Exception:
-        return ""
-    soup = BeautifulSoup(r.text, "lxml")
-    for tag in soup(["script","style","noscript","header","footer","nav","aside"]):
-        tag.decompose()
+ARTICLE_SELECTORS = [
+    "article", "div.article", "div#content", "div.content",
+    "div.haber_metni", "div#NewsDetail", "div.news-detail",
+    "div.detail", "div#haberMetni", "section.article"
+]
+
+def extract_article(html_text: str, parser=None) -> str:
+    return parse_article(html_text, parser)[0]
+
+def parse_article(html_text: str, parser=None):
+    """-> (makale metni, paylaşım görseli adayları). Görsel meta'ları aynı ağaçtan okunur."""
+    P = parser or get_backend(PARSER)
+    doc = P.parse_html(html_text)
+    images = og_image.candidates(doc, P)
+    P.drop(doc, ["script","style","noscript","header","footer","nav","aside"])
     # haber metni adayları
-    selectors = [
-        "article", "div.article", "div#content", "div.content",
-        "div.haber_metni", "div#NewsDetail", "div.news-detail",
-        "div.detail", "div#haberMetni", "section.article"
-    ]
     blocks = []
-    for sel in selectors:
-        for c in soup.select(sel):
+    for sel in ARTICLE_SELECTORS:
+        for c in P.select(doc, sel):
             txts = []
-            for li in c.select("li"):
-                t = li.get_text(" ", strip=True)
+            for li in P.select(c, "li"):
+                t = P.text(li)
                 if len(t) > 3: txts.append(t)
-            for p in c.find_all("p"):
-                t = p.get_text(" ", strip=True)
+            for p in P.find_all(c, "p"):
+                t = P.text(p)
                 if len(t) > 3: txts.append(t)
             if txts:
                 blocks.append("\n".join(txts))
     if not blocks:
-        return clean_boiler(soup.get_text(" ", strip=True))
+        return clean_boiler(P.text(doc)), images
     body = "\n".join(blocks)
-    return clean_boiler(body)
+    return clean_boiler(body), images
+
+def fetch_page(link: str, deadline=None, max_bytes=None):
+    """-> (ham bayt, başlıktaki kodlama) ya da alınamazsa (None, None). Ayrıştırma yapılmaz."""
+    try:
+        r = fetch(link, deadline=deadline, max_bytes=max_bytes)
+    except (CircuitOpen, DeadlineExceeded) as ex:
+        print(f"→ Makale atlandı: {ex}")
+        return None, None
+    except Exception as ex:
+        print(f"→ Makale alınamadı ({host_of(link)}): {ex}")
+        return None, None
+    return r.content, r.encoding
+
+def page_text(raw: bytes, encoding=None) -> str:
+    """Ham baytları requests'in r.text'i gibi çözer (kodlama yoksa içerikten tahmin)."""
+    r = requests.Response()
+    r._content = raw
+    r.encoding = encoding
+    return r.text
+
+def fetch_article(link: str, parser=None, deadline=None) -> str:
+    raw, encoding = fetch_page(link, deadline)
+    if raw is None:
+        return ""
+    return extract_article(page_text(raw, encoding), parser)
+
+def feed_text(entry, parser=None) -> str:
+    """
+    Besleme kaydının kendi gövdesi: content:encoded / description'dan uzun olanı, düz metin.
+    HTML ise paragraflar satır satır alınır.
+    """
+    raw = max((entry.content or "", entry.summary or ""), key=len).strip()
+    if not raw:
+        return ""
+    if "<" not in raw:
+        return clean_boiler(raw)
+    P = parser or get_backend(PARSER)
+    try:
+        doc = P.parse_html(raw)
+    except Exception:
+        return clean_boiler(re.sub(r"<[^>]+>", " ", raw))
+    P.drop(doc, ["script","style","noscript","figure","figcaption"])
+    paras = [t for t in (P.text(p) for p in P.find_all(doc, "p")) if len(t) > 3]
+    return clean_boiler("\n".join(paras) if paras else P.text(doc))
 
 def sentence_split(text: str):
     if not text: return []
@@ -113,20 +189,6 @@ def sentence_split(text: str):
             out.append(p)
     return out
 
-def clamp_text(s: str, maxlen=280):
-    s = s.strip()
-    if len(s) <= maxlen:
-        return s
-    cut = s[:maxlen]
-    # Son noktalama/kısa çizgi vs. den geriye yasla
-    m = re.search(r"[\.!\?…—-]\s*(?!.*[\.!\?…—-])", cut)
-    if m:
-        return cut[:m.end()].rstrip()
-    # kelime ortasında kesme
-    if " " in cut:
-        return cut.rsplit(" ",1)[0] + "…"
-    return cut + "…"
-
 def tidy_title(t: str) -> str:
     t = (t or "").strip()
     t = re.sub(r"\s+", " ", t)
@@ -141,26 +203,36 @@ NAME_RE = re.compile(
     r"\b([A-ZÇĞİÖŞÜ][a-zçğıöşü\.]+(?:\s+[A-ZÇĞİÖŞÜ][a-zçğıöşü\.]+){1,2})\b"
 )
 
+NAME_MIN = 5  # "Ab Cd": NAME_RE'nin en kısa eşleşmesi
+
 STOP_SINGLE = set([
     "Bu","Şu","Bir","Ve","FED","Air","Force","One","Hazine","Bakanı","Başkanı","ABD",
     "Türkiye","İstanbul","Ankara","Resmen","Son","Dakika","Cumhurbaşkanı","Bakan"
 ])
 
-def extract_candidate_names(text: str, want_min=3):
-    if not text: return []
-    # liste block’larını yakala
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+# splitlines()'ın satır sonu saydığı ama [;\n] bölmesinin saymadığı karakterler
+EXOTIC_BREAKS = re.compile(r"[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+def regex_name_picks(text: str):
+    """
+    Satır satır NAME_RE adayları (ham, sıralı). [;\n] parçalarıyla yapılan ikinci tarama
+    sadece bu adayların tekrarını üretir; yalnızca metinde EXOTIC_BREAKS varsa
+    (isim bu karakterlerin üstünden eşleşebilir) çalıştırılır.
+    """
     picks = []
-    for ln in lines:
+    for ln in text.splitlines():
+        ln = ln.strip()
+        if not ln:
+            continue
         # madde imi varsa ağırlık ver
         if ln.startswith(("-", "•", "—", "*")):
             ln = ln.lstrip("-•—* ").strip()
         for m in NAME_RE.findall(ln):
             # en az 2 kelime
-            if len(m.split()) < 2:
+            parts = m.split()
+            if len(parts) < 2:
                 continue
             # tekil stopword’leri ayıkla
-            parts = m.split()
             if any(w in STOP_SINGLE for w in parts):
                 # örn: "Hazine Bakanı Scott Bessent" — sadece tam adı bırak
                 # sonda 2-3 kelimelik tam ad varsa onu al
@@ -169,12 +241,37 @@ def extract_candidate_names(text: str, want_min=3):
                     picks.append(tail)
                 continue
             picks.append(m)
-    # virgüllü paragraflardan da toparla
-    for chunk in re.split(r"[;\n]", text):
-        for m in NAME_RE.findall(chunk):
-            if len(m.split()) >= 2 and not any(w in STOP_SINGLE for w in m.split()):
-                picks.append(m)
-
+    if EXOTIC_BREAKS.search(text):
+        for chunk in re.split(r"[;\n]", text):
+            for m in NAME_RE.findall(chunk):
+                if len(m.split()) >= 2 and not any(w in STOP_SINGLE for w in m.split()):
+                    picks.append(m)
+    return picks
+
+def find_name_picks(text: str):
+    """
+    Önce sözlük (gazetteer trie): bilinen kişiler kanonik adıyla alınır; kurum/yer/unvan
+    eşleşmeleri isim sayılmaz. Regex sadece eşleşmeyen aralıklarda çalışır.
+    Sözlük yoksa tamamen regex.
+    """
+    gz = gazetteer.load()
+    if gz is None:
+        return regex_name_picks(text)
+    picks = []
+    pos = 0
+    for start, end, kind, canon in gazetteer.scan(text, gz) + [(len(text), len(text), None, None)]:
+        # aralıkta NAME_RE'nin hiç eşleşmesi yoksa satır/parça taraması da bir şey bulamaz;
+        # kısa ("Başkanı Jerome" arası) ve büyük harfsiz aralıklara regex hiç çalışmaz
+        if start - pos >= NAME_MIN:
+            gap = text[pos:start]
+            if not gap.islower() and NAME_RE.search(gap):
+                picks.extend(regex_name_picks(gap))
+        if kind == "PER":
+            picks.append(canon)
+        pos = end
+    return picks
+
+def rank_names(picks, want_min=3):
     # normalize & uniq (orijinal sırayı koru)
     seen = set()
     uniq = []
@@ -200,26 +297,86 @@ def extract_candidate_names(text: str, want_min=3):
         cleaned = uniq[:want_min]
     return cleaned[:10]
 
-def summarize_with_names(title: str, body: str):
+def extract_candidate_names(text: str, want_min=3):
+    if not text: return []
+    return rank_names(find_name_picks(text), want_min)
+
+TRIGGERS = [
+    "5 aday", "beş aday", "aday belli oldu", "işte adaylar", "kadro açıklandı",
+    "hakemleri açıklandı", "liste açıklandı"
+]
+
+class NewsItem:
+    """
+    Tek bir besleme kaydı + türetilmiş alanlar. Pahalı dönüşümler (küçük harf,
+    cümleler, isim adayları, tetik kontrolü) ilk erişimde bir kez hesaplanıp saklanır;
+    filtre ve özet aşamaları hep buradan okur.
+    """
+    __slots__ = ("uid", "title", "link", "summary", "body", "published", "_cache")
+
+    def __init__(self, title, summary="", body="", link="", uid=None, published=None):
+        self.uid = uid
+        self.title = title or ""
+        self.link = link or ""
+        self.summary = summary or ""
+        self.body = body or ""
+        self.published = published
+        self._cache = {}
+
+    def set_body(self, body):
+        self.body = body or ""
+        for k in [k for k in self._cache if k not in ("tidy", "hay_filter")]:
+            del self._cache[k]
+
+    def _memo(self, key, fn):
+        c = self._cache
+        if key not in c:
+            c[key] = fn()
+        return c[key]
+
+    @property
+    def tidy(self):
+        return self._memo("tidy", lambda: tidy_title(self.title))
+
+    @property
+    def hay_filter(self):
+        """başlık + feed özeti, küçük harf (pass_filter)"""
+        return self._memo("hay_filter", lambda: (self.title + " " + self.summary).lower())
+
+    @property
+    def hay_full(self):
+        """başlık + makale gövdesi, küçük harf (tetik kontrolü)"""
+        return self._memo("hay_full", lambda: (self.title + " " + self.body).lower())
+
+    @property
+    def sentences(self):
+        return self._memo("sentences", lambda: sentence_split(self.body))
+
+    @property
+    def trigger(self):
+        return self._memo("trigger", lambda: any(k in self.hay_full for k in TRIGGERS))
+
+    def names(self, want_min=3):
+        if not self.body:
+            return []
+        picks = self._memo("name_picks", lambda: find_name_picks(self.body))
+        return self._memo(("names", want_min), lambda: rank_names(picks, want_min))
+
+def summarize_item(item: NewsItem):
     """
     ‘5 aday belli oldu / işte isimler’ vb. ise: başlık + isim listesi (tam adlar).
     Değilse: normal kısa özet.
     """
-    t = tidy_title(title)
-    hay = (title + " " + body).lower()
-    trigger = any(k in hay for k in [
-        "5 aday", "beş aday", "aday belli oldu", "işte adaylar", "kadro açıklandı",
-        "hakemleri açıklandı", "liste açıklandı"
-    ])
-
-    if trigger:
-        names = extract_candidate_names(body, want_min=3)
+    t = item.tidy
+
+    if item.trigger:
+        names = item.names(want_min=3)
         if names:
             lines = [t] + [f"- {n}" for n in names[:8]]
-            return clamp_text("\n".join(lines), 280)
+            return tweet_text.fit("\n".join(lines))
 
     # normal kısa özet: başlık + ilk anlamlı cümle
-    sents = sentence_split(body)
+    sents = item.sentences
     lead = ""
     for s in sents:
         if len(s) >= 40:  # çok ufak değilse
@@ -230,7 +387,26 @@ def summarize_with_names(title: str, body: str):
     text = t if not lead else f"{t} {lead}"
     # tırnakları koru, fazla boşlukları düzelt
     text = re.sub(r"\s+", " ", text)
-    return clamp_text(text, 280)
+    return tweet_text.fit(text)
+
+def summarize_with_names(title: str, body: str):
+    return summarize_item(NewsItem(title, body=body))
+
+def summarize_page(job):
+    """
+    Süreç havuzunda çalışır: (başlık, özet, besleme gövdesi, ham sayfa, kodlama, ayrıştırıcı)
+    -> (tweet, sayfa kullanıldı mı, görsel adayları). Sayfa yoksa/boş çıkarsa besleme
+    gövdesiyle özetlenir; görsel adayları sadece indirilmiş sayfadan (ek istek yok).
+    """
+    title, summary, feed_body, raw, encoding, parser = job
+    item = NewsItem(title, summary, body=feed_body)
+    used, images = False, []
+    if raw is not None:
+        body, images = parse_article(page_text(raw, encoding), get_backend(parser))
+        if body:
+            item.set_body(body)
+            used = True
+    return summarize_item(item), used, images
 
 # ——— Filtre (gündem/ekonomi/siyaset/spor/teknoloji/sosyal) ———————————
 
@@ -250,102 +426,369 @@ KEYWORDS = [
     "gazze","israil","iran","rusya","abd","nato","ateşkes","savaş"
 ]
 
-def pass_filter(title, summary):
-    hay = (title + " " + (summary or "")).lower()
-    return any(k in hay for k in KEYWORDS)
+# ——— Besleme gövdesi yeterli mi? ——————————————————————————————
 
-# ——— Akış ———————————————————————————————————————————————
+FEED_MIN_SENTENCES = int(os.getenv("FEED_MIN_SENTENCES", "2"))
+TRUNCATED = re.compile(r"(\.\.\.|…|\[…\]|\[\.\.\.\]|devamı için.*|haberin devamı.*)\s*$", re.I)
+COUNT_WORDS = {"iki": 2, "üç": 3, "dört": 4, "beş": 5, "altı": 6, "yedi": 7, "sekiz": 8, "dokuz": 9, "on": 10}
+LIST_COUNT_RE = re.compile(r"\b(\d{1,2}|" + "|".join(COUNT_WORDS) + r")\s+(aday|isim|hakem|oyuncu|futbolcu|bakan)", re.I)
 
-def run_bot(dry: bool, max_posts: int, per_feed: int):
-    client = tw_client()
-    sources = load_sources()
-    state = load_state()
-
-    prepared = sent = skipped = 0
+def expected_names(item: NewsItem, default=3):
+    """Tetik metninde sayı varsa ("5 aday", "beş hakem") o kadar isim beklenir."""
+    m = LIST_COUNT_RE.search(item.hay_full)
+    if not m:
+        return default
+    n = m.group(1).lower()
+    return min(8, int(n) if n.isdigit() else COUNT_WORDS[n])
 
-    for url in sources:
-        if sent >= max_posts: break
-        print(f"\n[FEED] {url}")
-        st = state.get(url, {"seen": []})
-        seen = set(st.get("seen", []))
-
-        feed = feedparser.parse(url)
-        entries = feed.entries if getattr(feed, "entries", None) else []
-
-        def ent_key(e):
-            dt = getattr(e, "published_parsed", None) or getattr(e, "updated_parsed", None)
-            return time.mktime(dt) if dt else 0
-
-        entries = sorted(entries, key=ent_key)
-        fresh = []
-        for e in entries:
-            uid = e.get("id") or e.get("link")
-            if uid and uid not in seen:
-                fresh.append(e)
+def feed_sufficient(item: NewsItem) -> bool:
+    """
+    item.body besleme metniyken summarize_item'ın sayfaya ihtiyacı var mı?
+    - isim listesi tetikli haber: beklenen sayıda isim bulunmalı
+    - normal haber: en az FEED_MIN_SENTENCES cümle ve özet cümlesi (ilk >=40 karakterlik) kesik olmamalı
+    """
+    if not item.body:
+        return False
+    if item.trigger:
+        return len(item.names(want_min=3)) >= expected_names(item)
+    sents = item.sentences
+    if len(sents) < FEED_MIN_SENTENCES:
+        return False
+    lead = next((x for x in sents if len(x) >= 40), "")
+    return bool(lead) and not TRUNCATED.search(lead)
+
+def item_passes(item: NewsItem):
+    hay = item.hay_filter
+    return any(k in hay for k in KEYWORDS)
 
-        if not fresh:
-            continue
+def pass_filter(title, summary):
+    return item_passes(NewsItem(title, summary))
+
+def link_key(link):
+    """Tekrar kontrolü için bağlantı: şema, www., sorgu/parça ve sondaki / atılır."""
+    path = re.split(r"[?#]", link.split("://", 1)[-1], 1)[0].partition("/")[2].rstrip("/")
+    return f"{host_of(link).removeprefix('www.')}/{path}"
+
+def unique_links(cands):
+    """Aynı makale birden çok beslemede (Google News + yayıncının kendi beslemesi) -> ilk gelen kalır."""
+    seen, out = set(), []
+    for c in cands:
+        key = link_key(c[2].link)
+        if key not in seen:
+            seen.add(key)
+            out.append(c)
+    return out
 
-        take = min(len(fresh), per_feed, max_posts - sent)
-        for e in fresh[-take:]:
-            uid = e.get("id") or e.get("link")
-            title = tidy_title((getattr(e,"title","") or "").strip())
-            link  = (getattr(e,"link","") or "").strip()
-            summary = (getattr(e,"summary","") or getattr(e,"subtitle","") or "").strip()
+def keep_turkish(cands):
+    """
+    Açıkça başka dilde olan adaylar (Google News vb. karışık beslemeler) atılır; başlık + özet,
+    tek toplu geçiş. Kısa/kararsız metinler tutulur (langid.foreign).
+    """
+    flags = langid.load().foreign(f"{c[2].title} {c[2].summary}" for c in cands)
+    return [c for c, (other, _) in zip(cands, flags) if not other]
 
-            if not title or not link:
-                skipped += 1
-                continue
+# ——— Akış ———————————————————————————————————————————————
 
-            if not pass_filter(title, summary):
-                skipped += 1
-                continue
+POST_COST = 1.0       # planlamada tweet gönderimi için sn
+PIPE_SLACK = 2        # gönderimde max_posts'tan fazla önden hazırlanan aday (gönderim hatası payı)
+FRESH_HALF_LIFE = 6 * 3600
 
-            body = fetch_article(link)
-            tweet = summarize_with_names(title, body)
+def item_value(item: NewsItem, now=None):
+    """Beklenen değer: isim listesi tetikli haberler 2x; yaş arttıkça azalır (6 saatte yarıya)."""
+    now = now or time.time()
+    v = 2.0 if any(k in item.hay_filter for k in TRIGGERS) else 1.0
+    if item.published:
+        v /= 1.0 + max(0.0, now - item.published) / FRESH_HALF_LIFE
+    return v
 
-            print("\n--- TWEET ---")
-            print(tweet)
+def rank_candidates(cands, weights=None):
+    """
+    cands: [(feed_url, FeedEntry, NewsItem, sayfa gerekli mi)] -> (değer/sn, ...) azalan sırada.
+    Süre = (gerekliyse) host'un tipik makale süresi (p50) + gönderim; devresi açık host değer/sn = 0.
+    weights: feed_url -> kaynak katmanının öncelik çarpanı.
+    """
+    now = time.time()
+    weights = weights or {}
+    ranked = []
+    for url, e, item, need_page in cands:
+        cost = (HOSTS.expected_seconds(host_of(item.link)) if need_page else 0.0) + POST_COST
+        ranked.append((item_value(item, now) * weights.get(url, 1.0) / cost, url, e, item, need_page))
+    ranked.sort(key=lambda r: r[0], reverse=True)
+    return ranked
+
+def remember(st, uid):
+    seen = st.setdefault("seen", [])
+    if uid not in seen[-SEEN_KEEP:]:
+        seen.append(uid)
+    if len(seen) > 2 * SEEN_KEEP:
+        del seen[:-SEEN_KEEP]
+
+def defer(state, read, ranked, handled):
+    """
+    Okunan beslemelerde sıralamaya girip işlenmeyen (limit/bütçe/rate limit) adayların uid'leri
+    st["pending"]'e yazılır; sonraki okuma bunlar bulunana kadar erken durmaz. Filigran en yeni
+    işlenen kayda ilerlediği için aksi halde bu adaylar bir daha okunmazdı.
+    """
+    pending = {}
+    for _, url, e, _, _ in ranked:
+        if e.uid not in handled:
+            pending.setdefault(url, []).append(e.uid)
+    for url in read:
+        st = state[url]
+        if pending.get(url):
+            st["pending"] = pending[url][:PENDING_KEEP]
+        else:
+            st.pop("pending", None)
+
+def run_bot(dry: bool, max_posts: int, per_feed: int, deadline=None, mem=None, client=None):
+    """
+    1) Sırası gelen beslemeler katman sırasıyla okunur (alt katmanlar bütçe kaldıysa),
+       filtreden geçen adaylar toplanır.
+    2) Adaylar beklenen değer/sn'ye (katman önceliğiyle çarpılmış) göre sıralanır.
+    3) Aşamalı hat: sayfalar I/O havuzunda indirilir, ayrıştırma + özet süreç havuzunda
+       yapılır, tweet'ler sıralı tek tüketicide gönderilir. deadline (sn) verilirse her aşama
+       bütçeyi kontrol eder, ağ istekleri kalan süreye kısılır; durum her koşulda sonda yazılır.
+    mem (MemoryBudget) tavanı aşılmaya yaklaşınca partiler küçülür, sayfalar kısa kesilir,
+    tavana dayanınca yeni besleme/sayfa alınmaz.
+    client verilmezse ortak X istemcisi (runner.py zamanlayıcılı istemci verir).
+    """
+    global HOSTS
+    client = client or tw_client()
+    registry = load_registry()
+    sources = registry.due("rss")
+    weights = {src.ident: src.priority for src in sources}
+    state = load_state()
+    HOSTS = HostBook.load()
+    gn = gnews.Resolver.load(hosts=HOSTS, session=http_pool.session())
+    budget = Deadline(deadline)
+    mem = mem or MemoryBudget()
 
-            prepared += 1
+    prepared = sent = skipped = 0
+    posted = posted_index.load()
+    feed_stats = {}
+    stage_report = ""
+    read, ranked, handled = [], None, set()
 
-            if dry:
-                print("→ DRY-MODE (tweet edilmedi).")
-            else:
+    try:
+        cands = []
+        with mem.stage("besleme"):
+            for src in sources:
+                if not registry.budget_allows(src, budget):
+                    print(f"\n→ Bütçe doldu, alt katman beslemeleri okunmadı ({budget}).")
+                    break
+                if mem.pressure() >= 2:
+                    print("\n→ Bellek tavanına yakın, kalan beslemeler okunmadı.")
+                    break
+                url = src.ident
+                print(f"\n[FEED] {url}  ({src.tier.name})")
+                registry.mark(src)
+                st = state.setdefault(url, {"seen": []})
+                seen = set(st.get("seen", []))
+                pending = set(st.get("pending", []))
+
+                # Akış halinde oku: yeni→eski sıralı beslemede ilk bilinen kayıtta durulur
+                order = st.get("order")
+                cap = mem.scale(min(per_feed, max_posts))
                 try:
-                    client.create_tweet(text=tweet)
-                    sent += 1
-                    st.setdefault("seen", []).append(uid)
-                    if len(st["seen"]) > 1000:
-                        st["seen"] = st["seen"][-500:]
-                except tweepy.TooManyRequests:
-                    print("→ Rate limit (POST). Çıkılıyor.")
-                    save_state(state); sys.exit(0)
-                except tweepy.Forbidden as ex:
-                    print(f"→ Hata 403: {ex}")
+                    with mem.track("besleme", url), HOSTS.guard(url) as timeout:
+                        entries, took = read_feed(
+                            url, seen=seen, watermark=st.get("watermark"), order=order,
+                            limit=cap if order == "desc" else None, headers=HEADERS,
+                            timeout=budget.clip(timeout), session=http_pool.session(),
+                            pending=pending,
+                        )
+                except (CircuitOpen, DeadlineExceeded) as ex:
+                    print(f"→ Atlandı: {ex}")
+                    continue
                 except Exception as ex:
-                    print(f"→ Hata: {ex}")
-
-            # dry’de bile “görüldü”ye alalım ki aynı başlığı döndürüp durmasın
-            st.setdefault("seen", []).append(uid)
-
-            if sent >= max_posts:
-                break
-
-        state[url] = st
-        save_state(state)
-
-    print(f"\nHazırlanan: {prepared} | Gönderilen: {sent} | Atlanan: {skipped}")
-
-def main():
+                    print(f"→ Besleme okunamadı: {ex}")
+                    continue
+                read.append(url)
+                print(f"→ {len(entries)} yeni kayıt ({took*1000:.0f} ms)")
+                if order is None:
+                    st["order"] = detect_order(entries)
+
+                fresh = sorted(entries, key=lambda e: e.published or 0)
+                take = min(len(fresh), cap)
+                # en yeni cap kayıt + sınırın gerisinde kalan ertelenmiş adaylar
+                fresh = [e for e in fresh[:len(fresh) - take] if e.uid in pending] + fresh[len(fresh) - take:]
+                passed = []
+                for e in fresh:
+                    item = NewsItem(tidy_title(e.title), e.summary.strip(), link=e.link.strip(),
+                                    uid=e.uid, published=e.published)
+                    if not item.title or not item.link or not item_passes(item):
+                        skipped += 1
+                        continue
+                    passed.append((e, item))
+                # Google News sarmalayıcı bağlantıları yayıncı adresine (sadece filtreden geçenler)
+                links = gn.resolve_many([item.link for _, item in passed], deadline=budget)
+                for (e, item), link in zip(passed, links):
+                    item.link = link
+                    item.set_body(feed_text(e))
+                    cands.append((url, e, item, not feed_sufficient(item)))
+
+        with mem.stage("plan"):
+            uniq = unique_links(cands)
+            if len(uniq) < len(cands):
+                print(f"\n[BAĞLANTI] {len(cands) - len(uniq)} aday başka beslemede de var, atlandı.")
+            skipped += len(cands) - len(uniq)
+            cands = uniq
+            kept = keep_turkish(cands)
+            if len(kept) < len(cands):
+                print(f"\n[DİL] {len(cands) - len(kept)} aday Türkçe değil, atlandı.")
+            skipped += len(cands) - len(kept)
+            ranked = rank_candidates(kept, weights)
+            del cands, kept, uniq
+        print(f"\n[PLAN] {len(ranked)} aday | {budget}")
+
+        def download(job):
+            # I/O iş parçacığında; sürece sadece baytlar gider
+            rate, url, e, item, need_page = job
+            raw = encoding = None
+            if need_page:
+                cap = mem.page_cap()
+                if cap:
+                    raw, encoding = fetch_page(item.link, deadline=budget, max_bytes=cap)
+                    mem.note("host", host_of(item.link), nbytes=len(raw or b""))
+                else:
+                    print("→ Bellek tavanına yakın, sayfa çekilmedi.")
+            return item.title, item.summary, item.body, raw, encoding, PARSER
+
+        def observe(stage, job, out, peak):
+            if stage == "işleme":
+                mem.note("host", host_of(job[3].link), peak=peak)
+
+        # gönderimde max_posts'a yetecek kadar önden çalışılır; dry'de tüm adaylar hazırlanır
+        pipe = Pipeline(download, summarize_page, observe=observe if mem.enabled else None)
+        base_depth = pipe.depth
+        depth = lambda: mem.scale(base_depth if dry else max_posts - sent + PIPE_SLACK)
+        with mem.stage("hat"), pipe:
+            for job, res, err in pipe.run(ranked, deadline=budget, depth=depth):
+                rate, url, e, item, need_page = job
+                if sent >= max_posts:
+                    break
+                if isinstance(err, DeadlineExceeded) or budget.expired():
+                    print(f"\n→ Bütçe doldu, {len(ranked) - prepared} aday ertelendi ({budget}).")
+                    break
+                if err is not None:
+                    print(f"\n→ Özet hatası ({item.link}): {err}")
+                    handled.add(e.uid)
+                    continue
+                t0 = time.monotonic()
+                tweet, used_page, images = res
+                st = state[url]
+                uid = e.uid
+
+                fs = feed_stats.setdefault(url, {"avoided": 0, "fetched": 0, "saved": 0.0})
+                if need_page:
+                    fs["fetched"] += 1
+                    if not used_page:
+                        print("→ Sayfa alınamadı, besleme metniyle özetlendi.")
+                else:
+                    fs["avoided"] += 1
+                    fs["saved"] += HOSTS.expected_seconds(host_of(item.link))
+                    print("→ Besleme metni yeterli, sayfa çekilmedi.")
+
+                print(f"\n--- TWEET --- (değer/sn {rate:.2f})")
+                print(tweet)
+
+                prepared += 1
+                dup = posted.find(tweet)
+
+                img = None
+                # zamanlayıcı erteleyecekse görsel aranmaz/yüklenmez (dry'de sadece gösterilir)
+                if dup is None and og_image.ATTACH_OG_IMAGE and images and (dry or x_client.can_post(client)):
+                    img = og_image.pick([urljoin(item.link, u) for u in images], hosts=HOSTS, deadline=budget)
+                    print(f"→ Görsel: {img}" if img else "→ Uygun görsel yok.")
+
+                if dup is not None:
+                    print(f"→ Daha önce paylaşılmış ({dup}), atlandı.")
+                    skipped += 1
+                elif dry:
+                    print("→ DRY-MODE (tweet edilmedi).")
+                else:
+                    try:
+                        media_ids = None
+                        if img is not None:
+                            data = og_image.fetch(img, hosts=HOSTS, deadline=budget)
+                            media_id = x_client.upload_media(data=data, filename=img.filename) if data else None
+                            media_ids = [media_id] if media_id else None
+                        client.create_tweet(text=tweet, media_ids=media_ids)
+                        posted.add(tweet, "rss")
+                        sent += 1
+                    except tweepy.TooManyRequests:
+                        print("→ Rate limit (POST). Çıkılıyor.")
+                        break
+                    except x_client.PostDeferred as ex:
+                        # gönderilmedi: görüldü sayılmaz, defer() adayı pending'de tutar; zamanlayıcı
+                        # bu turda artık izin vermeyeceği için kalanlar da sonraki tura kalır
+                        print(f"→ {ex}. Tur bitti, kalan adaylar ertelendi.")
+                        break
+                    except tweepy.Forbidden as ex:
+                        print(f"→ Hata 403: {ex}")
+                    except Exception as ex:
+                        print(f"→ Hata: {ex}")
+
+                # dry’de bile “görüldü”ye alalım ki aynı başlığı döndürüp durmasın
+                remember(st, uid)
+                handled.add(uid)
+                if e.published and e.published > (st.get("watermark") or 0):
+                    st["watermark"] = e.published
+                save_state(state)
+                pipe.stats["gönderim"].add(t0, time.monotonic())
+        stage_report = pipe.report()
+    finally:
+        # bütçenin reserve kısmı bunun için ayrıldı
+        with mem.stage("kayıt"):
+            if ranked is not None:  # sıralamaya gelinmediyse eski pending korunur
+                defer(state, read, ranked, handled)
+            save_state(state)
+            HOSTS.save()
+            gn.save()
+            registry.save()
+
+    print(f"\nHazırlanan: {prepared} | Gönderilen: {sent} | Atlanan: {skipped} | Süre: {budget}")
+    print(f"Gönderi geçmişi: {posted.report()}")
+    if feed_stats:
+        print("\n[SAYFA ÇEKİMİ]  (kazanç: host p50 tahmini)")
+        for url, fs in feed_stats.items():
+            print(f"{url[:60]:60} çekildi {fs['fetched']:>2} | atlandı {fs['avoided']:>2} | ~{fs['saved']:.1f} sn kazanç")
+    if stage_report:
+        print("\n[AŞAMALAR]  (öğe/sn: aşamanın ilk başlangıcından son bitişine)")
+        print(stage_report)
+    if mem.enabled:
+        print("\n[BELLEK]")
+        print(mem.report())
+    if gn.report():
+        print("\n[GOOGLE NEWS]")
+        print(gn.report())
+    print("\n[KAYNAKLAR]")
+    print(registry.report("rss"))
+    print("\n[HOSTLAR]")
+    print(HOSTS.report())
+
+def main(argv=None, client=None):
     ap = argparse.ArgumentParser()
     ap.add_argument("--max-posts", type=int, default=2)
     ap.add_argument("--per-feed", type=int, default=2)
     ap.add_argument("--dry", action="store_true")
-    args = ap.parse_args()
-
-    load_env_or_die()
-    run_bot(args.dry, args.max_posts, args.per_feed)
+    ap.add_argument("--parser", choices=["bs4","lxml"], help="HTML ayrıştırıcı (varsayılan: RSS_PARSER/PARSER_BACKEND)")
+    ap.add_argument("--mem-profile", action="store_true",
+                    help="tracemalloc ile aşama/besleme/host bellek raporu (env: MEM_PROFILE=1)")
+    ap.add_argument("--mem-ceiling", type=float, default=None,
+                    help="RSS tavanı, MB; yaklaşınca iş azaltılır (env: MEM_CEILING_MB)")
+    ap.add_argument("--deadline", type=float, default=float(os.getenv("RUN_DEADLINE", "0")) or None,
+                    help="Toplam süre bütçesi, sn (örn. 15 dk'lık job için 780; env: RUN_DEADLINE)")
+    args = ap.parse_args(argv)
+
+    global PARSER
+    if args.parser:
+        PARSER = args.parser
+
+    if client is None:
+        load_env_or_die()
+    mem = MemoryBudget(profile=args.mem_profile or MEM_PROFILE, ceiling_mb=args.mem_ceiling or MEM_CEILING_MB)
+    run_bot(args.dry, args.max_posts, args.per_feed, args.deadline, mem, client)
 
 if __name__ == "__main__":
     main()
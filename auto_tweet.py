@@ -11,14 +11,24 @@ Kullanım:
     python auto_tweet.py --mode next --file tweets.txt --post
 - Doğrudan metin gönder:
     python auto_tweet.py --mode text --text "Merhaba" --post
+- Gönderilmiş satırları kuyruk dosyasından at (kimlik gerekmez):
+    python auto_tweet.py --mode compact --file tweets.txt
+
+tweets.txt satırları tweet_queue ile okunur: gönderilen satır silinmez, imleç ilerler
+(tweets.txt.cursor). "[2026-10-20 09:00] metin" satırı o saatten sonra, sıradakinden önce gider.
 """
 
 import os
+import time
 import argparse
 import sys
 from dotenv import load_dotenv
 import tweepy
 
+from tweet_queue import TweetQueue
+import posted_index
+import tweet_text
+
 def load_env():
     load_dotenv()
     API_KEY = os.getenv("API_KEY")
@@ -58,21 +68,16 @@ def verify_v2(client):
     except Exception as e:
         return False, str(e)
 
-def read_next_tweet(path):
-    if not os.path.exists(path):
+def read_next_tweet(queue):
+    if not os.path.exists(queue.path):
         return None, "tweets dosyası yok."
-    with open(path, "r", encoding="utf-8") as f:
-        lines = [line.rstrip("\n") for line in f if line.strip() != ""]
-    if not lines:
+    entry = queue.peek()
+    if entry is None:
+        due = queue.next_due()
+        if due:
+            return None, "şu an atılacak satır yok; sıradaki zamanlı satır: " + time.strftime("%Y-%m-%d %H:%M", time.localtime(due))
         return None, "tweets dosyasında atılacak satır yok."
-    return lines[0], lines[1:]
-
-def save_remaining_and_archive(path, remaining_lines, sent_line):
-    with open(path, "w", encoding="utf-8") as f:
-        for l in remaining_lines:
-            f.write(l + "\n")
-    with open("tweets_sent.txt", "a", encoding="utf-8") as af:
-        af.write(sent_line + "\n")
+    return entry, None
 
 def create_tweet(client, text):
     try:
@@ -88,12 +93,17 @@ def create_tweet(client, text):
 
 def main():
     parser = argparse.ArgumentParser(description="Auto Tweet Bot (v2)")
-    parser.add_argument("--mode", choices=["test","next","text"], required=True)
+    parser.add_argument("--mode", choices=["test","next","text","compact"], required=True)
     parser.add_argument("--file", default="tweets.txt")
     parser.add_argument("--text")
     parser.add_argument("--post", action="store_true", help="Gerçekten tweet at")
     args = parser.parse_args()
 
+    if args.mode == "compact":
+        old, new = TweetQueue(args.file).compact()
+        print(f"Sıkıştırıldı: {args.file} {old} -> {new} bayt")
+        sys.exit(0)
+
     try:
         api_key, api_secret, access_token, access_secret, bearer = load_env()
     except Exception as e:
@@ -113,21 +123,30 @@ def main():
         sys.exit(0)
 
     if args.mode == "next":
-        tweet, rest_or_msg = read_next_tweet(args.file)
-        if tweet is None:
-            print("Bilgi:", rest_or_msg)
+        queue = TweetQueue(args.file)
+        entry, msg = read_next_tweet(queue)
+        if entry is None:
+            print("Bilgi:", msg)
             sys.exit(0)
-        print("GÖSTERİM: Sıradaki tweet:")
+        tweet = entry.text
+        print("GÖSTERİM: Sıradaki tweet:" + (" (zamanlı)" if entry.due else ""))
         print("----------")
         print(tweet)
         print("----------")
+        dup = posted_index.load().find(tweet)
+        if dup is not None:
+            print(f"Daha önce paylaşılmış ({dup}); kuyruktan düşülüyor, gönderilmedi.")
+            if args.post:
+                queue.skip(entry)
+            sys.exit(0)
         if not args.post:
             print("Dry-run (gönderilmeyecek). Gerçek göndermek için '--post' ekle.")
             sys.exit(0)
         success, res = create_tweet(client, tweet)
         if success:
             print("Tweet gönderildi (v2). ID:", res)
-            save_remaining_and_archive(args.file, rest_or_msg, tweet)
+            posted_index.load().add(tweet, "tweet")
+            queue.commit(entry)
         else:
             print("Gönderme hatası (v2):", res)
         sys.exit(0)
@@ -137,19 +156,25 @@ def main():
             print("Hata: '--text' ile gönderilecek metni belirt.")
             sys.exit(1)
         tweet = args.text.strip()
-        if len(tweet) > 280:
-            print(f"Hata: Tweet {len(tweet)} karakter, 280'den fazla. Kısalt.")
+        size = tweet_text.weighted_length(tweet)
+        if size > tweet_text.MAX_LEN:
+            print(f"Hata: Tweet X sayımıyla {size} karakter, {tweet_text.MAX_LEN}'den fazla. Kısalt.")
             sys.exit(1)
         print("GÖSTERİM: Gönderilecek metin:")
         print("----------")
         print(tweet)
         print("----------")
+        dup = posted_index.load().find(tweet)
+        if dup is not None:
+            print(f"Hata: bu metin daha önce paylaşılmış ({dup}).")
+            sys.exit(1)
         if not args.post:
             print("Dry-run (gönderilmeyecek). Gerçek göndermek için '--post' ekle.")
             sys.exit(0)
         success, res = create_tweet(client, tweet)
         if success:
             print("Tweet gönderildi (v2). ID:", res)
+            posted_index.load().add(tweet, "tweet")
         else:
             print("Gönderme hatası (v2):", res)
         sys.exit(0)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_bundle_extract.py - extract_ai_summary (BeautifulSoup) ile
+extract_ai_summary_fast (lxml/XPath) karşılaştırması: aynı çıktı + süre.
+
+Kullanım:
+    python bench_bundle_extract.py sayfalar/*.html
+    python bench_bundle_extract.py --save https://... --dir sayfalar   # sayfa kaydet
+    python bench_bundle_extract.py --synthetic 50                      # kayıtlı sayfa yoksa
+"""
+
+import os
+import sys
+import glob
+import time
+import random
+import argparse
+
+from bs4 import BeautifulSoup
+
+import auto_news_bundle_bot as bot
+
+def synthetic_page(rnd, i):
+    nav = "".join(f"<li><a href='/k/{k}'>Kategori {k}</a></li>" for k in range(60))
+    filler = "".join(
+        f"<div class='card'><h4>Haber {k}</h4><p>{'lorem ipsum dolor sit amet ' * rnd.randint(3, 12)}</p></div>"
+        for k in range(rnd.randint(80, 200))
+    )
+    bullets = "".join(f"<li>Özet maddesi {i}-{k}: {'gelişme ' * rnd.randint(2, 6)}</li>" for k in range(rnd.randint(2, 6)))
+    kind = i % 5
+    if kind == 0:
+        summary = f"<section><h3>Bundle AI özetliyor</h3><ul>{bullets}</ul></section>"
+    elif kind == 1:
+        summary = f"<div><span>Kaynak</span> Bundle AI ile özet<p>Birinci • İkinci madde • Üçüncü</p></div>"
+    elif kind == 2:
+        summary = f"<div class='news-summary'><ul>{bullets}</ul></div>"
+    elif kind == 3:
+        # çapa yalnız yorumda: iki yol da yorumu tarar
+        summary = f"<div><!-- Bundle AI özet --><p>Birinci • İkinci madde</p><ul>{bullets}</ul></div>"
+    else:
+        summary = "<p>Bu sayfada yok.</p><script>var a = 'özet';</script>"
+    return (
+        "<html><head><title>Sayfa</title><script>var a = 1;</script></head><body>"
+        f"<nav><ul>{nav}</ul></nav><h1>Başlık {i}</h1>{summary}<!-- özet yorum -->{filler}"
+        "</body></html>"
+    )
+
+def load_pages(args):
+    pages = []
+    for pat in args.paths:
+        for path in sorted(glob.glob(pat)) or [pat]:
+            if os.path.isdir(path):
+                path_list = sorted(glob.glob(os.path.join(path, "*.html")))
+            else:
+                path_list = [path]
+            for p in path_list:
+                with open(p, "r", encoding="utf-8", errors="replace") as f:
+                    pages.append((p, f.read()))
+    if not pages:
+        rnd = random.Random(7)
+        pages = [(f"synthetic-{i}", synthetic_page(rnd, i)) for i in range(args.synthetic)]
+    return pages
+
+def save_pages(urls, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    for i, url in enumerate(urls):
+        path = os.path.join(out_dir, f"page_{i:03d}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(bot.get_page(url))
+        print(f"kaydedildi: {path}")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("paths", nargs="*", help="Kayıtlı HTML dosyaları/klasörleri")
+    ap.add_argument("--save", action="append", help="Bu URL'yi indirip --dir'e kaydet")
+    ap.add_argument("--dir", default="bundle_pages")
+    ap.add_argument("--synthetic", type=int, default=40)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    if args.save:
+        save_pages(args.save, args.dir)
+        return
+
+    pages = load_pages(args)
+    slow = fast = 0.0
+    mismatches = 0
+    for _ in range(args.repeat):
+        for name, page in pages:
+            t0 = time.perf_counter()
+            old = bot.extract_ai_summary(BeautifulSoup(page, "lxml"))
+            t1 = time.perf_counter()
+            new = bot.extract_ai_summary_fast(bot.parse_tree(page))
+            t2 = time.perf_counter()
+            slow += t1 - t0
+            fast += t2 - t1
+            if old != new:
+                mismatches += 1
+                print(f"FARKLI: {name}\n  bs4 : {old}\n  lxml: {new}")
+
+    n = len(pages) * args.repeat
+    print(f"sayfa: {len(pages)} x {args.repeat}")
+    print(f"bs4 (parse + çıkarım) : {slow / n * 1000:.2f} ms/sayfa")
+    print(f"lxml (parse + çıkarım): {fast / n * 1000:.2f} ms/sayfa")
+    print(f"hızlanma              : {slow / fast:.1f}x")
+    print(f"farklı çıktı          : {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_fx_card.py - fx_card render süresi ölçümü.
+
+Kullanım:
+    python bench_fx_card.py --n 200
+"""
+
+import io
+import time
+import random
+import argparse
+
+import fx_card
+
+def sample_data(rnd):
+    return {
+        "Dolar": 41.97 * (1 + rnd.uniform(-0.002, 0.002)),
+        "Euro": 48.80 * (1 + rnd.uniform(-0.002, 0.002)),
+        "Pound": 55.10 * (1 + rnd.uniform(-0.002, 0.002)),
+        "Gram Altın": 5539.56 * (1 + rnd.uniform(-0.005, 0.005)),
+    }
+
+def sample_changes(rnd, data):
+    return {k: rnd.uniform(-1, 1) for k in data}
+
+def ms(sec):
+    return f"{sec * 1000:.2f} ms"
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200)
+    ap.add_argument("--out", default="", help="Son kartı bu yola kaydet")
+    args = ap.parse_args()
+    rnd = random.Random(42)
+    date_text = "01.01.2026 10:00"
+
+    data = sample_data(rnd)
+    changes = sample_changes(rnd, data)
+    t0 = time.perf_counter()
+    fx_card.render_card(data, changes, date_text)
+    cold = time.perf_counter() - t0
+
+    # Sabit katman önbellekte, her seferinde tüm hücreler değişiyor
+    t0 = time.perf_counter()
+    for _ in range(args.n):
+        data = sample_data(rnd)
+        fx_card.render_card(data, sample_changes(rnd, data), date_text)
+    full = (time.perf_counter() - t0) / args.n
+
+    # Tek satır değişiyor (tipik tick)
+    t0 = time.perf_counter()
+    for _ in range(args.n):
+        data = dict(data, Dolar=data["Dolar"] * (1 + rnd.uniform(-0.001, 0.001)))
+        fx_card.render_card(data, changes, date_text)
+    one = (time.perf_counter() - t0) / args.n
+
+    # PNG kodlama dahil
+    t0 = time.perf_counter()
+    for _ in range(max(1, args.n // 10)):
+        fx_card.render_card(sample_data(rnd), changes, date_text).save(io.BytesIO(), format="PNG")
+    saved = (time.perf_counter() - t0) / max(1, args.n // 10)
+
+    print(f"ilk çizim (soğuk)      : {ms(cold)}")
+    print(f"tüm hücreler değişti   : {ms(full)}")
+    print(f"tek satır değişti      : {ms(one)}")
+    print(f"çizim + PNG kaydı      : {ms(saved)}")
+
+    if args.out:
+        fx_card.render_card(data, changes, date_text).save(args.out)
+        print(f"kart: {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_langid.py - Türkçe filtresi: eski is_turkish_text (Türkçe harf regex'i + yaygın kelime
+listesi, tweet başına) ile langid (karakter n-gram, toplu vektörel puanlama) karşılaştırması.
+- Doğruluk: eğitim metninde olmayan etiketli kısa tweet/başlıklar (tr ve diğer diller);
+  katı turkish() (rewriter) ve açık kalan foreign() (rss/repost: yanlış atılan Türkçe sayısı).
+- Gecikme: 1.000 metin başına; langid hem toplu (tek çağrı) hem tek tek çağrılarla ölçülür.
+  langid eski sezgiselden yavaştır; rapor farkı olduğu gibi yazar.
+
+Kullanım:
+    python bench_langid.py
+    python bench_langid.py --texts 100000 --repeat 5
+"""
+
+import re
+import time
+import random
+import argparse
+
+import langid
+
+# eğitim metninde yok; kısa ve zor örnekler bilerek çok (tek kelime, özel ad, Türkçe harfsiz)
+HELD_OUT = [
+    ("tr", "Son dakika: İzmir'de 4.8 büyüklüğünde deprem"),
+    ("tr", "Bakanlık yeni düzenlemeyi onayladı"),
+    ("tr", "Maç bitti, kazanan belli oldu"),
+    ("tr", "Herkese iyi bayramlar"),
+    ("tr", "bu akşam ne yapsak"),
+    ("tr", "Valilik okulların tatil edildiğini duyurdu"),
+    ("tr", "Anket sonuçları açıklandı"),
+    ("tr", "Kira artışı için yeni formül masada"),
+    ("tr", "Hakem penaltı vermedi, taraftar tepkili"),
+    ("tr", "Yarın sabah yollar buzlanabilir, dikkat"),
+    ("tr", "Fenerbahçe Avrupa'da tur atladı"),
+    ("tr", "ekonomi programı meclise geliyor"),
+    ("tr", "Gazeteci gözaltına alındı"),
+    ("tr", "Benzin ve motorine indirim"),
+    ("tr", "Ozan Tufan yeni takımına imza attı"),
+    ("tr", "tamam abi anladım"),
+    ("tr", "Real Madrid Barcelona maçı canlı anlatım"),
+    ("tr", "Borsa rekor tazeledi"),
+    ("tr", "Merkez Bankası rezervleri arttı"),
+    ("tr", "Yeni sezon programı belli oldu"),
+    ("tr", "Kadıköy'de eylem: 12 kişi serbest bırakıldı"),
+    ("tr", "Emekliye bayram ikramiyesi ne zaman yatacak"),
+    ("tr", "NBA'de gecenin sonuçları"),
+    ("tr", "Dolar/TL 32 lirayı aştı"),
+    ("tr", "Sınav sonuçları ne zaman açıklanacak"),
+    ("tr", "RT @haber: Ankara'da trafik kazası"),
+    ("tr", "Okullar ne zaman kapanacak"),
+    ("tr", "Hava sıcaklığı mevsim normallerinin üzerinde"),
+    ("tr", "Galatasaray derbiyi kazandı"),
+    ("tr", "Ülke genelinde elektrik kesintisi"),
+    ("tr", "Gazze'de son durum"),
+    ("tr", "Motorin fiyatına indirim yolda"),
+    ("tr", "Dev maçta gol yok"),
+    ("en", "Breaking: 4.8 magnitude earthquake hits Izmir"),
+    ("en", "The ministry approved the new regulation"),
+    ("en", "Full time, we have a winner"),
+    ("en", "Happy holidays everyone"),
+    ("en", "what should we do tonight"),
+    ("en", "Schools closed tomorrow, governor says"),
+    ("en", "Poll results are out"),
+    ("en", "New formula for rent increases on the table"),
+    ("en", "No penalty given, fans furious"),
+    ("en", "Roads may be icy tomorrow morning, take care"),
+    ("en", "Fenerbahce advance in Europe"),
+    ("en", "economic programme heads to parliament"),
+    ("en", "Journalist detained in Istanbul"),
+    ("en", "Petrol and diesel prices cut"),
+    ("en", "Ozan Tufan signs for his new club"),
+    ("en", "ok bro got it"),
+    ("en", "Real Madrid vs Barcelona live commentary"),
+    ("en", "Stocks hit a new record"),
+    ("en", "Central bank reserves rose again"),
+    ("en", "New season schedule announced"),
+    ("en", "Turkey's inflation slows for a third month"),
+    ("en", "Galatasaray win the derby"),
+    ("en", "Nationwide power outage reported"),
+    ("en", "When will exam results be published"),
+    ("en", "RT @news: Traffic accident in Ankara"),
+    ("de", "Erdbeben der Stärke 4,8 erschüttert Izmir"),
+    ("de", "Die Schulen bleiben morgen geschlossen"),
+    ("de", "Galatasaray gewinnt das Derby"),
+    ("fr", "Séisme de magnitude 4,8 à Izmir"),
+    ("fr", "Les écoles fermées demain"),
+    ("es", "Terremoto de magnitud 4,8 en Esmirna"),
+    ("es", "Las escuelas cerrarán mañana"),
+]
+
+def old_is_turkish_text(text, lang_hint):
+    # auto_rewriter.py'nin eski sezgisel kontrolü
+    if lang_hint and lang_hint.lower() == "tr":
+        return True
+    if re.search(r"[çğıöşüİ]", text): return True
+    common = [" ve ", " ile ", "bugün", "yarın", "TRT", "maçı", "Türkiye", "son dakika", "güncelleme"]
+    return any(w in text.lower() for w in common)
+
+def make_texts(n, rnd):
+    """Tutulan örneklerden kelime karıştırarak tweet boyunda metinler (dil korunur)."""
+    by_lang = {}
+    for lang, text in HELD_OUT:
+        by_lang.setdefault(lang, []).extend(text.split())
+    langs = sorted(by_lang)
+    out = []
+    for _ in range(n):
+        words = by_lang[rnd.choice(langs)]
+        out.append(" ".join(rnd.choice(words) for _ in range(rnd.randint(3, 40))))
+    return out
+
+def per_1k(fn, texts, repeat):
+    best = min(_timed(fn, texts) for _ in range(repeat))
+    return best / len(texts) * 1000 * 1000
+
+def _timed(fn, texts):
+    t0 = time.perf_counter()
+    fn(texts)
+    return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--texts", type=int, default=20_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    lid = langid.load()
+    load_ms = (time.perf_counter() - t0) * 1000
+
+    texts = [t for _, t in HELD_OUT]
+    truth = [lang == "tr" for lang, _ in HELD_OUT]
+    old = [old_is_turkish_text(t, None) for t in texts]
+    new = [ok for ok, _ in lid.turkish(texts)]
+    acc = lambda pred: sum(p == t for p, t in zip(pred, truth))
+    kept = [not other for other, _ in lid.foreign(texts)]
+    print(f"doğruluk ({len(texts)} etiketli metin, {sum(truth)} Türkçe):"
+          f" eski {acc(old)}/{len(texts)} | langid {acc(new)}/{len(texts)} | foreign {acc(kept)}/{len(texts)}")
+    for (lang, text), o, n in zip(HELD_OUT, old, new):
+        if n != (lang == "tr"):
+            print(f"  langid yanlış: [{lang}] {text}")
+        elif o != (lang == "tr"):
+            print(f"  eski yanlış:   [{lang}] {text}")
+    lost = [t for t, tr, k in zip(texts, truth, kept) if tr and not k]
+    passed = sum(1 for tr, k in zip(truth, kept) if not tr and k)
+    print(f"  foreign (rss/repost): atılan Türkçe {len(lost)}, geçen yabancı {passed}/{len(texts) - sum(truth)}"
+          + (f" -> {lost}" if lost else ""))
+
+    corpus = make_texts(args.texts, random.Random(args.seed))
+    avg = sum(map(len, corpus)) / len(corpus)
+    t_old = per_1k(lambda ts: [old_is_turkish_text(t, None) for t in ts], corpus, args.repeat)
+    t_batch = per_1k(lid.turkish, corpus, args.repeat)
+    t_one = per_1k(lambda ts: [lid.turkish([t]) for t in ts], corpus[:2000], args.repeat)
+    t_foreign = per_1k(lid.foreign, corpus, args.repeat)
+    print(f"\ngecikme ({len(corpus)} metin, ort {avg:.0f} karakter; model yükleme {load_ms:.0f} ms):")
+    print(f"  eski sezgisel, tek tek:  {t_old:7.2f} ms / 1k metin")
+    print(f"  langid, toplu:           {t_batch:7.2f} ms / 1k metin")
+    print(f"  langid, tek tek:         {t_one:7.2f} ms / 1k metin")
+    print(f"  foreign, toplu:          {t_foreign:7.2f} ms / 1k metin (ğ/ı/ş/İ'li metin modele gitmez)")
+    print(f"  toplu langid eskinin {t_batch / t_old:.1f} katı, foreign {t_foreign / t_old:.1f} katı sürüyor")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_names.py - İsim adayı çıkarımı: sadece regex (eski) ile gazetteer trie + regex
+karşılaştırması. Throughput (KB/sn, metin/sn; iki yol dönüşümlü ölçülür, en iyi tur), sözlük
+yükleme süresi ve kırılımı (.pkl okuma / re.compile), isabet ve iki yolun ayrıştığı örnekler.
+
+İsabet elle yazılmış, etiketli gövdelerle (HELD_OUT) ölçülür. Sentetik gövdeler sözlükteki
+adlardan üretildiği için oradaki isabet döngüseldir; o küme yalnız hız için raporlanır.
+
+Kullanım:
+    python bench_names.py                      # elle yazılmış + sentetik gövdeler
+    python bench_names.py govdeler/*.txt       # kayıtlı düz metinler (etiketsiz: isabet yok)
+"""
+
+import re
+import glob
+import time
+import random
+import pickle
+import argparse
+
+import gazetteer
+from auto_rss_bot import regex_name_picks, find_name_picks, rank_names
+
+# Elle yazılmış haber gövdeleri + içlerindeki gerçek kişi adları; sözlükten/şablondan üretilmedi
+# (adların bir kısmı sözlükte var, bir kısmı yok).
+HELD_OUT = [
+    ("""Merkez Bankası Başkanı Fatih Karahan, Ankara'da düzenlenen toplantıda yaptığı sunumda enflasyonun yılın ikinci yarısında belirgin biçimde gerileyeceğini söyledi. Karahan, sıkı para politikasının kararlılıkla süreceğini vurgularken, piyasa katılımcılarının beklentilerinde de iyileşme görüldüğünü ifade etti.
+Toplantıya katılan TÜSİAD Yönetim Kurulu Başkanı Orhan Turan ise kredi maliyetlerinin sanayiyi zorladığını belirterek, ihracatçıya yönelik destek paketinin genişletilmesini istedi. Ekonomist Hakan Kara da sosyal medya hesabından yaptığı paylaşımda, faiz indirimleri için acele edilmemesi gerektiğini yazdı.""",
+     ["Fatih Karahan", "Orhan Turan", "Hakan Kara"]),
+    ("""Milli takımın genç yıldızı Arda Güler, Real Madrid formasıyla çıktığı son maçta attığı golle takımına üç puanı getirdi. Teknik direktör Carlo Ancelotti maç sonu basın toplantısında Arda'nın gelişiminden çok memnun olduğunu söyledi.
+A Milli Takım Teknik Direktörü Vincenzo Montella ise İtalyan basınına verdiği röportajda, kadroya yeni isimlerin katılabileceğini açıkladı. Kaptan Hakan Çalhanoğlu'nun sakatlığı nedeniyle kampa katılıp katılamayacağı henüz netlik kazanmadı.""",
+     ["Arda Güler", "Carlo Ancelotti", "Vincenzo Montella", "Hakan Çalhanoğlu"]),
+    ("""ABD Başkanı Donald Trump, Beyaz Saray'da gazetecilerin sorularını yanıtladı. Trump, Çin'e yönelik gümrük vergilerinin bir süre daha yürürlükte kalacağını söyledi ve Pekin yönetimiyle müzakerelerin sürdüğünü ekledi.
+Hazine Bakanı Scott Bessent de CNBC'ye yaptığı açıklamada, anlaşmaya yakın olduklarını belirtti. Demokrat Parti'den Senatör Elizabeth Warren ise tarifelerin tüketici fiyatlarını artırdığını savunarak yönetimi eleştirdi.""",
+     ["Donald Trump", "Scott Bessent", "Elizabeth Warren"]),
+    ("""İstanbul'un Kadıköy ilçesinde dün akşam saatlerinde çıkan yangında bir apartman dairesi kullanılamaz hale geldi. İtfaiye ekiplerinin yarım saatlik müdahalesiyle söndürülen yangında yaralanan olmadı.
+Daire sahibi Selin Aksoy, yangının mutfaktaki elektrikli ocaktan çıktığını düşündüklerini söyledi. Kadıköy Belediye Başkanı Mesut Kösedağı olay yerine gelerek ailelere geçici konaklama sağlanacağını duyurdu.""",
+     ["Selin Aksoy", "Mesut Kösedağı"]),
+    ("""Rusya Devlet Başkanı Vladimir Putin ile Ukrayna Devlet Başkanı Vladimir Zelenskiy arasında doğrudan görüşme yapılması ihtimali yeniden gündeme geldi. Kremlin Sözcüsü Dmitriy Peskov, şartların henüz olgunlaşmadığını açıkladı.
+Dışişleri Bakanı Hakan Fidan ise İstanbul'un her iki taraf için de uygun bir zemin sunduğunu belirtti. Fidan, teknik heyetlerin önümüzdeki hafta yeniden bir araya gelebileceğini sözlerine ekledi.""",
+     ["Vladimir Putin", "Vladimir Zelenskiy", "Dmitriy Peskov", "Hakan Fidan"]),
+    ("""Üniversite sınavında ilk 100'e giren öğrencilerden Zeynep Arslan, başarısının sırrını düzenli çalışmaya bağladı. Antalya'da yaşayan Arslan, tıp fakültesini tercih edeceğini söyledi.
+Okul müdürü Kemal Yıldırım, bu yıl okuldan 12 öğrencinin ilk binde yer aldığını belirterek öğretmenlere teşekkür etti. Milli Eğitim Bakanı Yusuf Tekin de başarılı öğrencileri tebrik eden bir mesaj yayımladı.""",
+     ["Zeynep Arslan", "Kemal Yıldırım", "Yusuf Tekin"]),
+    ("""Avrupa Merkez Bankası Başkanı Christine Lagarde, Frankfurt'taki basın toplantısında faiz oranlarını sabit tuttuklarını açıkladı. Lagarde, euro bölgesinde büyümenin beklenenden zayıf seyrettiğini, ancak enflasyonun hedefe yaklaştığını söyledi.
+Alman ekonomist Isabel Schnabel ise farklı bir görüş ortaya koyarak, ücret artışlarının fiyat baskısını canlı tuttuğunu savundu. Piyasalar açıklamaların ardından yatay bir seyir izledi.""",
+     ["Christine Lagarde", "Isabel Schnabel"]),
+    ("""Fenerbahçe Kulübü Başkanı Ali Koç, olağanüstü genel kurulda üyelere hitap etti. Koç, kulübün borç yapılandırmasının tamamlandığını ve transfer döneminde kadroya takviye yapılacağını açıkladı.
+Genel kurulda söz alan eski yönetici Mahmut Uslu, yönetimin mali tablolarını eleştirdi. Teknik direktör Jose Mourinho ise antrenman öncesi yaptığı açıklamada, hedeflerinin şampiyonluk olduğunu tekrarladı.""",
+     ["Ali Koç", "Mahmut Uslu", "Jose Mourinho"]),
+    ("""Meteoroloji Genel Müdürlüğü, Karadeniz'in doğusu için kuvvetli yağış uyarısında bulundu. Rize ve Artvin'de derelerin taşma riski bulunduğu bildirildi.
+Rize Valisi İhsan Selim Baydaş, vatandaşların dere yataklarından uzak durmasını istedi. AFAD ekipleri bölgede teyakkuz halinde bekliyor. Çay üreticisi Hüseyin Kalkavan ise hasadın yağış nedeniyle birkaç gün erteleneceğini söyledi.""",
+     ["İhsan Selim Baydaş", "Hüseyin Kalkavan"]),
+    ("""CHP Genel Başkanı Özgür Özel, partisinin grup toplantısında hükümetin ekonomi politikalarını eleştirdi. Özel, asgari ücrete ara zam yapılması gerektiğini söyledi.
+AK Parti Grup Başkanı Abdullah Güler ise Meclis'te gazetecilere yaptığı açıklamada, ara zam konusunun gündemlerinde olmadığını belirtti. İYİ Parti Genel Başkanı Müsavat Dervişoğlu da emeklilerin durumuna dikkat çeken bir konuşma yaptı.""",
+     ["Özgür Özel", "Abdullah Güler", "Müsavat Dervişoğlu"]),
+    ("""Teknoloji devi Apple, yeni yapay zeka özelliklerini Kaliforniya'daki etkinlikte tanıttı. Şirketin CEO'su Tim Cook, yeni özelliklerin önce İngilizce olarak kullanıma sunulacağını söyledi.
+Tesla ve SpaceX'in sahibi Elon Musk ise sosyal medya platformu X'ten yaptığı paylaşımda Apple'ı gizlilik konusunda eleştirdi. Analist Dan Ives, yatırımcıların açıklamaları olumlu karşıladığını yazdı.""",
+     ["Tim Cook", "Elon Musk", "Dan Ives"]),
+    ("""Gaziantep'te düzenlenen gastronomi festivaline binlerce kişi katıldı. Festivalde konuşan Gaziantep Büyükşehir Belediye Başkanı Fatma Şahin, kentin UNESCO gastronomi şehri unvanının turizme büyük katkı sağladığını söyledi.
+Usta aşçı Burhan Çağdaş, festival kapsamında düzenlenen atölyede katılımcılara yöresel tarifleri anlattı. Kültür ve Turizm Bakanı Mehmet Nuri Ersoy da festivale video mesajla katıldı.""",
+     ["Fatma Şahin", "Burhan Çağdaş", "Mehmet Nuri Ersoy"]),
+    ("""İsrail Başbakanı Benjamin Netanyahu, Gazze'deki ateşkes görüşmelerine ilişkin yeni bir açıklama yaptı. Netanyahu, esirlerin serbest bırakılması konusunda ilerleme kaydedildiğini öne sürdü.
+BM Genel Sekreteri Antonio Guterres ise bölgedeki insani durumun felaket boyutuna ulaştığını belirterek acil yardım çağrısı yaptı. Filistinli yetkili Hüseyin Şeyh de müzakerelerin kritik bir aşamada olduğunu söyledi.""",
+     ["Benjamin Netanyahu", "Antonio Guterres", "Hüseyin Şeyh"]),
+    ("""Anadolu Efes, Euroleague'de oynadığı maçta rakibini son saniye basketiyle mağlup etti. Maçın yıldızı Shane Larkin, 27 sayıyla oynadı.
+Başantrenör Luca Banchi, oyuncularının savunmadaki mücadelesini övdü. Türkiye Basketbol Federasyonu Başkanı Hidayet Türkoğlu da tribünden maçı izleyen isimler arasındaydı.""",
+     ["Shane Larkin", "Luca Banchi", "Hidayet Türkoğlu"]),
+]
+
+KNOWN = ["Mehmet Şimşek", "Jerome Powell", "Donald Trump", "Özgür Özel", "Hakan Fidan", "Christine Lagarde"]
+TITLES = ["Hazine ve Maliye Bakanı", "Fed Başkanı", "ABD Başkanı", "CHP Genel Başkanı", "Dışişleri Bakanı", "Prof. Dr."]
+UNKNOWN = ["Ayşe Kaya", "Mert Demir", "Elif Şahin", "Can Aydın"]
+FILLER = [
+    "piyasalarda gün boyu dalgalı bir seyir izlendi", "Türkiye ekonomisine ilişkin beklentiler güncellendi",
+    "Air Force One ile Ankara'ya geldi", "Merkez Bankası faiz kararını açıkladı", "Son Dakika gelişmesi",
+    "Beyaz Saray'dan yapılan açıklamada", "İstanbul Borsa İstanbul endeksi yükseldi",
+]
+
+def synthetic_body(rnd):
+    sents = []
+    for _ in range(rnd.randint(20, 80)):
+        r = rnd.random()
+        if r < 0.25:
+            sents.append(f"{rnd.choice(TITLES)} {rnd.choice(KNOWN)}'ın açıklaması {rnd.choice(FILLER)}.")
+        elif r < 0.4:
+            sents.append(f"- {rnd.choice(UNKNOWN)} {rnd.choice(FILLER)}")
+        else:
+            sents.append(rnd.choice(FILLER).capitalize() + ".")
+    return "\n".join(" ".join(sents[i:i + 4]) for i in range(0, len(sents), 4))
+
+def old_names(text):
+    return rank_names(regex_name_picks(text)) if text else []
+
+def new_names(text):
+    return rank_names(find_name_picks(text)) if text else []
+
+def timed(fns, texts, repeat):
+    """Yollar dönüşümlü çalışır (makine gürültüsü ikisine eşit dağılır) -> [en iyi tur sn]."""
+    best = [float("inf")] * len(fns)
+    for fn in fns:
+        fn(texts[0])
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            t0 = time.perf_counter()
+            for t in texts:
+                fn(t)
+            best[i] = min(best[i], time.perf_counter() - t0)
+    return best
+
+def quality(fn, labeled):
+    """labeled: [(metin, gerçek adlar)] -> (bulunan gerçek ad oranı, ad olmayan aday sayısı)."""
+    found = total = junk = 0
+    for t, names in labeled:
+        want = set(names)
+        got = set(fn(t))
+        found += len(want & got)
+        total += len(want)
+        junk += len(got - want)
+    return found / max(total, 1), junk
+
+def load_breakdown(n=7):
+    """
+    Sözlük .pkl yüklemesinin adımları (gazetteer.load ile aynı sıra: kaynak özeti, .pkl okuma,
+    re.compile), re önbelleği boşaltılarak soğuk ölçülür. Adımlar aynı turda ölçülür ve toplamı en
+    kısa tur raporlanır; parçalar toplamı verir. -> (dosya, regex kaynağı uzunluğu, {adım: ms})
+    """
+    out, compiled = gazetteer.build()
+    t0 = time.perf_counter()
+    gazetteer.compile_trie(gazetteer.read_entries())
+    best = {"tsv": (time.perf_counter() - t0) * 1000}
+    for _ in range(n):
+        re.purge()
+        t0 = time.perf_counter()
+        gazetteer._digest(gazetteer.GAZETTEER_PATH)
+        t1 = time.perf_counter()
+        with open(out, "rb") as f:
+            data = pickle.load(f)
+        t2 = time.perf_counter()
+        re.compile(data["pattern"])
+        t3 = time.perf_counter()
+        if t3 - t0 < best.get("_toplam", float("inf")):
+            best.update({"_toplam": t3 - t0, "özet": (t1 - t0) * 1000, "pkl": (t2 - t1) * 1000,
+                         "re": (t3 - t2) * 1000})
+    best["toplam"] = best.pop("_toplam") * 1000
+    return out, len(compiled["pattern"]), best
+
+def report(title, texts, repeat, labeled=None, show=0):
+    kb = sum(len(t.encode("utf-8")) for t in texts) / 1024
+    t_old, t_new = timed([old_names, new_names], texts, repeat)
+    print(f"\n{title}: {len(texts)} metin ({kb:.0f} KB) x {repeat}")
+    print(f"{'yol':16} {'ms/metin':>9} {'metin/sn':>9} {'KB/sn':>9}   isabet")
+    for name, t, fn in (("regex (eski)", t_old, old_names), ("gazetteer+regex", t_new, new_names)):
+        q = "-"
+        if labeled:
+            recall, junk = quality(fn, labeled)
+            q = f"bulunan ad %{recall * 100:.0f}, ad olmayan {junk}"
+        print(f"{name:16} {t / len(texts) * 1000:9.3f} {len(texts) / t:9.0f} {kb / t:9.0f}   {q}")
+    ratio = t_new / t_old
+    print(f"gazetteer/regex süre oranı: {ratio:.2f} (>1: gazetteer yolu daha yavaş)")
+    diff = [(o, n) for o, n in ((old_names(t), new_names(t)) for t in texts) if o != n]
+    print(f"farklı çıktı: {len(diff)}/{len(texts)}")
+    for o, n in diff[:show]:
+        print(f"  regex    : {o}\n  gazetteer: {n}")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("paths", nargs="*", help="Düz metin gövdeleri (glob)")
+    ap.add_argument("--synthetic", type=int, default=300)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--show", type=int, default=3, help="Gösterilecek farklı çıktı sayısı")
+    args = ap.parse_args()
+
+    out, size, ms = load_breakdown()
+    print(f"sözlük: TSV'den trie {ms['tsv']:.2f} ms | {out} soğuk yükleme {ms['toplam']:.2f} ms"
+          f" = özet {ms['özet']:.2f} + .pkl okuma {ms['pkl']:.2f}"
+          f" + re.compile {ms['re']:.2f} ({size} karakter regex)")
+
+    texts = []
+    for pat in args.paths:
+        for p in sorted(glob.glob(pat)):
+            with open(p, "r", encoding="utf-8", errors="replace") as f:
+                texts.append(f.read())
+    if texts:
+        report("kayıtlı gövdeler (etiketsiz)", texts, args.repeat, show=args.show)
+        return
+    # kısa küme: süre ölçümü için tekrarlanır, isabet tek kopyadan
+    held = [t for t, _ in HELD_OUT]
+    report("elle yazılmış gövdeler", held * 20, args.repeat, labeled=HELD_OUT, show=args.show)
+    rnd = random.Random(11)
+    synth = [synthetic_body(rnd) for _ in range(args.synthetic)]
+    print("\n(sentetik gövdeler sözlükteki adlardan üretilir: isabeti döngüsel, yalnız hız için)")
+    report("sentetik gövdeler", synth, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_og_image.py - Paylaşım görseli seçimi (og_image) yerel sunucuda.
+- Ölçü okuma: Pillow ile üretilen JPEG (düz/progressive/EXIF'li), PNG, WebP (kayıplı/kayıpsız/
+  alfa) görsellerin ilk PROBE_BYTES'ından genişlik-yükseklik doğru okunuyor mu.
+- Seçim: sayfada logo, küçük, aşırı geniş ve asıl görsel adayları; logo adresten elenir,
+  diğerleri yoklanır, asıl görsel seçilmeli.
+- Süre: adayları tek tek tam GET ile indirip ölçmek vs eşzamanlı aralıklı GET (pick);
+  yapay gecikmeli sunucu, aktarılan bayt da sayılır.
+
+Kullanım:
+    python bench_og_image.py
+    python bench_og_image.py --latency-ms 120 --repeat 5
+"""
+
+import io
+import re
+import time
+import random
+import argparse
+import threading
+from urllib.parse import urljoin
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image as PILImage
+
+import og_image
+from page_parser import get_backend
+
+def make_image(fmt, size, **kw):
+    rnd = random.Random(size[0] * 31 + size[1])
+    img = PILImage.new("RGB" if fmt != "WEBP_A" else "RGBA", size)
+    px = img.load()
+    for _ in range(size[0] * size[1] // 50):        # gürültü: gerçekçi dosya boyutu
+        x, y = rnd.randrange(size[0]), rnd.randrange(size[1])
+        px[x, y] = (rnd.randrange(256), rnd.randrange(256), rnd.randrange(256)) + (() if fmt != "WEBP_A" else (128,))
+    buf = io.BytesIO()
+    img.save(buf, "WEBP" if fmt.startswith("WEBP") else fmt, **kw)
+    return buf.getvalue()
+
+def sniff_cases():
+    exif = PILImage.Exif()
+    exif[0x010E] = "x" * 20000                      # büyük EXIF: SOF ilk 20 KB'ın ötesinde
+    return [
+        ("jpeg", (1200, 630), make_image("JPEG", (1200, 630))),
+        ("jpeg progressive", (800, 450), make_image("JPEG", (800, 450), progressive=True)),
+        ("jpeg + 20 KB EXIF", (640, 360), make_image("JPEG", (640, 360), exif=exif.tobytes())),
+        ("png", (1024, 512), make_image("PNG", (1024, 512))),
+        ("webp lossy", (1000, 563), make_image("WEBP", (1000, 563))),
+        ("webp lossless", (600, 315), make_image("WEBP", (600, 315), lossless=True)),
+        ("webp alfa", (500, 500), make_image("WEBP_A", (500, 500))),
+        ("gif", (320, 200), make_image("GIF", (320, 200))),
+    ]
+
+class Server:
+    def __init__(self, files, latency_ms):
+        self.files, self.latency = files, latency_ms / 1000
+        self.sent = 0
+        self._lock = threading.Lock()
+        srv = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                time.sleep(srv.latency)
+                ctype, body = srv.files.get(self.path, ("text/plain", b"not found"))
+                status, headers = (200 if self.path in srv.files else 404), {}
+                m = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+                if m and status == 200:
+                    lo = int(m.group(1))
+                    hi = min(int(m.group(2) or len(body) - 1), len(body) - 1)
+                    headers["Content-Range"] = f"bytes {lo}-{hi}/{len(body)}"
+                    body, status = body[lo:hi + 1], 206
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                with srv._lock:
+                    srv.sent += len(body)
+
+            def log_message(self, *a):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+def full_get_pick(urls, session):
+    """Karşılaştırma: her adayı sırayla tamamen indir, ölçüsüne bak."""
+    for u in urls:
+        if og_image.looks_like_logo(u):
+            continue
+        body = session.get(u, headers=og_image.HEADERS, timeout=10).content
+        ctype, w, h = og_image.image_size(body)
+        img = og_image.Image(u, ctype, len(body), w, h, body)
+        if og_image.acceptable(img) is None:
+            return img
+    return None
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--latency-ms", type=float, default=60)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    print("ölçü okuma (ilk %d KB):" % (og_image.PROBE_BYTES // 1024))
+    bad = 0
+    for name, (w, h), data in sniff_cases():
+        ctype, sw, sh = og_image.image_size(data[:og_image.PROBE_BYTES])
+        ok = (sw, sh) == (w, h)
+        bad += not ok
+        print(f"  {name:20} {len(data) / 1024:7.1f} KB  {ctype:11} {sw}x{sh}  {'tamam' if ok else f'YANLIŞ (gerçek {w}x{h})'}")
+
+    files = {
+        "/img/site-logo.png": ("image/png", make_image("PNG", (600, 315))),
+        "/img/small.jpg": ("image/jpeg", make_image("JPEG", (120, 120))),
+        "/img/banner.jpg": ("image/jpeg", make_image("JPEG", (2400, 300))),
+        "/img/hero.jpg": ("image/jpeg", make_image("JPEG", (1600, 900), quality=95)),
+    }                                                  # /img/missing.jpg: 404
+    srv = Server(files, args.latency_ms)
+    metas = [("property", "og:image", "/img/site-logo.png"), ("property", "og:image", "/img/missing.jpg"),
+             ("property", "og:image", "/img/small.jpg"), ("name", "twitter:image", "/img/banner.jpg"),
+             ("name", "twitter:image", "/img/hero.jpg")]
+    page = "<html><head>" + "".join(f'<meta {a}="{k}" content="{v}">' for a, k, v in metas) + "</head><body></body></html>"
+    P = get_backend()
+    urls = [urljoin(srv.base + "/haber/1", u) for u in og_image.candidates(P.parse_html(page), P)]
+    print(f"\nadaylar: {[u[len(srv.base):] for u in urls]}")
+
+    session = og_image.http_pool.session()
+    rows = []
+    for name, fn in (("tek tek tam GET", lambda: full_get_pick(urls, session)),
+                     ("eşzamanlı aralıklı GET", lambda: og_image.pick(urls, session=session))):
+        best, sent = None, 0
+        for _ in range(args.repeat):
+            srv.sent = 0
+            t0 = time.perf_counter()
+            img = fn()
+            took = time.perf_counter() - t0
+            best = took if best is None else min(best, took)
+            sent = srv.sent
+        rows.append((name, best, sent, img))
+    print(f"\nseçim ({args.latency_ms:.0f} ms gecikme, en iyi {args.repeat}):")
+    for name, took, sent, img in rows:
+        chosen = img.url[len(srv.base):] if img else None
+        print(f"  {name:24} {took * 1000:7.1f} ms  {sent / 1024:8.1f} KB aktarıldı  seçilen {chosen}")
+    ok = all(r[3] and r[3].url.endswith("/img/hero.jpg") for r in rows)
+    print(f"\nsonuç: ölçü hatası {bad}, seçim {'doğru' if ok else 'YANLIŞ'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_paraphrase.py - auto_rewriter: eski clean_text + simple_paraphrase (kural başına bir
+re.sub, çağrı başına derleme önbelleği araması) ile tek geçişli paraphrase motorunun
+karşılaştırması. Sentetik tweet korpusu; tek tek ve toplu (rewrite_many) yol ölçülür, eski
+çıktıyla farklar sayılır (beklenen tek fark: büyük harfli eşleşmelerin harf biçimi).
+
+Kullanım:
+    python bench_paraphrase.py                 # 100k tweet
+    python bench_paraphrase.py --tweets 300000 --show 5
+"""
+
+import re
+import time
+import random
+import argparse
+
+import paraphrase
+from auto_rewriter import clean_text, simple_paraphrase, paraphrase_batch
+
+WORDS = ["maç", "hükümet", "açıklama", "ekonomi", "seçim", "İstanbul", "Ankara", "yarın", "takım",
+         "gol", "oyuncu", "bakan", "toplantı", "yağmur", "deprem", "haber", "kulüp", "taraftar"]
+HITS = ["son dakika", "Son Dakika", "SON DAKİKA", "bugün", "Bugün", "duyurdu", "maçı", "Maçı",
+        "yayınlanacak", "yayınlanıyor", "canlı", "CANLI", "bugünkü", "canlılık"]
+
+def old_clean_text(text):
+    text = re.sub(r"^RT\s+@", "@", text)
+    text = re.sub(r"https?://\S+", "", text)
+    text = re.sub(r"\s+#\S+", "", text)
+    text = re.sub(r"\s{2,}", " ", text).strip()
+    return text
+
+def old_simple_paraphrase(text):
+    t = text
+    swaps = [
+        (r"\bson dakika\b", "gelişme"),
+        (r"\bbugün\b", "bugün itibarıyla"),
+        (r"\bduyurdu\b", "bildirdi"),
+        (r"\bmaçı\b", "karşılaşması"),
+        (r"\byayınlanacak\b", "ekrana gelecek"),
+        (r"\byayınlanıyor\b", "ekrana geliyor"),
+        (r"\bcanlı\b", "canlı olarak"),
+    ]
+    for pat, rep in swaps:
+        t = re.sub(pat, rep, t, flags=re.IGNORECASE)
+    if len(t) < 40 and not t.endswith(("!","?",".")):
+        t += "."
+    return re.sub(r"\s{2,}", " ", t).strip()
+
+def make_corpus(n, rnd):
+    out = []
+    for _ in range(n):
+        parts = [rnd.choice(WORDS) for _ in range(rnd.randint(2, 30))]
+        for _ in range(rnd.randint(0, 3)):
+            parts.insert(rnd.randrange(len(parts) + 1), rnd.choice(HITS))
+        if rnd.random() < 0.3:
+            parts.append(f"https://t.co/{rnd.getrandbits(40):x}")
+        if rnd.random() < 0.3:
+            parts.insert(rnd.randrange(len(parts) + 1), "#" + rnd.choice(WORDS))
+        text = (" " if rnd.random() < 0.8 else "  ").join(parts)
+        if rnd.random() < 0.1:
+            text = "RT @" + rnd.choice(WORDS) + ": " + text
+        if rnd.random() < 0.3:
+            text += rnd.choice(["!", "?", ".", " :)", ""])
+        out.append(text)
+    return out
+
+def timed(fn, *a):
+    t0 = time.perf_counter()
+    out = fn(*a)
+    return out, time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tweets", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--show", type=int, default=3, help="Gösterilecek fark örneği")
+    args = ap.parse_args()
+
+    corpus = make_corpus(args.tweets, random.Random(args.seed))
+    paraphrase.load()  # derleme ölçüme girmesin
+
+    old, t_old = timed(lambda: [old_simple_paraphrase(old_clean_text(t)) for t in corpus])
+    new, t_new = timed(lambda: [simple_paraphrase(clean_text(t)) for t in corpus])
+    batch, t_batch = timed(paraphrase_batch, corpus)
+
+    clean_diff = sum(old_clean_text(t) != clean_text(t) for t in corpus)
+    diff = [(o, n) for o, n in zip(old, new) if o != n]
+    low = lambda t: t.replace("İ", "i").replace("I", "ı").lower()
+    case_only = sum(low(o) == low(n) for o, n in diff)
+    rate = lambda s: len(corpus) / s / 1000
+
+    print(f"{len(corpus)} tweet, ort {sum(map(len, corpus)) / len(corpus):.0f} karakter")
+    print(f"eski (4 + 7 re.sub):   {t_old:6.2f} sn  {rate(t_old):7.1f} bin tweet/sn")
+    print(f"tek geçiş, tek tek:    {t_new:6.2f} sn  {rate(t_new):7.1f} bin tweet/sn  ({t_old / t_new:.1f}x)")
+    print(f"tek geçiş, toplu:      {t_batch:6.2f} sn  {rate(t_batch):7.1f} bin tweet/sn  ({t_old / t_batch:.1f}x)")
+    print(f"clean_text farkı: {clean_diff} | paraphrase farkı: {len(diff)} (sadece harf biçimi: {case_only})"
+          f" | toplu = tek tek: {batch == new}")
+    for o, n in diff[:args.show]:
+        print(f"  eski: {o}\n  yeni: {n}")
+
+if __name__ == "__main__":
+    main()
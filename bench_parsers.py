@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_parsers.py - page_parser arka uçlarının (bs4 / lxml) sayfa başına CPU ve bellek ölçümü.
+- HTML: auto_rss_bot.extract_article (haber gövdesi çıkarımı)
+- XML : auto_repost_bot tarzı RSS <item> okuma
+- Boş sayfa: boş, sadece boşluk ya da sadece yorum içeren yanıt iki arka uçta da hata
+  vermeden boş ağaç olmalı (extract_article "" döner).
+
+Not: tepe bellek tracemalloc ile ölçülür ve sadece Python yığınını görür;
+lxml'in C (libxml2) tarafındaki ağaç belleği bu sayıya dahil değildir.
+
+Kullanım:
+    python bench_parsers.py                       # sentetik sayfalar
+    python bench_parsers.py --html sayfalar/*.html --xml feeds/*.xml
+"""
+
+import gc
+import glob
+import time
+import random
+import argparse
+import tracemalloc
+
+from page_parser import get_backend
+from auto_rss_bot import extract_article
+
+EMPTY_PAGES = ["", "   \n\t", "<!-- bakımda -->", b"", b"  \n"]
+
+def synthetic_html(rnd, i):
+    nav = "".join(f"<li><a href='/k/{k}'>Kategori {k}</a></li>" for k in range(50))
+    paras = "".join(f"<p>{'Ankara merkezli gelişme sürüyor. ' * rnd.randint(2, 8)}</p>" for _ in range(rnd.randint(8, 30)))
+    side = "".join(f"<div class='card'><a href='/h/{k}'>Diğer haber {k}</a><span>{'x' * 40}</span></div>" for k in range(150))
+    return (
+        "<html><head><title>Haber</title><script>var t = 1;</script><style>p{}</style></head><body>"
+        f"<header><nav><ul>{nav}</ul></nav></header>"
+        f"<div class='detail'><h1>Başlık {i}</h1><ul><li>Madde bir</li><li>Madde iki</li></ul>{paras}</div>"
+        f"<aside>{side}</aside><footer>Tüm hakları saklıdır</footer></body></html>"
+    )
+
+def synthetic_xml(rnd, n_items):
+    items = "".join(
+        f"<item><title>Son dakika {k}</title><link>https://example.com/h/{k}</link>"
+        f"<description><![CDATA[{'Açıklama metni ' * rnd.randint(3, 15)}]]></description>"
+        f"<pubDate>Mon, 01 Jan 2026 10:{k % 60:02d}:00 +0300</pubDate></item>"
+        for k in range(n_items)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Feed</title>{items}</channel></rss>'.encode("utf-8")
+
+def read_items(P, data, limit=5):
+    doc = P.parse_xml(data)
+    return [(P.child_text(it, "title"), P.child_text(it, "link"), P.child_text(it, "description"))
+            for it in P.find_all(doc, "item", limit=limit)]
+
+def measure(fn, inputs, repeat):
+    """-> (ms/sayfa CPU, KB/sayfa tepe bellek, sonuçlar)"""
+    results = [fn(x) for x in inputs]  # ısınma + çıktı
+    gc.collect()
+    t0 = time.process_time()
+    for _ in range(repeat):
+        for x in inputs:
+            fn(x)
+    cpu = (time.process_time() - t0) / (repeat * len(inputs))
+
+    peaks = []
+    for x in inputs:
+        gc.collect()
+        tracemalloc.start()
+        fn(x)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return cpu * 1000, sum(peaks) / len(peaks) / 1024, results
+
+def load(paths, binary):
+    out = []
+    for pat in paths or []:
+        for p in sorted(glob.glob(pat)):
+            with open(p, "rb" if binary else "r", **({} if binary else {"encoding": "utf-8", "errors": "replace"})) as f:
+                out.append(f.read())
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--html", nargs="*", help="Kayıtlı HTML dosyaları (glob)")
+    ap.add_argument("--xml", nargs="*", help="Kayıtlı RSS dosyaları (glob)")
+    ap.add_argument("--synthetic", type=int, default=30)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    rnd = random.Random(3)
+    html_pages = load(args.html, False) or [synthetic_html(rnd, i) for i in range(args.synthetic)]
+    xml_feeds = load(args.xml, True) or [synthetic_xml(rnd, 50) for _ in range(args.synthetic)]
+
+    outputs = {}
+    print(f"{'arka uç':8} {'iş':5} {'CPU ms/sayfa':>13} {'tepe KB/sayfa':>14}")
+    for name in ("bs4", "lxml"):
+        P = get_backend(name)
+        cpu, mem, res_html = measure(lambda h: extract_article(h, P), html_pages, args.repeat)
+        print(f"{name:8} {'html':5} {cpu:13.2f} {mem:14.0f}")
+        cpu, mem, res_xml = measure(lambda d: read_items(P, d), xml_feeds, args.repeat)
+        print(f"{name:8} {'xml':5} {cpu:13.2f} {mem:14.0f}")
+        outputs[name] = (res_html, res_xml)
+
+    same_html = sum(a == b for a, b in zip(outputs["bs4"][0], outputs["lxml"][0]))
+    same_xml = sum(a == b for a, b in zip(outputs["bs4"][1], outputs["lxml"][1]))
+    print(f"aynı çıktı: html {same_html}/{len(html_pages)}, xml {same_xml}/{len(xml_feeds)}")
+    for name in ("bs4", "lxml"):
+        P = get_backend(name)
+        bad = []
+        for page in EMPTY_PAGES:
+            try:
+                P.meta(P.parse_html(page), "og:image")
+                extract_article(page, P)
+            except Exception as e:
+                bad.append(f"{page!r}: {type(e).__name__}")
+        print(f"boş sayfa ({name}): {len(EMPTY_PAGES) - len(bad)}/{len(EMPTY_PAGES)} sorunsuz" + (f" | {', '.join(bad)}" if bad else ""))
+    print("not: tepe bellek Python yığınıdır; lxml'in C tarafı dahil değil.")
+
+if __name__ == "__main__":
+    main()
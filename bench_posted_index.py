@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_posted_index.py - posted_index: aylarca gönderi geçmişinde yakın tekrar kontrolü.
+Türkçe kelimelerden rastgele metinlerle geçmiş kurulur; sorgular geçmişteki metinlerin başka bot
+biçimleri (Kaynak eki, "Son dakika" öneki, unidecode, kelime değişimi, kısaltma) ve yeni
+metinlerdir. Bantlı arama, tüm geçmişi tarayan vektörel Hamming taramasıyla karşılaştırılır
+(aynı sonucu vermeli).
+
+Kullanım:
+    python bench_posted_index.py                    # 60k kayıt (~6 ay, günde ~330 gönderi)
+    python bench_posted_index.py --history 200000 --queries 2000
+"""
+
+import os
+import time
+import random
+import argparse
+import tempfile
+
+import numpy as np
+from unidecode import unidecode
+
+import posted_index
+from posted_index import PostedIndex, simhash, POPCOUNT
+
+def vocabulary():
+    """Kelime dağarcığı: langid eğitim metnindeki Türkçe cümleler (~600 kelime)."""
+    import langid
+    words = {w for line in langid.read_corpus()["tr"] for w in line.split()}
+    return sorted(words)
+
+def story(rnd, vocab):
+    return " ".join(rnd.choice(vocab) for _ in range(rnd.randint(8, 22)))
+
+VARIANTS = {
+    "aynı": lambda t, r: t,
+    "Kaynak eki": lambda t, r: t + " — Kaynak: @haber" + str(r.randint(1, 99)),
+    "Son dakika": lambda t, r: "SON DAKİKA | " + t,
+    "bağlantı": lambda t, r: t + f" https://t.co/{r.getrandbits(32):x}",
+    "unidecode": lambda t, r: unidecode(t),
+    "1 kelime": lambda t, r: t.replace(t.split()[2], "yeniden", 1),
+    "2 kelime": lambda t, r: t.replace(t.split()[2], "yeniden", 1).replace(t.split()[-1], "açıklandı"),
+    "kısaltma": lambda t, r: " ".join(t.split()[:-2]),
+}
+
+def full_scan(idx, text):
+    fp = simhash(text)
+    dist = POPCOUNT[(idx.recs["fp"] ^ np.uint64(fp)).view(np.uint8)].reshape(-1, 8).sum(axis=1)
+    k = int(dist.argmin())
+    return int(dist[k]) if dist[k] <= idx.max_distance else None
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--history", type=int, default=60_000)
+    ap.add_argument("--queries", type=int, default=1000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+    rnd = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "posted_index.bin")
+        now = time.time()
+        vocab = vocabulary()
+        posted = list({story(rnd, vocab) for _ in range(args.history)})
+        fps = [simhash(t) for t in posted]
+        recs = np.array([(fp, now - (len(fps) - i) * 80, b"rss") for i, fp in enumerate(fps)], dtype=posted_index.REC)
+        recs.tofile(path)
+
+        t0 = time.perf_counter()
+        idx = PostedIndex(path)
+        load_ms = (time.perf_counter() - t0) * 1000
+        print(f"geçmiş {len(idx)} kayıt ({os.path.getsize(path) / 1e6:.1f} MB), yükleme + bantlar {load_ms:.1f} ms,"
+              f" {len(idx.bands)} bant, uzaklık <= {idx.max_distance}")
+
+        queries = []
+        for name, fn in VARIANTS.items():
+            queries += [(name, fn(rnd.choice(posted), rnd)) for _ in range(args.queries)]
+        known = set(posted)
+        fresh = [t for t in (story(rnd, vocab) for _ in range(args.queries * 2)) if t not in known][:args.queries]
+        queries += [("yeni metin", t) for t in fresh]
+
+        found, times, agree = {}, [], 0
+        for name, text in queries:
+            t0 = time.perf_counter()
+            m = idx.find(text)
+            times.append(time.perf_counter() - t0)
+            found.setdefault(name, []).append(m is not None)
+            agree += (m.distance if m else None) == full_scan(idx, text)
+        t0 = time.perf_counter()
+        for _, text in queries[:500]:
+            full_scan(idx, text)
+        scan_ms = (time.perf_counter() - t0) / 500 * 1000
+
+        times.sort()
+        pct = lambda p: times[int(p * (len(times) - 1))] * 1000
+        print(f"kontrol: p50 {pct(0.5):.3f} ms | p99 {pct(0.99):.3f} ms | tam tarama {scan_ms:.3f} ms"
+              f" | tam taramayla aynı sonuç {agree}/{len(queries)}")
+        for name, hits in found.items():
+            label = "yanlış eşleşme" if name == "yeni metin" else "yakalandı"
+            print(f"  {name:12} {label}: {sum(hits)}/{len(hits)} ({sum(hits) / len(hits):.1%})")
+
+if __name__ == "__main__":
+    main()
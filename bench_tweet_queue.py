@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_tweet_queue.py - auto_tweet --mode next kuyruğu: eski yol (tüm dosyayı oku, kalanı
+yeniden yaz) ile imleçli/indeksli TweetQueue karşılaştırması. Her çıkarma yeni bir çalıştırma
+gibi sıfırdan açılır (her cron çalıştırması tek tweet atar).
+- Düzenleme kontrolü: birkaç satır gönderildikten sonra kuyruk dosyasının başı elle
+  düzenlenir / gönderilmiş satır silinir / satırlar yer değiştirir; gönderilmiş hiçbir satır
+  tekrar sıraya girmemeli, bekleyenlerin hepsi (düzenlenmiş haliyle) bir kez gelmeli.
+
+Kullanım:
+    python bench_tweet_queue.py                    # 300k satır, 20 çıkarma
+    python bench_tweet_queue.py --lines 1000000 --scheduled 0.1
+"""
+
+import io
+import os
+import time
+import random
+import argparse
+import tempfile
+from contextlib import redirect_stdout
+
+from tweet_queue import TweetQueue
+
+def make_file(path, n, scheduled, rnd):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n):
+            text = f"Kuyruk satırı {i}: " + "haber metni " * rnd.randint(3, 15)
+            if rnd.random() < scheduled:
+                day = rnd.randint(1, 28)
+                f.write(f"[2020-01-{day:02d} 09:00] {text}\n")
+            else:
+                f.write(text + "\n")
+
+def old_dequeue(path, sent):
+    # auto_tweet.py'nin eski read_next_tweet + save_remaining_and_archive yolu
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f if line.strip() != ""]
+    if not lines:
+        return None
+    with open(path, "w", encoding="utf-8") as f:
+        for l in lines[1:]:
+            f.write(l + "\n")
+    with open(sent, "a", encoding="utf-8") as af:
+        af.write(lines[0] + "\n")
+    return lines[0]
+
+def new_dequeue(path, sent):
+    q = TweetQueue(path, sent)
+    e = q.peek()
+    if e is not None:
+        q.commit(e)
+    return e
+
+EDITS = {
+    # gönderilmiş: a, b, [..] c (zamanlı); bekleyen: d, e, f
+    "başa yeni satır eklendi": lambda ls: ["en başa yeni satır\n"] + ls,
+    "bekleyen satır düzeltildi": lambda ls: ls[:4] + ["D düzeltildi\n"] + ls[5:],
+    "gönderilmiş satır silindi": lambda ls: ls[1:],
+    "satırlar yer değiştirdi": lambda ls: [ls[4], ls[0], ls[5], ls[1]] + ls[2:4] + ls[6:],
+    "editör yeniden yazdı": lambda ls: [l.rstrip("\n") + "\r\n" for l in ls],
+}
+
+def check_edits(d):
+    """Her düzenleme için: gönderilmişler tekrar gelmiyor, bekleyenler bir kez geliyor mu?"""
+    base = ["satır a\n", "satır b\n", "[2020-01-01 09:00] satır c\n", "\n", "satır d\n", "satır e\n", "satır f\n"]
+    fails = []
+    for name, edit in EDITS.items():
+        path, sent = os.path.join(d, "edit.txt"), os.path.join(d, "edit_sent.txt")
+        for p in (path, sent, path + ".idx", path + ".cursor"):
+            if os.path.exists(p):
+                os.remove(p)
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(base)
+        first = [new_dequeue(path, sent).text for _ in range(3)]    # c (vadesi geçmiş), a, b
+        edited = edit(base)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.writelines(edited)
+        old = time.time() - 60                                      # satırsonu beklemesi olmasın
+        os.utime(path, (old, old))
+        rest = []
+        with redirect_stdout(io.StringIO()):                       # [KUYRUK] uyarısı
+            for _ in range(len(edited)):
+                e = new_dequeue(path, sent)
+                if e is None:
+                    break
+                rest.append(e.text)
+        want = [l.strip() for l in edited if l.strip() and l.strip() not in ("satır a", "satır b", "[2020-01-01 09:00] satır c")]
+        if sorted(rest) != sorted(want) or set(rest) & set(first):
+            fails.append(f"{name}: {rest} (beklenen {want})")
+    return fails
+
+def timed(fn, *a):
+    t0 = time.perf_counter()
+    out = fn(*a)
+    return out, time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=300_000)
+    ap.add_argument("--dequeues", type=int, default=20)
+    ap.add_argument("--scheduled", type=float, default=0.0, help="Zamanlı satır oranı (geçmiş tarihli)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        fails = check_edits(d)
+        print(f"düzenleme kontrolü: {len(EDITS) - len(fails)}/{len(EDITS)} doğru")
+        for f in fails:
+            print(f"  YANLIŞ {f}")
+        old_path, new_path = os.path.join(d, "old.txt"), os.path.join(d, "new.txt")
+        make_file(old_path, args.lines, args.scheduled, random.Random(args.seed))
+        make_file(new_path, args.lines, args.scheduled, random.Random(args.seed))
+        size = os.path.getsize(new_path)
+        print(f"{args.lines} satır, {size / 1e6:.1f} MB, zamanlı oran {args.scheduled}")
+
+        old_times = [timed(old_dequeue, old_path, os.path.join(d, "old_sent.txt"))[1] for _ in range(args.dequeues)]
+        _, first = timed(new_dequeue, new_path, os.path.join(d, "new_sent.txt"))
+        new_times = [timed(new_dequeue, new_path, os.path.join(d, "new_sent.txt"))[1] for _ in range(args.dequeues)]
+        with open(new_path, "a", encoding="utf-8") as f:
+            f.write("sona eklenen satır\n")
+        _, after_append = timed(new_dequeue, new_path, os.path.join(d, "new_sent.txt"))
+        _, compact = timed(TweetQueue(new_path, os.path.join(d, "new_sent.txt")).compact)
+
+        ms = lambda xs: sum(xs) / len(xs) * 1000
+        print(f"eski yol:  {ms(old_times):9.2f} ms/çıkarma (oku + kalanı yeniden yaz)")
+        print(f"TweetQueue: {ms(new_times):8.3f} ms/çıkarma (ilk açılışta tarama {first * 1000:.1f} ms,"
+              f" ekleme sonrası {after_append * 1000:.2f} ms)")
+        print(f"hızlanma:  {ms(old_times) / ms(new_times):9.0f}x | compact {compact * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
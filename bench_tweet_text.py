@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+bench_tweet_text.py - tweet_text: X ağırlıklı uzunluk + ortak kısaltıcı.
+- Bilinen sayımlar: X'in (twitter-text v3) verdiği değerlerle karşılaştırma.
+- Bulanık test: rastgele Türkçe metin + bağlantı + emoji (ZWJ aile, ten rengi, bayrak,
+  tuş başlığı) + CJK + çok uzun kelime + satır sonu; her çıktı için
+  * weighted_length(çıktı) <= sınır (compose'da kuyruk dahil),
+  * sığan metin aynen döner, fit(fit(x)) == fit(x),
+  * çıktı (… hariç) girdinin önekidir, bağlantı/emoji dizisi bölünmez.
+- Eski beş kısaltıcı (rss clamp_text, bundle natural_truncate, rewriter clamp_280, repost
+  267 kesimi) aynı metinlerde: kaç çıktı X sayımıyla 280'i aşıyordu, süre.
+
+Kullanım:
+    python bench_tweet_text.py
+    python bench_tweet_text.py --n 20000 --seed 7
+"""
+
+import re
+import time
+import random
+import argparse
+
+import tweet_text
+from tweet_text import weighted_length, fit, compose, MAX_LEN, URL_RE
+
+KNOWN = [
+    ("merhaba dünya", 13),
+    ("Çağrı Işık öğün şüphe", 21),
+    ("https://www.ornek.com.tr/gundem/2024/05/cok-uzun-bir-haber-basligi-burada-123456", 23),
+    ("Bakın: https://t.co/abc ve http://x.com/a/b?c=d", 7 + 23 + 4 + 23),
+    ("日本語のテキスト", 16),
+    ("😀", 2), ("👍🏽", 2), ("👨‍👩‍👧‍👦", 2), ("🇹🇷", 2), ("1️⃣", 2), ("❤️", 2), ("🏴󠁧󠁢󠁳󠁣󠁴󠁿", 2),
+    ("Son dakika…", 12), ("a — b – c “d”", 13), ("Привет", 6), ("مرحبا", 5),
+]
+WORDS = ("deprem seçim ekonomi enflasyon açıklama bakanlık Türkiye İstanbul Ankara milletvekili "
+         "çalışma görüşme öğretmen ışık şehir gazeteci belediye başkanı sağlık ülke dünya").split()
+EMOJI = ["😀", "👍🏽", "👨‍👩‍👧‍👦", "🇹🇷", "🇺🇸", "1️⃣", "#️⃣", "❤️", "🔥", "🏴󠁧󠁢󠁳󠁣󠁴󠁿", "🧑🏿‍🚀"]
+PUNCT = [".", ",", ";", ":", "!", "?", "…", " —", "\n", ".”", ""]
+
+def random_text(rnd):
+    parts = []
+    for _ in range(rnd.randrange(5, 90)):
+        r = rnd.random()
+        if r < 0.05:
+            parts.append(f"https://{rnd.choice(['ornek.com', 'haber.com.tr', 't.co'])}/{'x' * rnd.randrange(1, 120)}")
+        elif r < 0.07:
+            parts.append(f"{rnd.choice(['ornek', 'site', 'a'])}.com.tr")
+        elif r < 0.14:
+            parts.append("".join(rnd.choice(EMOJI) for _ in range(rnd.randrange(1, 4))))
+        elif r < 0.17:
+            parts.append("".join(chr(rnd.randrange(0x4E00, 0x9FFF)) for _ in range(rnd.randrange(1, 12))))
+        elif r < 0.19:
+            parts.append("ç" * rnd.randrange(30, 400))       # boşluksuz uzun dizi
+        else:
+            parts.append(rnd.choice(WORDS))
+        parts[-1] += rnd.choice(PUNCT) if rnd.random() < 0.25 else ""
+    return " ".join(parts)
+
+# ---- eski kısaltıcılar (karşılaştırma için birebir) ----
+def old_clamp_text(s, maxlen=280):
+    s = s.strip()
+    if len(s) <= maxlen:
+        return s
+    cut = s[:maxlen]
+    m = re.search(r"[\.!\?…—-]\s*(?!.*[\.!\?…—-])", cut)
+    if m:
+        return cut[:m.end()].rstrip()
+    if " " in cut:
+        return cut.rsplit(" ", 1)[0] + "…"
+    return cut + "…"
+
+def old_natural_truncate(text, max_len):
+    if len(text) <= max_len:
+        return text
+    cut = text[:max_len]
+    m = re.search(r"[\.!?…;:\-–—,]\s+\S*?$", cut)
+    if m:
+        cut = cut[:m.start()].rstrip()
+    elif " " in cut:
+        cut = cut[:cut.rfind(" ")].rstrip()
+    return (cut + "…").rstrip()
+
+def old_compose_tweet(full, url):
+    tail = f" — Kaynak: ornek.com {url}"
+    return f"{old_natural_truncate(full, max(60, MAX_LEN - len(tail) - 1))}{tail}"
+
+def old_clamp_280(text):
+    return text if len(text) <= MAX_LEN else text[:MAX_LEN - 1] + "…"
+
+def old_repost(text):
+    text = text.replace("\n", " ").strip()
+    return text[:267] + "..." if len(text) > 270 else text
+
+def atoms(text):
+    """Bölünmemesi gereken parçaların (bağlantı, emoji dizisi) başlangıç-bitiş aralıkları."""
+    spans = [(m.start(), m.end()) for m in URL_RE.finditer(text)]
+    i, n = 0, len(text)
+    while i < n:
+        j, _ = tweet_text._token(text, i, n)
+        if j - i > 1:
+            spans.append((i, j))
+        i = j
+    return spans
+
+def check(text, out, limit, tail=""):
+    errs = []
+    if weighted_length(out) > limit:
+        errs.append(f"uzun ({weighted_length(out)})")
+    if weighted_length(text.strip() + tail) <= limit and out != text.strip() + tail:
+        errs.append("sığan metin değişti")
+    body = out[:len(out) - len(tail)] if tail else out
+    core = body[:-1] if body.endswith(tweet_text.ELLIPSIS) and not text.strip().startswith(body) else body
+    if not text.strip().startswith(core):
+        errs.append("önek değil")
+    elif core != text.strip():
+        cut = len(core)
+        if any(a < cut < b for a, b in atoms(text.strip())):
+            errs.append("bağlantı/emoji bölündü")
+    if not tail and fit(out, limit) != out:
+        errs.append("fit(fit(x)) != fit(x)")
+    return errs
+
+def timed(fn, texts):
+    t0 = time.perf_counter()
+    out = [fn(t) for t in texts]
+    return out, time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    bad = 0
+    for text, want in KNOWN:
+        got = weighted_length(text)
+        bad += got != want
+        if got != want:
+            print(f"  YANLIŞ sayım: {text!r} {got} (X: {want})")
+    print(f"bilinen sayımlar: {len(KNOWN) - bad}/{len(KNOWN)} doğru")
+
+    rnd = random.Random(args.seed)
+    texts = [random_text(rnd) for _ in range(args.n)]
+    url = "https://www.ornek.com/gundem/" + "a" * 60
+    tail = f" — Kaynak: ornek.com {url}"
+    fails = {}
+    boundary = {"cümle": 0, "yan cümle/kelime": 0, "karakter": 0, "sığdı": 0, "boş": 0}
+    for text in texts:
+        limit = rnd.choice((MAX_LEN, MAX_LEN, 150, 40, 8, 2, 1))
+        out = fit(text, limit)
+        for e in check(text, out, limit):
+            fails.setdefault(e, text)
+        for e in check(text, compose(text, tail), MAX_LEN, tail):
+            fails.setdefault("compose: " + e, text)
+        if out == text.strip():
+            boundary["sığdı"] += 1
+        elif not out:
+            boundary["boş"] += 1
+        elif not out.endswith(tweet_text.ELLIPSIS):
+            boundary["cümle"] += 1
+        elif text.strip()[len(out) - 1:len(out)].isspace() or text.strip()[len(out) - 1:len(out)] in ",;:—–-":
+            boundary["yan cümle/kelime"] += 1
+        else:
+            boundary["karakter"] += 1
+    print(f"\nbulanık test ({args.n} metin, fit + compose): {'hata yok' if not fails else f'{len(fails)} hata türü'}")
+    for e, text in fails.items():
+        print(f"  {e}: {text[:120]!r}")
+    print("  kesim: " + ", ".join(f"{k} {v}" for k, v in boundary.items()))
+
+    print(f"\neski kısaltıcılar (aynı {args.n} metin, X sayımıyla > 280 olan çıktı):")
+    rows = [
+        ("rss clamp_text", old_clamp_text, lambda t: fit(t)),
+        ("bundle compose_tweet", lambda t: old_compose_tweet(t, url), lambda t: compose(t, tail)),
+        ("rewriter clamp_280", old_clamp_280, lambda t: fit(t)),
+        ("repost 267 kesimi", old_repost, lambda t: fit(t.replace("\n", " "))),
+    ]
+    for name, old, new in rows:
+        o, t_old = timed(old, texts)
+        n, t_new = timed(new, texts)
+        over_old = sum(weighted_length(x) > MAX_LEN for x in o)
+        over_new = sum(weighted_length(x) > MAX_LEN for x in n)
+        print(f"  {name:22} eski {over_old:5} aşım {t_old / len(texts) * 1e6:6.1f} µs | "
+              f"yeni {over_new:3} aşım {t_new / len(texts) * 1e6:6.1f} µs")
+    _, t_len = timed(weighted_length, texts)
+    print(f"\nweighted_length: {t_len / len(texts) * 1e6:.1f} µs/metin "
+          f"(ort. {sum(map(len, texts)) / len(texts):.0f} karakter)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+deadline.py - Çalıştırma başına zaman bütçesi.
+- Deadline(saniye, reserve): bitişe kalan süre; reserve son durum yazımı için ayrılır
+  (verilmezse bütçenin %10'u, en çok DEFAULT_RESERVE).
+- clip(timeout): ağ zaman aşımını kalan kullanılabilir süreye kısar.
+- Süresi dolan iş DeadlineExceeded ile kesilir (host hatası sayılmaz).
+saniye None ise bütçe sınırsızdır.
+"""
+
+import time
+
+DEFAULT_RESERVE = 10.0
+
+class DeadlineExceeded(Exception):
+    pass
+
+class Deadline:
+    def __init__(self, seconds=None, reserve=None):
+        self.start = time.monotonic()
+        self.end = self.start + seconds if seconds else None
+        if not seconds:
+            reserve = 0.0
+        elif reserve is None:
+            reserve = min(DEFAULT_RESERVE, seconds * 0.1)
+        self.reserve = reserve
+
+    def remaining(self):
+        """Bitişe kalan toplam süre (reserve dahil)."""
+        return float("inf") if self.end is None else self.end - time.monotonic()
+
+    def left(self):
+        """İşe ayrılabilecek süre (reserve hariç)."""
+        return self.remaining() - self.reserve
+
+    def expired(self):
+        return self.left() <= 0
+
+    def clip(self, timeout, floor=0.5):
+        """timeout'u kalan süreye kısar; floor'un altında kalıyorsa DeadlineExceeded."""
+        left = self.left()
+        if left < floor:
+            raise DeadlineExceeded(f"bütçe doldu ({max(left, 0):.1f} sn kaldı)")
+        return min(timeout, left) if timeout else left
+
+    def elapsed(self):
+        return time.monotonic() - self.start
+
+    def __str__(self):
+        if self.end is None:
+            return f"{self.elapsed():.1f} sn (sınırsız)"
+        return f"{self.elapsed():.1f} sn / kalan {max(self.remaining(), 0):.1f} sn"
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+feed_stream.py - Artımlı (iterparse) RSS/Atom okuyucu.
+- Yanıt akış halinde okunur; her <item>/<entry> bitince kompakt bir FeedEntry üretilir
+  ve eleman bellekten atılır.
+- Bilinen bir uid'ye ya da beslemenin yayın zamanı filigranının gerisine gelince durur;
+  bağlantı kapatılır, beslemenin geri kalanı indirilmez/ayrıştırılmaz.
+- Erken durma sadece yeniden eskiye sıralı olduğu bilinen beslemelerde (order="desc") açıktır;
+  sıralama ilk tam okumada detect_order ile öğrenilir.
+- Önceki çalışmada ertelenen (okunmuş ama işlenmemiş) uid'ler pending ile verilir; hepsi
+  bulunana kadar erken durulmaz, yoksa filigranın gerisinde kalıp kaybolurlardı.
+"""
+
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+import requests
+from lxml import etree
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+ENTRY_TAGS = ("item", RSS1 + "item", ATOM + "entry")
+
+class FeedEntry:
+    __slots__ = ("uid", "title", "link", "summary", "published", "content")
+
+    def __init__(self, uid, title, link, summary, published, content=""):
+        self.uid = uid
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published = published  # epoch sn ya da None
+        self.content = content      # content:encoded / Atom content (HTML olabilir)
+
+    def __repr__(self):
+        return f"FeedEntry({self.uid!r}, {self.title[:40]!r})"
+
+def parse_date(s):
+    s = (s or "").strip()
+    if not s:
+        return None
+    try:
+        return parsedate_to_datetime(s).timestamp()  # RSS: RFC 822
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return datetime.fromisoformat(s.replace("Z", "+00:00")).timestamp()  # Atom: ISO 8601
+    except ValueError:
+        return None
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+def _text(el):
+    return "".join(el.itertext()).strip()
+
+def to_entry(el):
+    """<item>/<entry> elemanından FeedEntry."""
+    guid = title = link = summary = content = published = updated = ""
+    for child in el:
+        tag = child.tag
+        name = _local(tag)
+        if name in ("guid", "id"):
+            guid = _text(child)
+        elif name == "title":
+            title = _text(child)
+        elif name == "link":
+            # Atom: <link rel="alternate" href="...">; RSS: <link>metin</link>
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                link = link or href
+            elif not href:
+                link = link or _text(child)
+        elif name in ("description", "summary", "subtitle"):
+            summary = summary or _text(child)
+        elif tag == CONTENT_ENCODED or (tag == ATOM + "content"):
+            content = _text(child)
+        elif name in ("pubDate", "published") or tag == DC_DATE:
+            published = _text(child)
+        elif name == "updated":
+            updated = _text(child)
+    return FeedEntry(guid or link, title, link, summary or content, parse_date(published or updated), content)
+
+def iter_entries(source, seen=(), watermark=None, order=None, limit=None, pending=()):
+    """
+    source: dosya benzeri (bayt) akış. Dönen her FeedEntry yeni (seen'de olmayan) bir kayıttır.
+    order="desc" ise bilinen uid'de / filigran gerisinde durur; limit her durumda uygulanır.
+    pending: önceki çalışmada ertelenen uid'ler; hepsi görülene kadar erken durulmaz ve
+    limit bunlara uygulanmaz (filigran/bilinen uid gerisinde kalsalar da döner).
+    """
+    early = order == "desc"
+    wanted = set(pending)
+    count = 0
+    for _, el in etree.iterparse(source, events=("end",), tag=ENTRY_TAGS, recover=True, huge_tree=True):
+        entry = to_entry(el)
+        # belleği serbest bırak: eleman + önceki kardeşler
+        el.clear()
+        parent = el.getparent()
+        while parent is not None and el.getprevious() is not None:
+            del parent[0]
+
+        if not entry.uid:
+            continue
+        if entry.uid in seen:
+            if early and not wanted:
+                return
+            continue
+        deferred = entry.uid in wanted
+        wanted.discard(entry.uid)
+        if not deferred:
+            if early and watermark and entry.published is not None and entry.published < watermark:
+                if not wanted:
+                    return
+                continue
+            if limit and count >= limit:
+                continue  # limit doldu, sadece ertelenenler aranıyor
+            count += 1
+        yield entry
+        if limit and count >= limit and not wanted:
+            return
+
+def detect_order(entries):
+    """Yayın zamanlarından sıralama: "desc" (yeni başta), "asc" ya da None."""
+    ts = [e.published for e in entries if e.published is not None]
+    if len(ts) < 2:
+        return None
+    return "asc" if ts[0] < ts[-1] else "desc"
+
+def read_feed(url, seen=(), watermark=None, order=None, limit=None, headers=None, timeout=12, session=None,
+              pending=()):
+    """
+    Beslemeyi akış halinde oku; yeni kayıtları (belgedeki sırayla) liste olarak döndür.
+    Erken durunca bağlantı kapanır ve kalan bayt indirilmez.
+    """
+    get = (session or requests).get
+    t0 = time.perf_counter()
+    with get(url, headers=headers, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        entries = list(iter_entries(r.raw, seen, watermark, order, limit, pending))
+    return entries, time.perf_counter() - t0
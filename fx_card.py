@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fx_card.py - Kur kartı görseli (çıktı fx_card_out.png; depodaki fx_card.png yerleşim örneği).
+- Arka plan bir kez çözülür, sabit katman (başlık + etiketler) önbellekte tutulur.
+- Yazılar glif atlasından (karakter başına önbelleklenmiş maske) basılır.
+- Art arda çizimlerde sadece değeri değişen hücreler yeniden çizilir.
+"""
+
+import os
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+
+from PIL import Image, ImageDraw, ImageFont
+
+BG_PATH = os.environ.get("FX_BG_PATH", os.path.join("assets", "assets", "fx_bg.jpg"))
+FONT_PATH = os.environ.get("FX_FONT_PATH", "")
+CARD_PATH = os.environ.get("FX_CARD_PATH", "fx_card_out.png")   # gitignore'da; örnek üzerine yazılmaz
+
+SIZE = (700, 400)
+BG_COLOR = (16, 18, 26)
+TITLE = "Döviz & Altın"
+TR_TZ = timezone(timedelta(hours=3))
+
+# Yerleşim (fx_card.png örneğine göre)
+TITLE_POS, TITLE_SIZE = (40, 48), 36
+ROW_Y0, ROW_H = 130, 60
+LABEL_X, VALUE_X, CHANGE_RIGHT = 60, 300, 685
+TEXT_SIZE, CHANGE_SIZE, DATE_SIZE = 32, 26, 22
+VALUE_BOX = (VALUE_X, 560)        # x0, x1
+CHANGE_BOX = (560, CHANGE_RIGHT + 10)
+DATE_BOX = (40, SIZE[1] - 40, 400, SIZE[1] - 8)
+
+WHITE = (255, 255, 255)
+TITLE_COLOR = (0, 230, 118)
+UP_COLOR = (0, 200, 110)
+DOWN_COLOR = (255, 99, 99)
+FLAT_COLOR = (170, 170, 170)
+DATE_COLOR = (170, 170, 170)
+
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "C:\\Windows\\Fonts\\arial.ttf",
+]
+
+# --- Önbellekler ---
+@lru_cache(maxsize=None)
+def load_font(size):
+    for path in [FONT_PATH] + FONT_CANDIDATES:
+        if path and os.path.exists(path):
+            return ImageFont.truetype(path, size)
+    return ImageFont.load_default(size=size)
+
+@lru_cache(maxsize=1)
+def load_background():
+    """Arka planı bir kez çöz; bozuk/eksikse düz renge düş."""
+    try:
+        with Image.open(BG_PATH) as im:
+            return im.convert("RGB").resize(SIZE)
+    except Exception:
+        return Image.new("RGB", SIZE, BG_COLOR)
+
+@lru_cache(maxsize=None)
+def glyph(ch, size):
+    """Tek karakterin maskesi ve ilerleme genişliği: (mask, advance)."""
+    font = load_font(size)
+    ascent, descent = font.getmetrics()
+    w = max(1, int(round(font.getlength(ch))))
+    mask = Image.new("L", (w + 4, ascent + descent), 0)
+    ImageDraw.Draw(mask).text((0, 0), ch, font=font, fill=255)
+    return mask, font.getlength(ch)
+
+def text_width(text, size):
+    return sum(glyph(ch, size)[1] for ch in text)
+
+def draw_text(canvas, xy, text, size, color):
+    x, y = xy
+    for ch in text:
+        mask, adv = glyph(ch, size)
+        if not ch.isspace():
+            canvas.paste(color, (int(round(x)), y), mask)
+        x += adv
+
+@lru_cache(maxsize=8)
+def static_layer(labels, title=TITLE):
+    """Arka plan + başlık + satır etiketleri (değerler hariç)."""
+    canvas = load_background().copy()
+    draw_text(canvas, TITLE_POS, title, TITLE_SIZE, TITLE_COLOR)
+    for i, label in enumerate(labels):
+        draw_text(canvas, (LABEL_X, ROW_Y0 + i * ROW_H), label, TEXT_SIZE, WHITE)
+    return canvas
+
+# --- Hücreler ---
+def format_price(x):
+    if x is None:
+        return "-"
+    return f"{x:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+def format_change(pct):
+    if pct is None:
+        return "", FLAT_COLOR
+    if pct > 0:
+        return f"▲%{format_price(pct)}", UP_COLOR
+    if pct < 0:
+        return f"▼%{format_price(-pct)}", DOWN_COLOR
+    return f"%{format_price(0.0)}", FLAT_COLOR
+
+def build_cells(data, changes=None, date_text=None, rows=None):
+    """Kartın değişken hücreleri: {kutu: (metin, x, y, boyut, renk)}."""
+    changes = changes or {}
+    rows = rows or [k for k, v in data.items() if v is not None][:4]
+    cells = {}
+    for i, label in enumerate(rows):
+        y = ROW_Y0 + i * ROW_H
+        cells[(VALUE_BOX[0], y, VALUE_BOX[1], y + ROW_H)] = (
+            format_price(data.get(label)), VALUE_X, y, TEXT_SIZE, WHITE)
+        ch, color = format_change(changes.get(label))
+        cx = CHANGE_RIGHT - int(text_width(ch, CHANGE_SIZE))
+        cells[(CHANGE_BOX[0], y, CHANGE_BOX[1], y + ROW_H)] = (ch, cx, y + 4, CHANGE_SIZE, color)
+    if date_text is None:
+        date_text = datetime.now(TR_TZ).strftime("%d.%m.%Y %H:%M")
+    cells[DATE_BOX] = (date_text, DATE_BOX[0], DATE_BOX[1], DATE_SIZE, DATE_COLOR)
+    return tuple(rows), cells
+
+# --- Çizim ---
+_last = {"rows": None, "canvas": None, "cells": {}}
+
+def render_card(data, changes=None, date_text=None, rows=None):
+    """
+    Kartı çiz ve (aynı) Image nesnesini döndür.
+    Satırlar önceki çizimle aynıysa sadece metni değişen hücreler arka plandan
+    geri yüklenip yeniden basılır.
+    """
+    rows, cells = build_cells(data, changes, date_text, rows)
+    base = static_layer(rows)
+    if _last["rows"] != rows or _last["canvas"] is None:
+        _last.update(rows=rows, canvas=base.copy(), cells={})
+    canvas, prev = _last["canvas"], _last["cells"]
+
+    for box, cell in cells.items():
+        if prev.get(box) == cell:
+            continue
+        canvas.paste(base.crop(box), box[:2])
+        text, x, y, size, color = cell
+        draw_text(canvas, (x, y), text, size, color)
+    _last["cells"] = cells
+    return canvas
+
+def save_card(data, changes=None, path=CARD_PATH, date_text=None):
+    render_card(data, changes, date_text).save(path, optimize=False)
+    return path
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fx_engine.py - Config tabanlı çok sembollü kur motoru (assets/fx_symbols.json).
+- "quotes": sağlayıcılardan çekilen ham semboller (Stooq adı, zorunlu mu).
+- "derived": ham sembollerden türetilenler; tek geçişte hesaplanır.
+    product: {"xauusd": 1, "usdtry": 1}  -> scale * Π v^üs   (gram altın, çaprazlar)
+    sum:     {"usdtry": 0.5, "eurtry": 0.5} -> scale * Σ v*ağırlık (sepet)
+  scale/divisor opsiyonel: scale / divisor çarpanı.
+- "display": tweet/kartta gösterilecekler (key, label, section: kur|ek, unit).
+- derive düz Python'dur: numpy bağımlılıklarda olsa da bu boyutta (birkaç satır) dizi kurma
+  maliyeti hesabı aşar (5 satırda ~5 µs'ye karşı numpy ~40 µs).
+Yeni sembol/enstrüman eklemek için sadece config düzenlenir.
+"""
+
+import os
+import json
+from functools import lru_cache
+
+from fx_quotes import get_quotes
+
+CONFIG_PATH = os.environ.get("FX_SYMBOLS_PATH", os.path.join("assets", "fx_symbols.json"))
+
+def load_config(path=CONFIG_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+    if not cfg.get("quotes"):
+        raise ValueError(f"{path}: 'quotes' boş.")
+    return cfg
+
+def compile_engine(cfg):
+    """
+    Türetilmiş enstrümanları ham sembol vektörü üzerinde seyrek katsayı
+    satırlarına derle: (key, tür, ((indeks, katsayı), ...), ölçek).
+    """
+    base = [q["key"] for q in cfg["quotes"]]
+    index = {k: i for i, k in enumerate(base)}
+    rows = []
+    for d in cfg.get("derived", []):
+        if "product" in d:
+            kind, terms = "product", d["product"]
+        elif "sum" in d:
+            kind, terms = "sum", d["sum"]
+        else:
+            raise ValueError(f"{d.get('key')}: 'product' ya da 'sum' gerekli.")
+        unknown = [k for k in terms if k not in index]
+        if unknown:
+            raise ValueError(f"{d.get('key')}: bilinmeyen sembol(ler): {', '.join(unknown)}")
+        scale = float(d.get("scale", 1.0)) / float(d.get("divisor", 1.0))
+        rows.append((d["key"], kind, tuple((index[k], float(c)) for k, c in terms.items()), scale))
+    return {
+        "spec": cfg["quotes"],
+        "base": base,
+        "rows": rows,
+        "display": cfg.get("display", []),
+    }
+
+@lru_cache(maxsize=1)
+def get_engine(path=CONFIG_PATH):
+    return compile_engine(load_config(path))
+
+def derive(engine, quotes):
+    """Ham kotasyonlardan tüm değerleri tek geçişte hesapla; eksik girdili satırlar atlanır."""
+    vec = [quotes.get(k) for k in engine["base"]]
+    out = {k: v for k, v in zip(engine["base"], vec) if v is not None}
+    for key, kind, terms, scale in engine["rows"]:
+        acc = scale if kind == "product" else 0.0
+        for i, c in terms:
+            v = vec[i]
+            if v is None or (kind == "product" and v <= 0):
+                break
+            if kind == "sum":
+                acc += v * c
+            elif c == 1.0:
+                acc *= v
+            elif c == -1.0:
+                acc /= v
+            else:
+                acc *= v ** c
+        else:
+            out[key] = acc if kind == "product" else acc * scale
+    return out
+
+def snapshot(engine=None):
+    """Tüm ham + türetilmiş değerler -> ({key: değer}, kaynak, fiyatların alınma zamanı)."""
+    engine = engine or get_engine()
+    quotes, source, ts = get_quotes(engine["spec"])
+    return derive(engine, quotes), source, ts
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fx_quotes.py - Kur sağlayıcı katmanı.
+- Stooq ve er-api aynı anda sorgulanır, ilk tam/geçerli cevap kazanır.
+- Stooq'ta tüm semboller parçalı (chunk) toplu CSV isteklerine bölünür.
+- er-api tek `latest/TRY` çağrısıyla tüm çaprazları verir.
+- Sonuç diskte TTL'li önbellekte tutulur; TTL içindeki koşular ağa çıkmaz. Önbellek spec'in
+  özetiyle anahtarlanır; spec değişince (sembol eklendi/çıkarıldı) kayıt ıskalanır.
+Sembol listesi (spec) fx_engine'den gelir: [{"key": "usdtry", "stooq": "usdntry", "required": true}, ...]
+"""
+
+import os
+import csv
+import json
+import time
+import hashlib
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import http_pool
+
+# --- Ayarlar ---
+CACHE_PATH = os.environ.get("FX_CACHE_PATH", "fx_cache.json")
+CACHE_TTL = int(os.environ.get("FX_CACHE_TTL", "300"))  # sn
+TIMEOUT = 10
+GRACE = 1.5  # kazanan geldikten sonra opsiyonel alanlar için kısa bekleme (sn)
+CHUNK_SIZE = int(os.environ.get("FX_STOOQ_CHUNK", "20"))  # Stooq isteği başına sembol
+
+# Kanonik anahtarlar: "usdtry" = 1 USD kaç TRY
+def required_keys(spec):
+    return tuple(q["key"] for q in spec if q.get("required"))
+
+def optional_keys(spec):
+    return tuple(q["key"] for q in spec if not q.get("required"))
+
+# --- Sağlayıcılar ---
+STOOQ_URL = "https://stooq.com/q/l/?s={symbols}&i=d"
+
+def fetch_stooq_latest(symbols):
+    url = STOOQ_URL.format(symbols=",".join(symbols))
+    r = http_pool.get(url, timeout=TIMEOUT)
+    r.raise_for_status()
+    out = {}
+    for row in csv.reader(r.text.strip().splitlines()):
+        if len(row) < 7:
+            continue
+        sym = row[0].strip().lower()
+        try:
+            close = float(row[6])
+        except Exception:
+            continue
+        out[sym] = close
+    return out
+
+def stooq_quotes(spec, chunk_size=CHUNK_SIZE):
+    """Tüm Stooq sembollerini chunk_size'lık toplu isteklerle (paralel) çek."""
+    symbols = {q["stooq"].lower(): q["key"] for q in spec if q.get("stooq")}
+    names = list(symbols)
+    chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+    if not chunks:
+        return {}
+    raw = {}
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        for part in pool.map(fetch_stooq_latest, chunks):
+            raw.update(part)
+    return {key: raw[sym] for sym, key in symbols.items() if raw.get(sym)}
+
+ERAPI_URL = "https://open.er-api.com/v6/latest/TRY"
+
+def erapi_quotes(spec):
+    """Tek çağrı: rates[X] = 1 TRY kaç X. Çapraz = rates[quote] / rates[base]."""
+    r = http_pool.get(ERAPI_URL, timeout=TIMEOUT)
+    r.raise_for_status()
+    data = r.json()
+    if data.get("result") != "success":
+        raise RuntimeError("er-api fail")
+    rates = data.get("rates") or {}
+    rates.setdefault("TRY", 1.0)
+    out = {}
+    for q in spec:
+        key = q["key"]
+        if len(key) != 6 or not key.isalpha():
+            continue
+        base, quote = key[:3].upper(), key[3:].upper()
+        if rates.get(base) and rates.get(quote):
+            out[key] = float(rates[quote]) / float(rates[base])
+    return out
+
+PROVIDERS = [
+    ("stooq", stooq_quotes),
+    ("er-api", erapi_quotes),
+]
+
+# --- Önbellek ---
+def spec_digest(spec):
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+def load_cache(spec, ttl=CACHE_TTL):
+    """Taze ve aynı spec ile yazılmış kayıt; yoksa None (özeti olmayan eski kayıt da ıskalanır)."""
+    if ttl <= 0 or not os.path.exists(CACHE_PATH):
+        return None
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    if data.get("spec") != spec_digest(spec) or time.time() - float(data.get("ts", 0)) > ttl:
+        return None
+    return data
+
+def save_cache(spec, quotes, source, ts=None):
+    tmp = CACHE_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"ts": ts or time.time(), "spec": spec_digest(spec), "source": source, "quotes": quotes},
+                  f, ensure_ascii=False, indent=2)
+    os.replace(tmp, CACHE_PATH)
+
+# --- Yarış ---
+def is_complete(quotes, required):
+    return all(isinstance(quotes.get(k), float) and quotes[k] > 0 for k in required)
+
+def race_providers(spec, providers=None, timeout=TIMEOUT + 2, grace=GRACE):
+    """
+    Sağlayıcıları daemon thread'lerde başlat; ilk tam cevabı al.
+    Kazanandan sonra `grace` kadar diğerlerinden eksik opsiyonel alanları doldur.
+    Hiçbiri tam değilse elde olan kısmi sonuçları birleştir.
+    """
+    providers = providers or PROVIDERS
+    required, optional = required_keys(spec), optional_keys(spec)
+    results = queue.Queue()
+
+    def worker(name, fn):
+        try:
+            results.put((name, fn(spec), None))
+        except Exception as e:
+            results.put((name, None, e))
+
+    for name, fn in providers:
+        threading.Thread(target=worker, args=(name, fn), daemon=True).start()
+
+    merged, winner = {}, None
+    pending = len(providers)
+    deadline = time.monotonic() + timeout
+    while pending:
+        left = deadline - time.monotonic()
+        if left <= 0:
+            break
+        try:
+            name, quotes, err = results.get(timeout=left)
+        except queue.Empty:
+            break
+        pending -= 1
+        if err is not None:
+            print(f"[FX] {name} başarısız: {err}")
+            continue
+        if winner is None and is_complete(quotes, required):
+            winner = name
+            merged = {**merged, **quotes}
+            deadline = min(deadline, time.monotonic() + grace)
+        else:
+            for k, v in quotes.items():
+                merged.setdefault(k, v)
+        if winner and all(k in merged for k in optional):
+            break
+    return merged, winner or "partial"
+
+def get_quotes(spec, ttl=CACHE_TTL):
+    """
+    Önbellek tazeyse ağa çıkmadan döner; değilse sağlayıcılar yarışır.
+    -> (quotes, kaynak, alınma zamanı); önbellekten dönen fiyatın zamanı ilk alındığı an.
+    """
+    required = required_keys(spec)
+    cached = load_cache(spec, ttl)
+    if cached and is_complete(cached.get("quotes") or {}, required):
+        return cached["quotes"], f"cache:{cached.get('source', '?')}", float(cached.get("ts", 0))
+    fetched = time.time()
+    quotes, source = race_providers(spec)
+    if is_complete(quotes, required):
+        save_cache(spec, quotes, source, fetched)
+    return quotes, source, fetched
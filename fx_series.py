@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fx_series.py - Sembol başına sabit genişlikli, sadece-ekleme ikili zaman serisi.
+- Kayıt: <timestamp float64><değer float64> (16 bayt), dosya: fx_history/<sembol>.bin
+- Okuma mmap üzerinden; zaman aralığı ikili aramayla bulunur, dosya büyüse de sabit maliyet.
+  Eşleme her sorgudan sonra kapatılır (görünümler bırakılır, eşleme sızmaz).
+- append_snapshot aynı gözlemi iki kez yazmaz: zaman damgası serinin son kaydından yeni
+  değilse (örn. fx_quotes önbellekten döndü) o sembol atlanır.
+"""
+
+import os
+import mmap
+import struct
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+HISTORY_DIR = os.environ.get("FX_HISTORY_DIR", "fx_history")
+RECORD = struct.Struct("<dd")
+TR_TZ = timezone(timedelta(hours=3))  # Türkiye sabit UTC+3
+
+def series_path(symbol):
+    return os.path.join(HISTORY_DIR, f"{symbol}.bin")
+
+def append(symbol, value, ts=None):
+    if value is None:
+        return
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    with open(series_path(symbol), "ab") as f:
+        f.write(RECORD.pack(ts if ts is not None else time.time(), float(value)))
+
+def append_snapshot(values, ts=None):
+    """{sembol: değer} sözlüğünü aynı zaman damgasıyla yaz; sembolde zaten olan gözlem atlanır."""
+    ts = ts if ts is not None else time.time()
+    written = 0
+    for sym, val in values.items():
+        last = last_close(sym)
+        if last is not None and last[0] >= ts:
+            continue
+        append(sym, val, ts)
+        written += 1
+    return written
+
+@contextmanager
+def _open(symbol):
+    """Seriyi float64 memoryview olarak ver: [ts0, v0, ts1, v1, ...]. Boş/yoksa None."""
+    path = series_path(symbol)
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    size -= size % RECORD.size  # yarım yazılmış son kaydı yok say
+    if size == 0:
+        yield None
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as raw, raw.cast("d") as mv:
+            yield mv
+
+def _bisect(mv, ts):
+    """ts'den büyük/eşit ilk kaydın indeksi."""
+    lo, hi = 0, len(mv) // 2
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if mv[2 * mid] < ts:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+# --- Sorgular ---
+def last_close(symbol):
+    """Son kayıt -> (ts, değer) ya da None."""
+    with _open(symbol) as mv:
+        if mv is None:
+            return None
+        return mv[-2], mv[-1]
+
+def first_since(symbol, ts):
+    with _open(symbol) as mv:
+        if mv is None:
+            return None
+        i = _bisect(mv, ts)
+        if i >= len(mv) // 2:
+            return None
+        return mv[2 * i], mv[2 * i + 1]
+
+def day_start(now=None):
+    now = datetime.fromtimestamp(now if now is not None else time.time(), TR_TZ)
+    return now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+def day_open(symbol, now=None):
+    """Bugünün (TR saati) ilk kaydı -> (ts, değer) ya da None."""
+    return first_since(symbol, day_start(now))
+
+def min_max(symbol, days, now=None):
+    """Son N gündeki (min, max) ya da None."""
+    now = now if now is not None else time.time()
+    with _open(symbol) as mv:
+        if mv is None:
+            return None
+        i = _bisect(mv, now - days * 86400)
+        with mv[2 * i + 1::2] as vals:
+            if not len(vals):
+                return None
+            return min(vals), max(vals)
+
+def day_change(symbol, value, now=None):
+    """Gün açılışına göre yüzde değişim; veri yoksa None."""
+    if value is None:
+        return None
+    opened = day_open(symbol, now)
+    if not opened or not opened[1]:
+        return None
+    return (value - opened[1]) / opened[1] * 100.0
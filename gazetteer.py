@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+gazetteer.py - Bilinen kişi/kurum/yer/unvan sözlüğü (assets/gazetteer.tsv) ve token trie'si.
+- Satır: tür <TAB> kanonik ad [<TAB> diğer|yazımlar]; tür PER, ORG, LOC ya da TITLE.
+- Yazımlar token trie'sine dizilir; trie ayrıca ilk harfe göre çarpanlarına ayrılmış tek bir
+  regex'e derlenir. Metin bu regex ile tek geçişte (C tarafında) taranır, en uzun eşleşme
+  kazanır; eşleşen ifadenin türü/kanonik adı trie'den okunur.
+- Token sınırı (BOUND) her token'dan sonra değil, eşleşmenin sonunda bir kez denetlenir: ara
+  token'lardan sonra zaten boşluk gelir, tutmazsa re kısa seçeneklere geri döner (aynı
+  eşleşmeler). Regex kaynağı yarıya iner, yüklemedeki re.compile ~2-3 kat kısalır.
+- Token'lar boşlukla ayrılır; Türkçe ek ("Erdoğan'ın") ve sondaki nokta eşleşmeye dahil
+  edilir ama anahtara girmez. Büyük/küçük harf yazıldığı gibidir.
+- Derleme adımı trie + regex kaynağını pickle ile yazar (assets/gazetteer.pkl); yükleme TSV'nin
+  özetini kontrol eder, eskiyse TSV'den yeniden derler.
+
+Kullanım:
+    python gazetteer.py build              # assets/gazetteer.pkl üret
+    python gazetteer.py scan "metin..."    # eşleşmeleri göster
+"""
+
+import os
+import re
+import sys
+import pickle
+import hashlib
+from functools import lru_cache
+
+GAZETTEER_PATH = os.environ.get("GAZETTEER_PATH", os.path.join("assets", "gazetteer.tsv"))
+KINDS = ("PER", "ORG", "LOC", "TITLE")
+FORMAT = 2
+
+# token: harf/rakam dizisi, iç nokta dahil ("J.D.")
+TOKEN_RE = re.compile(r"[^\W_]+(?:\.[^\W_]+)*")
+SEP = r"\.?[ \t\xa0]+"                 # token arası: boşluk ("Prof. Dr." için önünde nokta olabilir)
+BOUND = r"(?![^\W_]|\.[^\W_])"         # token burada bitmeli ("Bakan" ≠ "Bakanı")
+TAIL = r"((?:['’][^\W_]+)?\.?)"        # Türkçe ek + sondaki nokta
+END = ""  # trie'de uç işareti; gerçek token anahtarı hiç boş olmaz
+
+def token_key(tok):
+    return tok.lower()
+
+def compiled_path(path=GAZETTEER_PATH):
+    return os.path.splitext(path)[0] + ".pkl"
+
+def read_entries(path=GAZETTEER_PATH):
+    """-> [(tür, kanonik, [yazımlar...])]"""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for n, line in enumerate(f, 1):
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            cols = line.split("\t")
+            kind = cols[0].strip().upper()
+            if kind not in KINDS or len(cols) < 2 or not cols[1].strip():
+                raise ValueError(f"{path}:{n}: geçersiz satır: {line!r}")
+            canon = cols[1].strip()
+            aliases = [a.strip() for a in cols[2].split("|")] if len(cols) > 2 else []
+            entries.append((kind, canon, [canon] + [a for a in aliases if a]))
+    return entries
+
+def _node_regex(node):
+    """Trie düğümünün çocukları: uzun token önce; uç düğümde devam opsiyonel (açgözlü = en uzun)."""
+    alts = []
+    for tok in sorted((k for k in node if k != END), key=len, reverse=True):
+        alts.append(re.escape(tok) + _children_regex(node[tok]))
+    return "(?:" + "|".join(alts) + ")"
+
+def _children_regex(child):
+    if len(child) == (END in child):
+        return ""
+    return "(?:" + SEP + _node_regex(child) + ")" + ("?" if END in child else "")
+
+def compile_trie(entries):
+    """
+    -> {"trie": {anahtar: {anahtar: {..., END: (tür, kanonik)}}} (küçük harf anahtarlar),
+        "pattern": aynı yazımların regex kaynağı}.
+    Regex'in en üstü ilk harfe göre dallanır; re her konumda tek karakter bakıp geçer.
+    Aynı yazım iki kez geçerse ilk kayıt kazanır.
+    """
+    trie, written = {}, {}
+    for kind, canon, forms in entries:
+        for form in forms:
+            toks = TOKEN_RE.findall(form)
+            if not toks:
+                continue
+            node, wnode = trie, written
+            for t in toks:
+                node = node.setdefault(token_key(t), {})
+                wnode = wnode.setdefault(t, {})
+            node.setdefault(END, (kind, canon))
+            wnode[END] = True
+
+    by_head = {}
+    for tok, child in written.items():
+        by_head.setdefault(tok[0], {})[tok] = child
+    parts = []
+    for head, toks in sorted(by_head.items()):
+        alts = [re.escape(tok[1:]) + _children_regex(child)
+                for tok, child in sorted(toks.items(), key=lambda kv: len(kv[0]), reverse=True)]
+        h = re.escape(head)
+        parts.append(h + r"(?<![^\W_]" + h + ")(?:" + "|".join(alts) + ")")
+    return {"trie": trie, "pattern": "((?:" + "|".join(parts) + ")" + BOUND + ")" + TAIL}
+
+def _ready(compiled):
+    # "seen": eşleşen ifade metni -> trie sonucu (haberlerde aynı adlar tekrar eder)
+    return {"trie": compiled["trie"], "regex": re.compile(compiled["pattern"]), "seen": {}}
+
+def _digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def build(path=GAZETTEER_PATH, out=None):
+    out = out or compiled_path(path)
+    compiled = compile_trie(read_entries(path))
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump({"format": FORMAT, "source": _digest(path), **compiled}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, out)
+    return out, compiled
+
+@lru_cache(maxsize=4)
+def load(path=GAZETTEER_PATH):
+    """
+    Derlenmiş sözlük ({"trie", "regex", "seen"}); .pkl güncel değilse TSV'den derlenir.
+    Sözlük hiç yoksa None (çağıran regex'e düşer).
+    """
+    pkl = compiled_path(path)
+    have_src = os.path.exists(path)
+    if os.path.exists(pkl):
+        try:
+            with open(pkl, "rb") as f:
+                data = pickle.load(f)
+            if data.get("format") == FORMAT and (not have_src or data.get("source") == _digest(path)):
+                return _ready(data)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError):
+            pass
+    if not have_src:
+        return None
+    return _ready(compile_trie(read_entries(path)))
+
+def lookup(trie, phrase):
+    """Eşleşen ifade -> (tür, kanonik) ya da None."""
+    node = trie
+    for t in TOKEN_RE.findall(phrase):
+        node = node.get(token_key(t))
+        if node is None:
+            return None
+    return node.get(END)
+
+def scan(text, gz):
+    """Tek geçiş, en uzun eşleşme. -> [(başlangıç, bitiş, tür, kanonik)], metin sırasıyla."""
+    trie, seen = gz["trie"], gz["seen"]
+    out = []
+    for m in gz["regex"].finditer(text):
+        phrase = m.group(1)
+        hit = seen.get(phrase)
+        if hit is None:
+            hit = seen[phrase] = lookup(trie, phrase) or ()
+        if hit:
+            out.append((m.start(), m.end(), hit[0], hit[1]))
+    return out
+
+def main(argv):
+    if len(argv) >= 1 and argv[0] == "build":
+        path = argv[1] if len(argv) > 1 else GAZETTEER_PATH
+        out, compiled = build(path)
+        print(f"derlendi: {out} ({len(read_entries(path))} kayıt, regex {len(compiled['pattern'])} karakter)")
+        return 0
+    if len(argv) >= 2 and argv[0] == "scan":
+        gz = load()
+        if gz is None:
+            print(f"sözlük yok: {GAZETTEER_PATH}")
+            return 1
+        text = " ".join(argv[1:])
+        for s, e, kind, canon in scan(text, gz):
+            print(f"{kind:5} {text[s:e]!r} -> {canon}")
+        return 0
+    print(__doc__)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
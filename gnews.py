@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+gnews.py - Google News RSS bağlantılarını yayıncı adresine çözer (kalıcı önbellekli).
+- news.google.com/rss/articles/<id> kayıtları yönlendirme/sarmalayıcı sayfadır; makale
+  çekimi ve tekrar kontrolü yayıncının asıl adresiyle yapılmalı.
+- Çözüm sırası, en ucuzdan:
+  1) Önbellek (gnews_cache.json, id -> adres; son CACHE_KEEP kayıt): istek yok.
+  2) Eski biçim id: base64 içinde protobuf, adres doğrudan okunur: istek yok.
+  3) Yeni biçim id ("AU_yq..."): sarmalayıcı sayfa (1 istek); sayfada data-n-au varsa adres
+     oradan, yoksa imza/zaman damgasıyla batchexecute (1 istek daha).
+  4) Olmazsa yönlendirmeler izlenir (1 istek + atlama sayısı); varılan adres hâlâ Google'daysa
+     (consent.google.com, www.google.com...) çözülmemiş sayılır, önbelleğe yazılmaz.
+  Çözülemeyen bağlantı olduğu gibi döner (makale yine sarmalayıcıdan denenir).
+- İstekler HostBook üzerinden (news.google.com devre kesicisi, uyarlanır zaman aşımı) ve
+  verilirse Deadline'a kısılarak yapılır. Ek istek ve yönlendirme atlamaları sayılır, report()
+  yazdırır.
+
+Kullanım:
+    gn = Resolver.load(hosts=HOSTS)
+    links = gn.resolve_many([e.link for e in entries], deadline=budget)
+    gn.save(); print(gn.report())
+    python gnews.py <bağlantı>...          # çöz ve yazdır
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import base64
+import threading
+import concurrent.futures as cf
+from urllib.parse import urlparse, quote
+
+import requests
+
+from host_health import HostBook, host_of
+
+GNEWS_CACHE_PATH = os.environ.get("GNEWS_CACHE_PATH", "gnews_cache.json")
+CACHE_KEEP = 5000
+WORKERS = 4
+GNEWS_HOST = "news.google.com"
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; ValctkNewsBot/2.0)"}
+BATCH_URL = "https://news.google.com/_/DotsSplashUi/data/batchexecute"
+ARTICLE_RE = re.compile(r"/(?:rss/)?(?:articles|read)/([A-Za-z0-9_-]{20,})")
+ATTR_RE = {k: re.compile(r'data-n-a-' + k + r'="([^"]+)"') for k in ("sg", "ts")}
+DIRECT_RE = re.compile(r'data-n-au="(https?://[^"]+)"')
+OLD_PREFIX = b"\x08\x13\x22"
+
+def is_google(url):
+    """google.com ya da herhangi bir alt alan adı (news., consent., www. ...)."""
+    host = host_of(url)
+    return host == "google.com" or host.endswith(".google.com")
+
+def article_id(url):
+    """Google News makale bağlantısıysa id, değilse None."""
+    if not url or host_of(url) != GNEWS_HOST:
+        return None
+    m = ARTICLE_RE.search(urlparse(url).path)
+    return m.group(1) if m else None
+
+def _varint(buf, i):
+    n = shift = 0
+    while i < len(buf):
+        b = buf[i]
+        n |= (b & 0x7F) << shift
+        i += 1
+        if not b & 0x80:
+            return n, i
+        shift += 7
+    raise ValueError("yarım varint")
+
+def decode_offline(aid):
+    """Eski biçim id (protobuf: 0x08 0x13, alan 4 = adres) -> adres; yeni biçimde None."""
+    try:
+        raw = base64.urlsafe_b64decode(aid + "=" * (-len(aid) % 4))
+    except (ValueError, TypeError):
+        return None
+    if not raw.startswith(OLD_PREFIX):
+        return None
+    try:
+        n, i = _varint(raw, len(OLD_PREFIX))
+    except ValueError:
+        return None
+    url = raw[i:i + n].decode("utf-8", errors="replace")
+    return url if url.startswith(("http://", "https://")) and n <= len(raw) - i else None
+
+def parse_batch(text):
+    """batchexecute yanıtı -> adres ya da None (yanıt JSON içinde JSON)."""
+    for line in text.splitlines():
+        if not line.startswith("[["):
+            continue
+        try:
+            rows = json.loads(line)
+        except ValueError:
+            continue
+        for row in rows:
+            if len(row) > 2 and row[0] == "wrb.fr" and isinstance(row[2], str):
+                try:
+                    payload = json.loads(row[2])
+                except ValueError:
+                    continue
+                if len(payload) > 1 and payload[0] == "garturlres" and str(payload[1]).startswith("http"):
+                    return payload[1]
+    return None
+
+class Resolver:
+    def __init__(self, cache=None, path=GNEWS_CACHE_PATH, hosts=None, session=None):
+        self.path = path
+        self.cache = cache or {}
+        self.hosts = hosts or HostBook()
+        self.session = session or requests.Session()
+        self.stats = {"önbellek": 0, "çözümleme": 0, "sayfa": 0, "batchexecute": 0, "yönlendirme": 0, "çözülemedi": 0}
+        self.requests = 0     # Google'a atılan ek istek
+        self.hops = 0         # izlenen yönlendirme atlaması
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=GNEWS_CACHE_PATH, hosts=None, session=None):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        return cls(cache, path, hosts, session)
+
+    def save(self):
+        with self._lock:
+            keep = dict(list(self.cache.items())[-CACHE_KEEP:])
+            data = json.dumps(keep, ensure_ascii=False, indent=0)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _request(self, method, url, deadline=None, **kw):
+        with self.hosts.guard(url) as timeout:
+            if deadline is not None:
+                timeout = deadline.clip(timeout)
+            kw.setdefault("headers", HEADERS)
+            r = self.session.request(method, url, timeout=timeout, **kw)
+            r.raise_for_status()
+        with self._lock:
+            self.requests += 1
+            self.hops += len(r.history)
+        return r
+
+    def _online(self, aid, link, deadline):
+        """Yeni biçim: sarmalayıcı sayfa -> data-n-au ya da batchexecute. -> (adres, yol)."""
+        page = self._request("GET", f"https://{GNEWS_HOST}/rss/articles/{aid}", deadline).text
+        m = DIRECT_RE.search(page)
+        if m:
+            return m.group(1), "sayfa"
+        sg, ts = (ATTR_RE[k].search(page) for k in ("sg", "ts"))
+        if sg and ts:
+            inner = json.dumps(["garturlreq", [["X", "X", ["X", "X"], None, None, 1, 1, "US:en", None, 1,
+                                                None, None, None, None, None, 0, 1], "X", "X", 1, [1, 1, 1], 1, 1,
+                                               None, 0, 0, None, 0], aid, int(ts.group(1)), sg.group(1)],
+                               separators=(",", ":"))
+            body = "f.req=" + quote(json.dumps([[["Fbv4je", inner, None, "generic"]]], separators=(",", ":")))
+            r = self._request("POST", BATCH_URL, deadline, data=body,
+                              headers={**HEADERS, "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8"})
+            url = parse_batch(r.text)
+            if url:
+                return url, "batchexecute"
+        r = self._request("GET", link, deadline, allow_redirects=True)
+        if not is_google(r.url):
+            return r.url, "yönlendirme"
+        return None, "çözülemedi"
+
+    def resolve(self, link, deadline=None):
+        """Google News bağlantısı -> yayıncı adresi; diğer bağlantılar ve çözülemeyenler aynen."""
+        aid = article_id(link)
+        if aid is None:
+            return link
+        with self._lock:
+            hit = self.cache.get(aid)
+        if hit:
+            self._count("önbellek")
+            return hit
+        url, how = decode_offline(aid), "çözümleme"
+        if url is None:
+            try:
+                url, how = self._online(aid, link, deadline)
+            except Exception as ex:
+                print(f"→ Google News bağlantısı çözülemedi ({aid[:16]}…): {ex}")
+                url, how = None, "çözülemedi"
+        self._count(how)
+        if url is None:
+            return link
+        with self._lock:
+            self.cache[aid] = url
+        return url
+
+    def resolve_many(self, links, deadline=None, workers=WORKERS):
+        """Sırayı korur; ağ gerektirenler küçük bir iş parçacığı havuzunda."""
+        links = list(links)
+        out = list(links)
+        todo = [k for k, link in enumerate(links) if article_id(link)]
+        if len(todo) <= 1 or workers <= 1:
+            for k in todo:
+                out[k] = self.resolve(links[k], deadline)
+            return out
+        with cf.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gnews") as pool:
+            for k, url in zip(todo, pool.map(lambda k: self.resolve(links[k], deadline), todo)):
+                out[k] = url
+        return out
+
+    def report(self):
+        done = sum(self.stats.values())
+        if not done:
+            return ""
+        parts = " | ".join(f"{k} {v}" for k, v in self.stats.items() if v)
+        return f"{done} bağlantı: {parts} | ek istek {self.requests}, yönlendirme atlaması {self.hops}"
+
+def main(argv):
+    if not argv:
+        print(__doc__)
+        return 2
+    gn = Resolver.load()
+    t0 = time.perf_counter()
+    for link, url in zip(argv, gn.resolve_many(argv)):
+        print(f"{link}\n  -> {url}")
+    gn.save()
+    print(f"{gn.report()} ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
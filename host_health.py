@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+host_health.py - Host başına sağlık kaydı, uyarlanır zaman aşımı ve devre kesici.
+- Her istek (süre, başarılı mı) host kaydına işlenir; son LAT_KEEP gecikme tutulur.
+- Zaman aşımı p95 * TIMEOUT_FACTOR (MIN_TIMEOUT..MAX_TIMEOUT); az örnekte varsayılan.
+- Art arda FAIL_THRESHOLD hata -> devre açık: COOLDOWN boyunca o hosta istek atılmaz.
+  Süre dolunca yarı açık: tek deneme isteği; başarılıysa kapanır, değilse bekleme ikiye katlanır.
+- 4xx yanıtlar sayfanın sorunudur, host sağlıklı sayılır; bağlantı/zaman aşımı/5xx hatadır.
+  Gövdedeki diğer istisnalar (ayrıştırma hatası, program hatası) host'a yazılmaz.
+- Kayıt host_health.json'da tutulur (çalıştırmalar arası).
+
+Kullanım:
+    hosts = HostBook.load()
+    with hosts.guard(url) as timeout:     # devre açıksa CircuitOpen
+        r = requests.get(url, timeout=timeout); r.raise_for_status()
+    hosts.save(); print(hosts.report())
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+
+from deadline import DeadlineExceeded
+
+HOST_HEALTH_PATH = os.environ.get("HOST_HEALTH_PATH", "host_health.json")
+LAT_KEEP = 50
+MIN_SAMPLES = 5
+TIMEOUT_FACTOR = 2.0
+MIN_TIMEOUT = float(os.environ.get("HOST_MIN_TIMEOUT", "3"))
+MAX_TIMEOUT = float(os.environ.get("HOST_MAX_TIMEOUT", "12"))
+FAIL_THRESHOLD = int(os.environ.get("HOST_FAIL_THRESHOLD", "3"))
+COOLDOWN = float(os.environ.get("HOST_COOLDOWN", "600"))
+MAX_COOLDOWN = 6 * 3600
+ERR_ALPHA = 0.2  # hata oranı EWMA katsayısı
+# host hatası sayılan istisnalar: requests taşıma hataları + akış okunurken urllib3/soket hataları
+TRANSPORT_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, TimeoutError, ConnectionError)
+
+class CircuitOpen(Exception):
+    def __init__(self, host, wait):
+        super().__init__(f"{host}: devre açık ({wait:.0f} sn kaldı)")
+        self.host = host
+        self.wait = wait
+
+def host_of(url):
+    return (urlparse(url).hostname or "").lower()
+
+def percentile(values, q):
+    if not values:
+        return None
+    s = sorted(values)
+    k = min(len(s) - 1, max(0, int(round(q * (len(s) - 1)))))
+    return s[k]
+
+def _new():
+    return {"lat": [], "ok": 0, "err": 0, "err_rate": 0.0, "fails": 0,
+            "state": "closed", "opened_at": 0.0, "cooldown": COOLDOWN, "last_error": ""}
+
+class HostBook:
+    def __init__(self, hosts=None, path=HOST_HEALTH_PATH):
+        self.path = path
+        self.hosts = hosts or {}
+        self.skipped = {}   # bu çalıştırmada devre açık diye atlanan istekler
+        self._probing = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=HOST_HEALTH_PATH):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                hosts = json.load(f)
+        except (OSError, ValueError):
+            hosts = {}
+        for h in hosts.values():
+            for k, v in _new().items():
+                h.setdefault(k, v)
+        return cls(hosts, path)
+
+    def save(self):
+        tmp = self.path + ".tmp"
+        with self._lock:
+            data = json.dumps(self.hosts, ensure_ascii=False, indent=1)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    def _rec(self, host):
+        rec = self.hosts.get(host)
+        if rec is None:
+            rec = self.hosts[host] = _new()
+        return rec
+
+    def timeout_for(self, host, default=MAX_TIMEOUT):
+        lat = self.hosts.get(host, {}).get("lat") or []
+        if len(lat) < MIN_SAMPLES:
+            return default
+        return min(MAX_TIMEOUT, max(MIN_TIMEOUT, percentile(lat, 0.95) * TIMEOUT_FACTOR))
+
+    def expected_seconds(self, host, default=2.0):
+        """Planlama için tipik istek süresi (p50); devre açıksa inf."""
+        rec = self.hosts.get(host)
+        if not rec:
+            return default
+        if rec["state"] == "open" and rec["opened_at"] + rec["cooldown"] > time.time():
+            return float("inf")
+        return percentile(rec["lat"], 0.5) or default
+
+    def allow(self, host, now=None):
+        """-> (izin, kalan bekleme sn). Yarı açık durumda aynı anda tek deneme isteği."""
+        now = now or time.time()
+        with self._lock:
+            rec = self._rec(host)
+            if rec["state"] == "closed":
+                return True, 0.0
+            wait = rec["opened_at"] + rec["cooldown"] - now
+            if wait > 0 or host in self._probing:
+                self.skipped[host] = self.skipped.get(host, 0) + 1
+                return False, max(wait, 0.0)
+            rec["state"] = "half"
+            self._probing.add(host)
+            return True, 0.0
+
+    def record(self, host, ok, seconds, error="", now=None):
+        now = now or time.time()
+        with self._lock:
+            rec = self._rec(host)
+            self._probing.discard(host)
+            rec["err_rate"] = round((1 - ERR_ALPHA) * rec["err_rate"] + ERR_ALPHA * (0.0 if ok else 1.0), 4)
+            if ok:
+                rec["ok"] += 1
+                rec["lat"] = (rec["lat"] + [round(seconds, 3)])[-LAT_KEEP:]
+                rec["fails"] = 0
+                if rec["state"] != "closed":
+                    rec["state"], rec["cooldown"] = "closed", COOLDOWN
+                return
+            rec["err"] += 1
+            rec["fails"] += 1
+            rec["last_error"] = error[:120]
+            if rec["state"] == "half":
+                rec["cooldown"] = min(MAX_COOLDOWN, rec["cooldown"] * 2)
+                rec["state"], rec["opened_at"] = "open", now
+            elif rec["fails"] >= FAIL_THRESHOLD:
+                rec["state"], rec["opened_at"] = "open", now
+
+    def _release(self, host):
+        """Yarı açık deneme hakkını sonuç kaydetmeden geri ver."""
+        with self._lock:
+            self._probing.discard(host)
+
+    @contextmanager
+    def guard(self, url):
+        """
+        İzin yoksa CircuitOpen. Gövde host'un uyarlanır zaman aşımını alır; çıkışta
+        süre ve sonuç kaydedilir (4xx HTTPError host için başarı sayılır; sadece
+        TRANSPORT_ERRORS hata sayılır; DeadlineExceeded ve diğer istisnalar kaydedilmez).
+        """
+        host = host_of(url)
+        allowed, wait = self.allow(host)
+        if not allowed:
+            raise CircuitOpen(host, wait)
+        t0 = time.perf_counter()
+        try:
+            yield self.timeout_for(host)
+        except DeadlineExceeded:
+            # isteği biz kestik; host hakkında bilgi yok
+            self._release(host)
+            raise
+        except requests.HTTPError as ex:
+            status = ex.response.status_code if ex.response is not None else 0
+            self.record(host, 0 < status < 500, time.perf_counter() - t0, f"HTTP {status}")
+            raise
+        except TRANSPORT_ERRORS as ex:
+            self.record(host, False, time.perf_counter() - t0, f"{type(ex).__name__}: {ex}")
+            raise
+        except BaseException:
+            # ayrıştırma/program hatası: host'un suçu değil
+            self._release(host)
+            raise
+        else:
+            self.record(host, True, time.perf_counter() - t0)
+
+    def report(self, hosts=None):
+        """Host tablosu (sadece verilen hostlar; yoksa hepsi)."""
+        names = sorted(hosts if hosts is not None else self.hosts)
+        lines = [f"{'host':34} {'durum':6} {'p50':>6} {'p95':>6} {'t/o':>5} {'hata%':>6} {'ok/err':>9} {'atlandı':>7}"]
+        for h in names:
+            rec = self.hosts.get(h)
+            if not rec:
+                continue
+            p50, p95 = percentile(rec["lat"], 0.5), percentile(rec["lat"], 0.95)
+            fmt = lambda v: f"{v:6.2f}" if v is not None else f"{'-':>6}"
+            lines.append(
+                f"{h[:34]:34} {rec['state']:6} {fmt(p50)} {fmt(p95)} {self.timeout_for(h):5.1f} "
+                f"{rec['err_rate'] * 100:6.1f} {rec['ok']:>4}/{rec['err']:<4} {self.skipped.get(h, 0):>7}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+http_pool.py - Süreç genelinde tek requests.Session (bağlantı havuzu).
+- Botlar ayrı çalışırken de, runner.py altında birlikte çalışırken de aynı host'a giden
+  istekler açık bağlantıyı (keep-alive, TLS oturumu) yeniden kullanır.
+- Havuz büyüklüğü iş parçacıklı indirmelere (hat, bundle, gnews) yetecek kadar; oturumda
+  varsayılan başlık yok, her bot kendi User-Agent'ını istekte verir.
+- requests.Session tek tek istekler için iş parçacıkları arasında paylaşılabilir; oturum
+  ayarları (başlık, çerez politikası) burada bir kez kurulur, sonra değiştirilmez.
+"""
+
+import os
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", "32"))   # host başına açık bağlantı
+POOL_HOSTS = 64                                            # havuzu tutulan host
+
+@lru_cache(maxsize=1)
+def session():
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_SIZE)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+def get(url, **kw):
+    return session().get(url, **kw)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+langid.py - Karakter n-gram dil tanıma (Türkçe filtresi: auto_rewriter, auto_repost_bot,
+auto_rss_bot).
+- Eğitim metni assets/langid.tsv: dil <TAB> cümle. Derleme 1-3 karakterlik n-gram'ları sayar,
+  dil başına log-olasılık tablosu çıkarır (add-α yumuşatma) ve diziler halinde
+  assets/langid.npz'ye yazar: sıralı n-gram anahtarları (uint64) + anahtar x dil log-olasılık.
+  Yükleme TSV'nin özetini kontrol eder, eskiyse yeniden derler.
+- n-gram anahtarı kod noktalarından birebir hesaplanır (çakışma yok): 1-gram c,
+  2-gram c1*B + c2, 3-gram (c1*B + c2)*B + c3; B = 0x110000.
+- Toplu puanlama tek vektörel geçiştir: metinler \\x00 ile birleştirilir, bağlantı/@hesap tek
+  regex ile silinir, kod noktası dizisinde harf olmayanlar (rakam, noktalama, emoji) tabloyla
+  boşluğa çevrilir; n-gram'lar kaydırmalı çarpma ile çıkar, çarpımsal hash tablosunda bulunur
+  (anahtar karşılaştırmasıyla doğrulanır), metin başına bincount ile toplanır. Python'da metin
+  başına döngü yok; bellek için CHUNK metinlik dilimler halinde.
+- Hash tablosunda çakışan iki n-gram'dan dilleri en iyi ayıranı (log-olasılık aralığı en geniş)
+  kalır; diğeri bilinmeyen sayılır (birkaç düzine, puana etkisi yok denecek kadar).
+- Güven: naive Bayes sonsal olasılığı (eşit önsel). Hiç n-gram'ı olmayan metin -> (None, 0).
+- Harfler Türkçe kurala göre küçültülür (I -> ı, İ -> i); eğitim ve puanlama aynı kuralla.
+- turkish() katıdır (Türkçe en olası ve güven >= MIN_CONF). Haber botlarının filtresi
+  foreign() ise açık kalır: metin sadece başka bir dil Türkçeyi açıkça geçerse (güven >=
+  FOREIGN_CONF) ve yeterince n-gram varsa (>= MIN_GRAMS) atılır; kısa/kararsız metin ve
+  ğ/ı/ş/İ içeren metin (modele sorulmaz) geçer. Yanlış atılan Türkçe haber, geçen yabancı
+  başlıktan pahalıdır.
+
+Kullanım:
+    python langid.py build                 # assets/langid.npz üret
+    python langid.py "metin" "text" ...    # dil + güven
+    lid = load(); lid.turkish(tweetler, hints=x_lang_alanlari)   # [(bool, güven)]
+    lid.foreign(basliklar)                                       # [(açıkça yabancı mı, güven)]
+"""
+
+import os
+import re
+import sys
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+
+LANGID_PATH = os.environ.get("LANGID_PATH", os.path.join("assets", "langid.tsv"))
+MIN_CONF = float(os.environ.get("LANGID_MIN_CONF", "0.6"))   # Türkçe sayılmak için en düşük güven
+FOREIGN_CONF = float(os.environ.get("LANGID_FOREIGN_CONF", "0.9"))  # foreign(): atmak için başka dil güveni
+MIN_GRAMS = 45       # foreign(): bundan az n-gram'lı (~15 harften kısa) metin atılmaz
+TR_LETTERS = re.compile(r"[ğışĞİŞ]")   # diğer dillerde yok denecek kadar az: modele sorulmaz
+FORMAT = 2
+ORDER = 3            # en uzun n-gram (3 * 21 bit < 64 bit)
+BASE = 0x110000      # kod noktası sayısı
+ALPHA = 0.5          # add-α yumuşatma
+MAX_CHARS = 400      # metin başına bakılan karakter (dil için fazlası gereksiz)
+CHUNK = 2048         # puanlamada dilim (metin)
+SLOT_BITS = 18       # hash tablosu 2^18 yuva
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+SPACE = 32
+URLS = re.compile(r"https?://[^\s\x00]+|@\w*")
+LETTERS = np.array([chr(i).isalpha() for i in range(0x10000)])   # BMP harf tablosu
+
+def compiled_path(path=LANGID_PATH):
+    return os.path.splitext(path)[0] + ".npz"
+
+def read_corpus(path=LANGID_PATH):
+    """-> {dil: [cümle, ...]}"""
+    corpus = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for n, line in enumerate(f, 1):
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            cols = line.split("\t")
+            if len(cols) != 2 or not cols[0].strip() or not cols[1].strip():
+                raise ValueError(f"{path}:{n}: geçersiz satır: {line!r}")
+            corpus.setdefault(cols[0].strip().lower(), []).append(cols[1].strip())
+    return corpus
+
+def codes(texts):
+    """Metinler -> kod noktası dizisi (uint64); metinler arasında 0, kelimeler tek boşlukla."""
+    joined = " " + " \x00 ".join(t[:MAX_CHARS].replace("\x00", " ") for t in texts) + " "
+    joined = URLS.sub(" ", joined.replace("I", "ı").replace("İ", "i").lower())
+    c = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+    letter = LETTERS[np.minimum(c, 0xFFFF)] & (c <= 0xFFFF)
+    c = np.where(letter | (c == 0), c, SPACE)
+    keep = np.ones(len(c), dtype=bool)
+    keep[1:] = (c[1:] != SPACE) | (c[:-1] != SPACE)
+    return c[keep].astype(np.uint64)
+
+def grams(texts):
+    """-> (n-gram anahtarları, metin indeksleri). Ayırıcıya değen pencereler atılır."""
+    c = codes(texts)
+    sep = c == 0
+    doc = np.cumsum(sep)
+    h, bad = c, sep
+    keys, docs = [], []
+    for n in range(1, ORDER + 1):
+        if n > 1:
+            h = h[:-1] * BASE + c[n - 1:]
+            bad = bad[:-1] | sep[n - 1:]
+        ok = ~bad if n > 1 else ~bad & (c != SPACE)   # tek başına boşluk bilgi taşımaz
+        keys.append(h[ok])
+        docs.append(doc[:len(h)][ok])
+    return np.concatenate(keys), np.concatenate(docs)
+
+def train(corpus, alpha=ALPHA):
+    """{dil: [cümle]} -> (diller, sıralı anahtarlar, anahtar x dil log-olasılık float32)."""
+    langs = sorted(corpus)
+    per_lang = [np.unique(grams(corpus[lang])[0], return_counts=True) for lang in langs]
+    keys = np.unique(np.concatenate([k for k, _ in per_lang]))
+    counts = np.zeros((len(keys), len(langs)), dtype=np.float64)
+    for j, (k, n) in enumerate(per_lang):
+        counts[np.searchsorted(keys, k), j] = n
+    logp = np.log((counts + alpha) / (counts.sum(axis=0) + alpha * len(keys)))
+    return langs, keys, logp.astype(np.float32)
+
+def _slot(keys):
+    return (keys * GOLDEN) >> np.uint64(64 - SLOT_BITS)
+
+class LangID:
+    def __init__(self, langs, keys, logp):
+        self.langs = list(langs)
+        self.keys = keys
+        self.logp = logp
+        self.tr = self.langs.index("tr") if "tr" in self.langs else None
+        # yuva -> anahtar indeksi (boş yuva: len(keys), karşılaştırma hep tutmaz)
+        self._keys = np.append(keys, np.uint64(0))
+        self._slots = np.full(1 << SLOT_BITS, len(keys), dtype=np.int32)
+        spread = logp.max(axis=1) - logp.min(axis=1) if len(keys) else logp[:, 0]
+        order = np.argsort(spread, kind="stable")          # çakışmada en ayırt edici son yazılır
+        self._slots[_slot(keys[order])] = order
+        self._weights = [np.ascontiguousarray(logp[:, j], dtype=np.float64) for j in range(len(self.langs))]
+
+    def _chunk(self, texts):
+        n = len(texts)
+        keys, docs = grams(texts)
+        i = self._slots[_slot(keys)]
+        hit = self._keys[i] == keys
+        i, docs = i[hit], docs[hit]
+        ll = np.stack([np.bincount(docs, weights=w.take(i), minlength=n) for w in self._weights], axis=1)
+        return ll, np.bincount(docs, minlength=n)
+
+    def scores(self, texts):
+        """-> (dil olasılıkları [metin x dil], metin başına bulunan n-gram sayısı)."""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, len(self.langs))), np.zeros(0, dtype=np.int64)
+        parts = [self._chunk(texts[k:k + CHUNK]) for k in range(0, len(texts), CHUNK)]
+        ll = np.concatenate([p[0] for p in parts])
+        found = np.concatenate([p[1] for p in parts])
+        ll -= ll.max(axis=1, keepdims=True)
+        prob = np.exp(ll)
+        prob /= prob.sum(axis=1, keepdims=True)
+        return prob, found
+
+    def detect(self, texts):
+        """-> [(dil ya da None, güven)]"""
+        prob, found = self.scores(texts)
+        best = prob.argmax(axis=1) if len(prob) else []
+        return [(self.langs[b], float(prob[k, b])) if found[k] else (None, 0.0)
+                for k, b in enumerate(best)]
+
+    def turkish(self, texts, hints=None, min_conf=MIN_CONF):
+        """
+        -> [(Türkçe mi, Türkçe güveni)]. hints: X'in "lang" alanı; "tr" ise model sorulmaz
+        (diğer ipuçları kısa Türkçe tweet'lerde sık yanlış, model karar verir).
+        """
+        texts = list(texts)
+        hints = list(hints) if hints is not None else [None] * len(texts)
+        ask = [k for k, h in enumerate(hints) if not (h and h.lower() == "tr")]
+        out = [(True, 1.0)] * len(texts)
+        if ask and self.tr is not None:
+            prob, found = self.scores(texts[k] for k in ask)
+            tr = prob[:, self.tr]
+            best = prob.argmax(axis=1)
+            for r, k in enumerate(ask):
+                conf = float(tr[r]) if found[r] else 0.0
+                out[k] = (bool(found[r]) and best[r] == self.tr and conf >= min_conf, conf)
+        elif ask:
+            for k in ask:
+                out[k] = (False, 0.0)
+        return out
+
+    def foreign(self, texts, hints=None, min_conf=FOREIGN_CONF, min_grams=MIN_GRAMS):
+        """
+        -> [(başka dil mi, o dilin güveni)]; şüphede False (metin tutulur). hints "tr" ise ya da
+        metinde ğ/ı/ş/İ varsa model sorulmaz.
+        """
+        texts = list(texts)
+        hints = list(hints) if hints is not None else [None] * len(texts)
+        out = [(False, 0.0)] * len(texts)
+        ask = [k for k, (t, h) in enumerate(zip(texts, hints))
+               if not (h and h.lower() == "tr") and not TR_LETTERS.search(t)]
+        if not ask or self.tr is None:
+            return out
+        prob, found = self.scores(texts[k] for k in ask)
+        best = prob.argmax(axis=1)
+        for r, k in enumerate(ask):
+            conf = float(prob[r, best[r]])
+            if found[r] >= min_grams and best[r] != self.tr and conf >= min_conf:
+                out[k] = (True, conf)
+        return out
+
+def _digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def build(path=LANGID_PATH, out=None):
+    out = out or compiled_path(path)
+    langs, keys, logp = train(read_corpus(path))
+    tmp = out + ".tmp.npz"
+    np.savez(tmp, format=FORMAT, source=_digest(path), langs=np.array(langs), keys=keys, logp=logp)
+    os.replace(tmp, out)
+    return out, LangID(langs, keys, logp)
+
+@lru_cache(maxsize=4)
+def load(path=LANGID_PATH):
+    """Derlenmiş model; .npz güncel değilse (ve yazılabiliyorsa) TSV'den derlenip kaydedilir."""
+    npz = compiled_path(path)
+    if os.path.exists(npz):
+        try:
+            with np.load(npz, allow_pickle=False) as data:
+                if int(data["format"]) == FORMAT and (not os.path.exists(path) or str(data["source"]) == _digest(path)):
+                    return LangID(data["langs"].tolist(), data["keys"], data["logp"])
+        except (OSError, ValueError, KeyError):
+            pass
+    try:
+        return build(path)[1]
+    except OSError:
+        return LangID(*train(read_corpus(path)))
+
+def is_turkish(text, hint=None):
+    return load().turkish([text], [hint])[0][0]
+
+def main(argv):
+    if argv and argv[0] == "build":
+        path = argv[1] if len(argv) > 1 else LANGID_PATH
+        out, lid = build(path)
+        print(f"derlendi: {out} ({', '.join(lid.langs)}; {len(lid.keys)} n-gram)")
+        return 0
+    if argv:
+        for text, (lang, conf) in zip(argv, load().detect(argv)):
+            print(f"{lang or '-':3} {conf:5.2f}  {text}")
+        return 0
+    print(__doc__)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+load_harness.py - Ağsız uçtan uca yük testi: yerel besleme/makale sunucusu + sahte X v2 API.
+- record: bir botu gerçek ağda çalıştırır, tüm HTTP yanıtlarını (besleme, makale, X API)
+  cassette JSON'a yazar. İstek başlıkları (Authorization dahil) kaydedilmez.
+- run: botları değiştirmeden çalıştırır; requests'in giden istekleri yerel sunucuya yönlenir.
+  Sunucu önce cassette'e bakar, sonra senaryoyu üretir:
+    feedNNN.load.test/rss       -> N besleme x M kayıt (cassette varsa kayıtlı beslemelerden çoğaltılır)
+    feedNNN.load.test/a/..      -> makale sayfası (cassette'teki sayfa ya da sentetik)
+    api.twitter.com/2/...       -> create_tweet, get_me, get_user(s), get_users_tweets;
+                                   x-rate-limit-* başlıkları, kota bitince 429
+- Her hedef geçici bir çalışma klasöründe (kendi rss_sources.txt / sources.txt / durum dosyaları)
+  çalışır; süre, istek türüne göre gecikme p50/p95, 429 ve tweet sayıları rapora yazılır.
+
+Kullanım:
+    python load_harness.py record rss --out cassettes/rss.json
+    python load_harness.py run --targets rss,repost,rewriter --feeds 500 --items 50 --report load_report.json
+    python load_harness.py run --targets rss --cassette cassettes/rss.json --feeds 100 --latency-ms 40
+    python load_harness.py run --targets runner      # rss + repost + rewriter tek süreçte (runner.py)
+    python load_harness.py check                     # davranış kontrolleri; hata varsa çıkış kodu 1
+"""
+
+import os
+import re
+import io
+import sys
+import json
+import time
+import base64
+import random
+import shutil
+import tempfile
+import argparse
+import threading
+import email.utils
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LOAD_DOMAIN = "load.test"
+API_HOSTS = ("api.twitter.com", "api.x.com")
+ENV = {
+    "API_KEY": "k", "API_SECRET": "s", "ACCESS_TOKEN": "t", "ACCESS_TOKEN_SECRET": "ts", "BEARER_TOKEN": "b",
+    "TW_API_KEY": "k", "TW_API_SECRET": "s", "TW_ACCESS_TOKEN": "t", "TW_ACCESS_SECRET": "ts",
+}
+
+# ——— Cassette ————————————————————————————————————————————————
+
+def cassette_key(method, url):
+    p = urlsplit(url)
+    return f"{method.upper()} {p.hostname}{p.path or '/'}" + (f"?{p.query}" if p.query else "")
+
+def load_cassette(path):
+    if not path:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    out = {}
+    for key, rec in data.get("responses", {}).items():
+        body = base64.b64decode(rec["body_b64"]) if "body_b64" in rec else rec.get("body", "").encode("utf-8")
+        out[key] = (rec["status"], rec.get("content_type", ""), body)
+    return out
+
+def save_cassette(path, responses):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = {}
+    for key, (status, ctype, body) in responses.items():
+        rec = {"status": status, "content_type": ctype}
+        try:
+            rec["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            rec["body_b64"] = base64.b64encode(body).decode("ascii")
+        data[key] = rec
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "recorded_at": int(time.time()), "responses": data}, f, ensure_ascii=False)
+
+def is_feed(ctype, body):
+    return "xml" in ctype or "rss" in ctype or body.lstrip()[:5] in (b"<?xml", b"<rss ", b"<feed")
+
+# ——— İstemci tarafı: yönlendirme, kayıt, ölçüm ————————————————————————
+
+class Meter:
+    """İstemci tarafı istek ölçümü: tür -> [süre], durum sayıları."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.lat = {}
+        self.status = {}
+
+    def add(self, kind, seconds, status):
+        with self.lock:
+            self.lat.setdefault(kind, []).append(seconds)
+            k = f"{kind}:{status}"
+            self.status[k] = self.status.get(k, 0) + 1
+
+def request_kind(host, path):
+    if host in API_HOSTS:
+        return "api " + re.sub(r"/\d{3,}", "/:id", re.sub(r"/by/username/[^/]+", "/by/username/:u", path))
+    if host.endswith(LOAD_DOMAIN):
+        return "feed" if path.endswith("/rss") else "article"
+    return "other"
+
+@contextmanager
+def patched_send(redirect_port=None, recorder=None, meter=None):
+    """
+    requests'in tüm HTTPAdapter.send çağrılarını sarar:
+    - redirect_port: URL yerel sunucuya çevrilir, asıl host X-Orig-Host başlığında gider
+    - recorder: yanıt gövdesi okunup dict'e yazılır (akış yanıtları bellekten yeniden sunulur)
+    - meter: tür bazında süre/durum
+    """
+    orig = HTTPAdapter.send
+
+    def send(self, request, **kw):
+        p = urlsplit(request.url)
+        host, path = p.hostname or "", p.path or "/"
+        key = cassette_key(request.method, request.url)
+        if redirect_port:
+            request.headers["X-Orig-Host"] = host
+            request.url = f"http://127.0.0.1:{redirect_port}{path}" + (f"?{p.query}" if p.query else "")
+            kw["proxies"] = {}
+        t0 = time.perf_counter()
+        resp = orig(self, request, **kw)
+        if meter is not None:
+            meter.add(request_kind(host, path), time.perf_counter() - t0, resp.status_code)
+        if recorder is not None:
+            body = resp.content
+            resp.raw = io.BytesIO(body)  # stream=True okuyan kod (read_feed) için
+            recorder[key] = (resp.status_code, resp.headers.get("Content-Type", ""), body)
+        return resp
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = orig
+
+# ——— Senaryo: beslemeler, makaleler, X hesapları ——————————————————————————
+
+WORDS = ("Bakan", "açıklama", "yaptı", "ekonomi", "dolar", "seçim", "deprem", "maç", "transfer",
+         "Merkez Bankası", "faiz", "kararı", "İstanbul", "Ankara", "gündem", "son dakika")
+
+class Scenario:
+    def __init__(self, feeds, items, accounts, tweets_per_user, seed=1, cassette=None):
+        self.feeds, self.items = feeds, items
+        self.accounts, self.tweets_per_user = accounts, tweets_per_user
+        self.seed = seed
+        self.now = time.time()
+        self.cassette = cassette or {}
+        self.templates = [body for key, (st, ct, body) in sorted(self.cassette.items())
+                          if key.startswith("GET ") and st == 200 and is_feed(ct, body)]
+
+    def feed_urls(self):
+        return [f"http://feed{i:04d}.{LOAD_DOMAIN}/rss" for i in range(self.feeds)]
+
+    def usernames(self):
+        return [f"hesap{i:03d}" for i in range(self.accounts)]
+
+    def _sentence(self, rnd):
+        return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(6, 14))).capitalize() + "."
+
+    def feed_xml(self, i):
+        host = f"feed{i:04d}.{LOAD_DOMAIN}"
+        if self.templates:
+            # kayıtlı beslemeyi çoğalt; bağlantılar bu hosta çevrilir (makale: /c/<asıl host>/<yol>)
+            tpl = self.templates[i % len(self.templates)]
+            return re.sub(rb"(<(?:link|guid)[^>]*>\s*(?:<!\[CDATA\[)?\s*|href=[\"'])https?://",
+                          rb"\1http://" + host.encode() + b"/c/", tpl)
+        rnd = random.Random(self.seed * 100003 + i)
+        items = []
+        for k in range(self.items):
+            title = self._sentence(rnd)[:90]
+            items.append(
+                f"<item><title>Son dakika {title}</title><link>http://{host}/a/{k}</link>"
+                # tek cümlelik özet -> bot makaleyi çeker; iki cümle -> besleme metni yeter
+                f"<guid>{host}-{k}</guid><description>{self._sentence(rnd)}"
+                + (f" {self._sentence(rnd)}" if k % 2 else "") + "</description>"
+                f"<pubDate>{email.utils.formatdate(self.now - k * 300)}</pubDate></item>"
+            )
+        return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>{host}</title>'
+                + "".join(items) + "</channel></rss>").encode("utf-8")
+
+    def article_html(self, host, path):
+        if path.startswith("/c/"):
+            orig = "GET " + path[3:]
+            if orig in self.cassette:
+                return self.cassette[orig][2]
+        rnd = random.Random(hash((self.seed, host, path)))
+        paras = "".join(f"<p>{self._sentence(rnd)} {self._sentence(rnd)}</p>" for _ in range(rnd.randint(4, 12)))
+        nav = "".join(f"<li><a href='/k/{k}'>Kategori {k}</a></li>" for k in range(30))
+        return (f"<html><head><title>Haber</title><meta property='og:image' content='http://{host}/img/1.jpg'>"
+                f"</head><body><nav><ul>{nav}</ul></nav><article><h1>Başlık</h1>{paras}</article>"
+                "<footer>Tüm hakları saklıdır</footer></body></html>").encode("utf-8")
+
+    def user_tweets(self, uid, since_id=None, max_results=10):
+        rnd = random.Random(self.seed * 7919 + uid)
+        base = 10 ** 15 + uid * 10 ** 6
+        tweets = []
+        for k in range(self.tweets_per_user):
+            tid = base + k
+            if since_id and tid <= int(since_id):
+                continue
+            tweets.append({"id": str(tid), "text": f"Son dakika: {self._sentence(rnd)} https://t.co/x{k}",
+                           "edit_history_tweet_ids": [str(tid)], "lang": "tr", "created_at": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(self.now - k * 60)),
+                           "attachments": {"media_keys": [f"3_{tid}"]}})
+        tweets.sort(key=lambda t: int(t["id"]), reverse=True)
+        return tweets[:max_results]
+
+class FakeX:
+    """Sahte X v2: uç nokta başına pencere/kota; her yanıtta x-rate-limit-* başlıkları."""
+
+    LIMITS = {"POST /2/tweets": "post", "GET /2/users/:id/tweets": "timeline"}
+
+    def __init__(self, scenario, post_limit=100, read_limit=900, window=15.0):
+        self.sc = scenario
+        self.limits = {"post": post_limit, "timeline": read_limit, "other": read_limit}
+        self.window = window
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.tweets = []
+        self.served_429 = 0
+
+    def _take(self, bucket):
+        now = time.time()
+        with self.lock:
+            used, reset = self.buckets.get(bucket, (0, now + self.window))
+            if now >= reset:
+                used, reset = 0, now + self.window
+            limit = self.limits[bucket]
+            ok = used < limit
+            if ok:
+                used += 1
+            else:
+                self.served_429 += 1
+            self.buckets[bucket] = (used, reset)
+        headers = {"x-rate-limit-limit": str(limit), "x-rate-limit-remaining": str(max(0, limit - used)),
+                   "x-rate-limit-reset": str(int(reset))}
+        return ok, headers
+
+    def handle(self, method, path, query, body):
+        route = re.sub(r"/\d{3,}", "/:id", path)
+        ok, headers = self._take(self.LIMITS.get(f"{method} {route}", "other"))
+        if not ok:
+            return 429, headers, {"title": "Too Many Requests", "status": 429}
+        users = self.sc.usernames()
+        if method == "POST" and path == "/2/tweets":
+            data = json.loads(body or b"{}")
+            with self.lock:
+                tid = str(2 * 10 ** 18 + len(self.tweets))
+                self.tweets.append((tid, data.get("text", "")))
+            return 201, headers, {"data": {"id": tid, "text": data.get("text", ""), "edit_history_tweet_ids": [tid]}}
+        if path == "/2/users/me":
+            return 200, headers, {"data": {"id": "1", "name": "Yük Testi", "username": "yuktesti"}}
+        m = re.fullmatch(r"/2/users/by/username/([^/]+)", path)
+        if m:
+            name = m.group(1)
+            if name not in users:
+                return 200, headers, {"errors": [{"detail": f"Could not find user with username: [{name}]."}]}
+            return 200, headers, {"data": {"id": str(users.index(name) + 100), "name": name, "username": name}}
+        if path == "/2/users/by":
+            names = [n for n in query.get("usernames", [""])[0].split(",") if n in users]
+            return 200, headers, {"data": [{"id": str(users.index(n) + 100), "name": n, "username": n} for n in names]}
+        m = re.fullmatch(r"/2/users/(\d+)/tweets", path)
+        if m:
+            tws = self.sc.user_tweets(int(m.group(1)), query.get("since_id", [None])[0],
+                                      int(query.get("max_results", ["10"])[0]))
+            resp = {"data": tws, "meta": {"result_count": len(tws)}}
+            if tws and "expansions" in query:
+                resp["includes"] = {"media": [{"media_key": t["attachments"]["media_keys"][0], "type": "photo",
+                                               "url": f"https://pbs.twimg.com/media/{t['id']}.jpg"} for t in tws]}
+            if not tws:
+                resp.pop("data")
+            return 200, headers, resp
+        return 404, headers, {"title": "Not Found Error", "detail": path}
+
+JPEG = bytes.fromhex("ffd8ffe000104a46494600010100000100010000ffd9")
+
+def make_handler(scenario, fakex, latency_ms, jitter):
+    pause = time.sleep  # hedef --no-sleep ile time.sleep'i yamasa da sunucu gecikmesi sürer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, ctype, body, headers=None):
+            if latency_ms:
+                pause(max(0.0, random.gauss(latency_ms, latency_ms * jitter)) / 1000)
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _route(self, method):
+            host = (self.headers.get("X-Orig-Host") or "").lower()
+            p = urlsplit(self.path)
+            path, query = p.path, parse_qs(p.query)
+            n = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(n) if n else b""
+
+            key = cassette_key(method, f"http://{host}{self.path}")
+            if key in scenario.cassette and host not in API_HOSTS:
+                st, ct, data = scenario.cassette[key]
+                return self._reply(st, ct or "application/octet-stream", data)
+            if host in API_HOSTS:
+                st, headers, obj = fakex.handle(method, path, query, body)
+                return self._reply(st, "application/json", json.dumps(obj).encode("utf-8"), headers)
+            if host == "pbs.twimg.com" or path.endswith((".jpg", ".jpeg", ".png")):
+                return self._reply(200, "image/jpeg", JPEG)
+            m = re.fullmatch(r"feed(\d+)\." + re.escape(LOAD_DOMAIN), host)
+            if m and path == "/rss":
+                return self._reply(200, "application/rss+xml; charset=utf-8", scenario.feed_xml(int(m.group(1))))
+            if m:
+                return self._reply(200, "text/html; charset=utf-8", scenario.article_html(host, path))
+            return self._reply(404, "text/plain", b"not found")
+
+        def do_GET(self):
+            self._route("GET")
+
+        def do_POST(self):
+            self._route("POST")
+
+        def do_HEAD(self):
+            self._route("HEAD")
+
+        def log_message(self, *a):
+            pass
+
+    return Handler
+
+def start_server(handler):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    srv.daemon_threads = True
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+# ——— Hedefler ——————————————————————————————————————————————————
+
+def target_rss(args):
+    import auto_rss_bot
+    auto_rss_bot.run_bot(dry=args.dry, max_posts=args.max_posts, per_feed=args.per_feed, deadline=args.deadline)
+
+def target_repost(args):
+    import auto_repost_bot
+    auto_repost_bot.main([])
+
+def target_rewriter(args):
+    import auto_rewriter
+    no_sleep = mock.patch.object(auto_rewriter.time, "sleep", lambda s: None) if args.no_sleep else nullcontext()
+    with no_sleep:
+        auto_rewriter.main(["--limit", str(args.per_feed), "--max-results", "5"] + ([] if args.dry else ["--post"]))
+
+def target_runner(args):
+    # tüm eklentiler tek süreçte; tempo beklemesi yük testinde kapalı
+    import runner
+    os.environ.setdefault("POST_GAP", "0")
+    runner.main(["--once", "--force", "--only", "rss,repost,rewriter"] + (["--dry"] if args.dry else []))
+
+TARGETS = {"rss": target_rss, "repost": target_repost, "rewriter": target_rewriter, "runner": target_runner}
+
+@contextmanager
+def workdir(feeds, users):
+    """Geçici çalışma klasörü: kaynak dosyaları yazılır, botların durum dosyaları burada kalır."""
+    old = os.getcwd()
+    d = tempfile.mkdtemp(prefix="load_")
+    with open(os.path.join(d, "rss_sources.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join(feeds) + "\n")
+    with open(os.path.join(d, "sources.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join("@" + u for u in users) + "\n")
+    os.chdir(d)
+    try:
+        yield d
+    finally:
+        os.chdir(old)
+        shutil.rmtree(d, ignore_errors=True)
+
+def pct(values, q):
+    if not values:
+        return None
+    s = sorted(values)
+    return s[min(len(s) - 1, int(round(q * (len(s) - 1))))]
+
+def run_target(name, args, scenario, fakex, port, quiet):
+    meter = Meter()
+    fakex.buckets.clear()  # her hedef kendi kota penceresiyle başlar
+    posts0, r429 = len(fakex.tweets), fakex.served_429
+    with workdir(scenario.feed_urls(), scenario.usernames()), patched_send(redirect_port=port, meter=meter):
+        out = io.StringIO()
+        t0 = time.perf_counter()
+        error = None
+        try:
+            if quiet:
+                from contextlib import redirect_stdout
+                with redirect_stdout(out):
+                    TARGETS[name](args)
+            else:
+                TARGETS[name](args)
+        except SystemExit as ex:
+            error = f"SystemExit({ex.code})" if ex.code not in (0, None) else None
+        except Exception as ex:
+            error = f"{type(ex).__name__}: {ex}"
+        wall = time.perf_counter() - t0
+
+    kinds = {}
+    for kind, lat in sorted(meter.lat.items()):
+        kinds[kind] = {"n": len(lat), "p50_ms": round(pct(lat, 0.5) * 1000, 2), "p95_ms": round(pct(lat, 0.95) * 1000, 2),
+                       "max_ms": round(max(lat) * 1000, 2)}
+    n_req = sum(len(v) for v in meter.lat.values())
+    feeds = kinds.get("feed", {}).get("n", 0)
+    posts = len(fakex.tweets) - posts0
+    return {
+        "target": name, "wall_s": round(wall, 3), "requests": n_req, "req_per_s": round(n_req / wall, 1) if wall else None,
+        "feeds_read": feeds, "feeds_per_s": round(feeds / wall, 1) if wall else None,
+        "tweets_created": posts, "served_429": fakex.served_429 - r429,
+        "status": dict(sorted(meter.status.items())), "latency": kinds, "error": error,
+    }
+
+def format_report(rep):
+    lines = [f"senaryo: {rep['scenario']}"]
+    for r in rep["results"]:
+        lines.append(f"\n[{r['target']}] {r['wall_s']:.2f} sn | {r['requests']} istek ({r['req_per_s']}/sn) | "
+                     f"besleme {r['feeds_read']} ({r['feeds_per_s']}/sn) | tweet {r['tweets_created']} | 429 {r['served_429']}"
+                     + (f" | HATA {r['error']}" if r["error"] else ""))
+        for kind, v in r["latency"].items():
+            lines.append(f"  {kind:34} n={v['n']:<6} p50 {v['p50_ms']:8.2f} ms  p95 {v['p95_ms']:8.2f} ms  max {v['max_ms']:8.2f} ms")
+    return "\n".join(lines)
+
+# ——— Komutlar —————————————————————————————————————————————————
+
+def cmd_record(args):
+    recorder = {}
+    with patched_send(recorder=recorder):
+        try:
+            TARGETS[args.target](args)
+        except SystemExit:
+            pass
+    save_cassette(args.out, recorder)
+    print(f"kaydedildi: {args.out} ({len(recorder)} yanıt)")
+
+def serve(args, cassette=None):
+    """Senaryo + sahte X + yerel sunucu; botların ortamı (sahte anahtarlar, asset yolları) hazırlanır."""
+    sc = Scenario(args.feeds, args.items, args.accounts, args.tweets_per_user, args.seed, cassette)
+    fakex = FakeX(sc, args.post_limit, args.read_limit, args.window)
+    srv = start_server(make_handler(sc, fakex, args.latency_ms, args.jitter))
+    os.environ.update(ENV)
+    for var, name in (("GAZETTEER_PATH", "gazetteer.tsv"), ("PARAPHRASE_PATH", "paraphrase.tsv"),
+                      ("LANGID_PATH", "langid.tsv"), ("RUNNER_CONFIG", "runner.yaml")):
+        os.environ.setdefault(var, os.path.join(HERE, "assets", name))
+    sys.path.insert(0, HERE)
+    return sc, fakex, srv
+
+def cmd_run(args):
+    cassette = load_cassette(args.cassette)
+    sc, fakex, srv = serve(args, cassette)
+    port = srv.server_address[1]
+
+    scenario = {"feeds": args.feeds, "items": args.items, "accounts": args.accounts,
+                "tweets_per_user": args.tweets_per_user, "latency_ms": args.latency_ms,
+                "post_limit": args.post_limit, "window_s": args.window,
+                "cassette": args.cassette, "cassette_feeds": len(sc.templates)}
+    results = []
+    try:
+        for name in args.targets.split(","):
+            name = name.strip()
+            print(f"→ {name} çalışıyor...", flush=True)
+            results.append(run_target(name, args, sc, fakex, port, not args.verbose))
+    finally:
+        srv.shutdown()
+    rep = {"scenario": scenario, "results": results, "finished_at": int(time.time())}
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(rep, f, ensure_ascii=False, indent=2)
+    print(format_report(rep))
+    print(f"\nrapor: {args.report}")
+
+# ——— Kontroller ————————————————————————————————————————————————
+
+def check_rss_deferred(args, sc, port):
+    """
+    Zamanlayıcı (saatte 1 gönderi) ikinci haberi ertelerse haber görüldü sayılmamalı:
+    rss_state'te pending'de kalmalı, seen'e girmemeli.
+    """
+    with workdir(sc.feed_urls(), sc.usernames()), patched_send(redirect_port=port):
+        import auto_rss_bot
+        import x_client
+        sched = x_client.PostScheduler(gap=0, per_hour=1, path="runner_state.json")
+        client = x_client.ScheduledClient(x_client.client(), sched, "rss")
+        auto_rss_bot.run_bot(dry=False, max_posts=5, per_feed=2, client=client)
+        with open(auto_rss_bot.STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    counts = sched.counts.get("rss", {})
+    pending = [uid for st in state.values() for uid in st.get("pending", [])]
+    seen = {uid for st in state.values() for uid in st.get("seen", [])}
+    errs = []
+    if counts.get("sent") != 1 or counts.get("deferred") != 1:
+        errs.append(f"zamanlayıcı sayımı {counts} (1 gönderildi, 1 ertelendi bekleniyordu)")
+    if not pending:
+        errs.append("ertelenen haber pending'de yok")
+    if seen & set(pending):
+        errs.append("ertelenen haber seen'e yazılmış")
+    return errs
+
+CHECKS = {"rss-ertelenen": check_rss_deferred}
+
+def cmd_check(args):
+    sc, fakex, srv = serve(args)
+    port = srv.server_address[1]
+    failed = 0
+    try:
+        for name, fn in CHECKS.items():
+            out = io.StringIO()
+            with redirect_stdout(out):
+                errs = fn(args, sc, port)
+            failed += bool(errs)
+            print(f"{name:20} {'TAMAM' if not errs else 'HATA: ' + '; '.join(errs)}")
+            if errs and args.verbose:
+                print(out.getvalue())
+    finally:
+        srv.shutdown()
+    sys.exit(1 if failed else 0)
+
+def main():
+    ap = argparse.ArgumentParser(description="Ağsız yük testi")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    def common(p):
+        p.add_argument("--dry", action="store_true", help="Botlar tweet atmasın (API yine okunur)")
+        p.add_argument("--max-posts", type=int, default=50)
+        p.add_argument("--per-feed", type=int, default=2)
+        p.add_argument("--deadline", type=float, default=None)
+        p.add_argument("--no-sleep", action="store_true", help="auto_rewriter'ın 1 sn beklemesini atla")
+
+    rec = sub.add_parser("record", help="Gerçek ağda çalıştır, yanıtları kaydet")
+    rec.add_argument("target", choices=sorted(TARGETS))
+    rec.add_argument("--out", default=os.path.join("cassettes", "record.json"))
+    common(rec)
+
+    run = sub.add_parser("run", help="Yerel sunucu + sahte API ile ölç")
+    run.add_argument("--targets", default="rss,repost,rewriter")
+    run.add_argument("--cassette")
+    run.add_argument("--feeds", type=int, default=50)
+    run.add_argument("--items", type=int, default=20)
+    run.add_argument("--accounts", type=int, default=10)
+    run.add_argument("--tweets-per-user", type=int, default=20)
+    run.add_argument("--latency-ms", type=float, default=0.0, help="Sunucu yanıt gecikmesi (ortalama)")
+    run.add_argument("--jitter", type=float, default=0.3, help="Gecikme std / ortalama")
+    run.add_argument("--post-limit", type=int, default=100, help="Pencere başına create_tweet kotası")
+    run.add_argument("--read-limit", type=int, default=900)
+    run.add_argument("--window", type=float, default=15.0, help="Kota penceresi (sn)")
+    run.add_argument("--seed", type=int, default=1)
+    run.add_argument("--report", default="load_report.json")
+    run.add_argument("--verbose", action="store_true", help="Bot çıktısını göster")
+    common(run)
+
+    chk = sub.add_parser("check", help="Davranış kontrolleri (küçük senaryo, yerel sunucu)")
+    for flag, default in (("--feeds", 2), ("--items", 5), ("--accounts", 1), ("--tweets-per-user", 1),
+                          ("--post-limit", 100), ("--read-limit", 900), ("--seed", 1)):
+        chk.add_argument(flag, type=int, default=default)
+    chk.add_argument("--latency-ms", type=float, default=0.0)
+    chk.add_argument("--jitter", type=float, default=0.0)
+    chk.add_argument("--window", type=float, default=15.0)
+    chk.add_argument("--verbose", action="store_true", help="Hatalı kontrolün bot çıktısını göster")
+
+    args = ap.parse_args()
+    {"record": cmd_record, "run": cmd_run, "check": cmd_check}[args.cmd](args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+mem_budget.py - Uzun çalıştırmalar için bellek görünürlüğü ve tavanı.
+- Profil modu (MEM_PROFILE=1 / --mem-profile): tracemalloc açılır; aşama (stage) ve
+  besleme/host (track) başına tepe ve kalıcı (çıkışta kalan) bellek kaydedilir; sonda en çok
+  bellek tutan satırlar ve başlangıca göre büyüyen satırlar listelenir.
+- Tavan (MEM_CEILING_MB / --mem-ceiling): süreç + alt süreçlerin RSS'i izlenir. Tavanın
+  SOFT_RATIO'sunda baskı 1 (küçük partiler, küçük bayt sınırı), HARD_RATIO'sunda baskı 2
+  (yeni iş alınmaz, sayfa çekilmez). Bot OOM ile öldürülmek yerine işi azaltır.
+- Süreç havuzu fork ile açıldıysa işçiler tracemalloc'u devralır; işçideki tepe bellek
+  (ayrıştırma ağaçları) observe ile host kaydına eklenir.
+Profil ve tavan kapalıyken stage/track maliyetsizdir.
+
+Kullanım:
+    mem = MemoryBudget(profile=True, ceiling_mb=400)
+    with mem.stage("besleme"):
+        with mem.track("feed", url): ...
+    if mem.pressure() >= 2: ...          # iş bırak
+    print(mem.report())
+"""
+
+import os
+import gc
+import resource
+import threading
+import tracemalloc
+import multiprocessing
+from contextlib import contextmanager
+
+MEM_PROFILE = os.environ.get("MEM_PROFILE", "").lower() in ("1", "true", "yes")
+MEM_CEILING_MB = float(os.environ.get("MEM_CEILING_MB", "0")) or None
+MEM_FRAMES = int(os.environ.get("MEM_FRAMES", "1"))  # tracemalloc yığın derinliği
+SOFT_RATIO = 0.8
+HARD_RATIO = 0.95
+PAGE_MAX_BYTES = 3 * 1024 * 1024      # normalde sayfa başına üst sınır
+PAGE_SHED_BYTES = 512 * 1024          # baskı 1'de
+TOP_SITES = 10
+MB = 1024 * 1024
+
+def _resident(pid="self"):
+    """
+    Sürecin bellek payı: PSS (fork ile paylaşılan sayfalar süreçler arasında bölünür, toplam
+    çift saymaz); smaps_rollup yoksa statm RSS.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def rss_bytes():
+    """Bu süreç + canlı alt süreçlerin (süreç havuzu) bellek payı. /proc yoksa tepe RSS."""
+    own = _resident()
+    if own is None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return own + sum(_resident(p.pid) or 0 for p in multiprocessing.active_children())
+
+def peak_rss_bytes():
+    self_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return (self_kb + child_kb) * 1024
+
+class _Frame:
+    __slots__ = ("start", "peak", "rss0")
+
+    def __init__(self, start, peak, rss0):
+        self.start, self.peak, self.rss0 = start, peak, rss0
+
+class MemoryBudget:
+    def __init__(self, profile=MEM_PROFILE, ceiling_mb=MEM_CEILING_MB, frames=MEM_FRAMES):
+        self.profile = profile
+        self.ceiling = ceiling_mb * MB if ceiling_mb else None
+        self.records = {}     # (tür, anahtar) -> {"n", "peak", "retained", "rss", "bytes"}
+        self.sheds = {}       # baskı seviyesi -> kaç kez gözlendi
+        self.max_rss = 0
+        self._stack = []
+        self._lock = threading.Lock()
+        self._baseline = None
+        if profile:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            self._baseline = tracemalloc.take_snapshot()
+
+    @property
+    def enabled(self):
+        return self.profile or self.ceiling is not None
+
+    def _rec(self, kind, key):
+        rec = self.records.get((kind, key))
+        if rec is None:
+            rec = self.records[(kind, key)] = {"n": 0, "peak": 0, "retained": 0, "rss": 0, "bytes": 0}
+        return rec
+
+    # ——— ölçüm ———————————————————————————————————————
+
+    @contextmanager
+    def track(self, kind, key):
+        """
+        Gövde boyunca tracemalloc tepe/kalıcı bellek ve RSS farkı (kind, key) kaydına eklenir.
+        İç içe kullanılabilir (dış kayıt iç tepeyi de görür); tek iş parçacığından çağrılmalı.
+        """
+        if not self.enabled:
+            yield
+            return
+        cur = peak = 0
+        if self.profile:
+            cur, peak = tracemalloc.get_traced_memory()
+            for f in self._stack:
+                f.peak = max(f.peak, peak)
+            tracemalloc.reset_peak()
+        frame = _Frame(cur, cur, rss_bytes())
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            rec = self._rec(kind, key)
+            rec["n"] += 1
+            rss1 = rss_bytes()
+            self.max_rss = max(self.max_rss, rss1)
+            rec["rss"] += rss1 - frame.rss0
+            if self.profile:
+                cur, peak = tracemalloc.get_traced_memory()
+                frame.peak = max(frame.peak, peak)
+                for f in self._stack:
+                    f.peak = max(f.peak, peak)
+                rec["peak"] = max(rec["peak"], frame.peak - frame.start)
+                rec["retained"] += cur - frame.start
+
+    def stage(self, name):
+        return self.track("aşama", name)
+
+    def note(self, kind, key, peak=None, nbytes=0):
+        """
+        İş parçacığı/süreçten gelen ölçüm: tepe (işçide ölçülen) ve tutulan bayt (en büyüğü).
+        peak verilen her çağrı bir iş sayılır.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            rec = self._rec(kind, key)
+            if peak is not None:
+                rec["n"] += 1
+                rec["peak"] = max(rec["peak"], peak)
+            rec["bytes"] = max(rec["bytes"], nbytes or 0)
+
+    # ——— tavan ———————————————————————————————————————
+
+    def pressure(self):
+        """0: serbest, 1: tavanın SOFT_RATIO'su aşıldı, 2: HARD_RATIO aşıldı."""
+        if self.ceiling is None:
+            return 0
+        rss = rss_bytes()
+        self.max_rss = max(self.max_rss, rss)
+        level = 2 if rss >= self.ceiling * HARD_RATIO else 1 if rss >= self.ceiling * SOFT_RATIO else 0
+        if level:
+            if not self.sheds:
+                gc.collect()
+            self.sheds[level] = self.sheds.get(level, 0) + 1
+        return level
+
+    def scale(self, n):
+        """Parti/derinlik: baskı 1'de dörtte bir, 2'de 1."""
+        level = self.pressure()
+        return n if level == 0 else max(1, n // 4) if level == 1 else 1
+
+    def page_cap(self):
+        """Sayfa başına bayt sınırı; baskı 2'de 0 (sayfa çekme)."""
+        level = self.pressure()
+        return PAGE_MAX_BYTES if level == 0 else PAGE_SHED_BYTES if level == 1 else 0
+
+    # ——— rapor ———————————————————————————————————————
+
+    def top_sites(self, n=TOP_SITES):
+        """-> (en çok tutan satırlar, başlangıca göre en çok büyüyen satırlar)."""
+        if not self.profile:
+            return [], []
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        held = snap.statistics("lineno")[:n]
+        grown = [d for d in snap.compare_to(self._baseline, "lineno") if d.size_diff > 0][:n]
+        return held, grown
+
+    def report(self, top=TOP_SITES):
+        if not self.enabled:
+            return ""
+        fmt = lambda b: f"{b / MB:8.2f}"
+        now = rss_bytes()
+        lines = [f"RSS şimdi {now / MB:.1f} MB | en yüksek {max(self.max_rss, now) / MB:.1f} MB"
+                 f" | tepe (ru_maxrss) {peak_rss_bytes() / MB:.1f} MB"
+                 + (f" | tavan {self.ceiling / MB:.0f} MB" if self.ceiling else "")]
+        if self.sheds:
+            lines.append("iş azaltma: " + ", ".join(f"baskı {k}: {v} kontrol" for k, v in sorted(self.sheds.items())))
+        kinds = []
+        for kind, _ in self.records:
+            if kind not in kinds:
+                kinds.append(kind)
+        for kind in kinds:
+            rows = sorted(((k, r) for (t, k), r in self.records.items() if t == kind),
+                          key=lambda kr: (kr[1]["peak"], kr[1]["bytes"]), reverse=True)
+            lines.append(f"\n{kind:34} {'n':>5} {'tepe MB':>8} {'kalan MB':>8} {'RSS Δ':>8} {'bayt MB':>8}")
+            for key, r in rows[:top]:
+                lines.append(f"{str(key)[:34]:34} {r['n']:>5} {fmt(r['peak'])} {fmt(r['retained'])} {fmt(r['rss'])} {fmt(r['bytes'])}")
+            if len(rows) > top:
+                lines.append(f"... {len(rows) - top} kayıt daha")
+        held, grown = self.top_sites(top)
+        if held:
+            lines.append("\nEn çok bellek tutan satırlar:")
+            lines += [f"  {s.size / 1024:9.1f} KB {s.count:>7} blok  {s.traceback[0]}" for s in held]
+        if grown:
+            lines.append("Başlangıca göre büyüyen satırlar:")
+            lines += [f"  +{d.size_diff / 1024:8.1f} KB {d.count_diff:>+7} blok  {d.traceback[0]}" for d in grown]
+        return "\n".join(lines)
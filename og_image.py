@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+og_image.py - Haber sayfasının paylaşım görseli (og:image / twitter:image) seçimi.
+- candidates(doc, P): zaten ayrıştırılmış sayfadan aday görsel adresleri, öncelik sırasıyla
+  (og:image:secure_url, og:image, og:image:url, twitter:image, twitter:image:src,
+  <link rel="image_src">). Ayrı sayfa isteği yok; makale ayrıştırmasıyla aynı ağaç.
+- Logo/yer tutucu adaylar adresten elenir (logo, placeholder, no-image, favicon, sprite...).
+- probe(): tek aralıklı GET (Range: bytes=0-PROBE_BYTES-1). Yanıt başlığı HEAD ile aynı
+  bilgiyi verir (tür, toplam boyut: Content-Range/Content-Length); ilk baytlardan PNG/JPEG/
+  WebP/GIF genişlik-yükseklik okunur. Ayrı HEAD + GET turu yok; görsel PROBE_BYTES'tan
+  küçükse indirilmiş de olur.
+- pick(): adaylar iş parçacıklarında eşzamanlı yoklanır, uygun olanların en öncelikli olanı
+  seçilir: jpeg/png/webp, <= MAX_BYTES (X sınırı 5 MB), en az MIN_WIDTH x MIN_HEIGHT,
+  en/boy oranı makul.
+- İstekler verilirse HostBook üzerinden (devre kesici, uyarlanır zaman aşımı) ve Deadline'a
+  kısılarak yapılır.
+
+Kullanım:
+    urls = candidates(doc, P)                       # ayrıştırma sırasında
+    img = pick([urljoin(link, u) for u in urls], hosts=HOSTS, deadline=budget)
+    if img: media_id = x_client.upload_media(data=fetch(img), filename=img.filename)
+    python og_image.py <sayfa-adresi>               # sayfanın başından adayları yokla
+"""
+
+import os
+import re
+import sys
+import struct
+import concurrent.futures as cf
+from contextlib import nullcontext
+from urllib.parse import urljoin, urlparse
+
+import http_pool
+
+ATTACH_OG_IMAGE = os.environ.get("ATTACH_OG_IMAGE", "false").lower() == "true"
+HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; ValctkNewsBot/2.0)"}
+PROBE_BYTES = 32 * 1024
+HEAD_BYTES = 96 * 1024        # sayfa başı (<head>) için kısmi indirme
+MAX_BYTES = 5 * 1024 * 1024
+MIN_WIDTH, MIN_HEIGHT = 300, 157
+MAX_ASPECT = 3.0
+TIMEOUT = 6
+WORKERS = 4
+TYPES = {"image/jpeg": "jpg", "image/png": "png", "image/webp": "webp"}
+META_KEYS = ("og:image:secure_url", "og:image", "og:image:url", "twitter:image", "twitter:image:src")
+LOGO_RE = re.compile(
+    r"(?:^|[/_.\-])(?:logo\w*|placeholder|default[-_]?(?:image|img|share|og)?|no[-_]?(?:image|img|photo)|"
+    r"blank|spacer|favicon|sprite|icons?|avatar|watermark|fallback)(?:[/_.\-]|$)", re.I)
+
+class Image:
+    __slots__ = ("url", "ctype", "size", "width", "height", "data")
+
+    def __init__(self, url, ctype, size, width, height, data=None):
+        self.url, self.ctype, self.size, self.width, self.height = url, ctype, size, width, height
+        self.data = data        # görselin tamamı probe'da geldiyse
+
+    @property
+    def filename(self):
+        return "og." + TYPES.get(self.ctype, "jpg")
+
+    def __str__(self):
+        kb = f"{self.size / 1024:.0f} KB" if self.size else "? KB"
+        return f"{self.url} ({self.ctype}, {self.width}x{self.height}, {kb})"
+
+def candidates(doc, P):
+    """Ayrıştırılmış sayfa -> [görsel adresi] (öncelik sırasıyla, tekrarsız, ham/göreli olabilir)."""
+    found = {}
+    for m in P.find_all(doc, "meta"):
+        key = (P.attr(m, "property") or P.attr(m, "name") or "").strip().lower()
+        if key in META_KEYS:
+            url = (P.attr(m, "content") or "").strip()
+            if url:
+                found.setdefault(key, []).append(url)
+    for link in P.find_all(doc, "link"):
+        if "image_src" in (P.attr(link, "rel") or ""):
+            href = (P.attr(link, "href") or "").strip()
+            if href:
+                found.setdefault("image_src", []).append(href)
+    out = []
+    for key in META_KEYS + ("image_src",):
+        for url in found.get(key, ()):
+            if url not in out:
+                out.append(url)
+    return out
+
+def looks_like_logo(url):
+    return bool(LOGO_RE.search(urlparse(url).path)) or urlparse(url).path.lower().endswith((".svg", ".ico"))
+
+def image_size(head):
+    """İlk baytlar -> (tür, genişlik, yükseklik) ya da (None, None, None)."""
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and len(head) >= 24:
+        w, h = struct.unpack(">II", head[16:24])
+        return "image/png", w, h
+    if head[:6] in (b"GIF87a", b"GIF89a") and len(head) >= 10:
+        w, h = struct.unpack("<HH", head[6:10])
+        return "image/gif", w, h
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+        kind = head[12:16]
+        if kind == b"VP8 ":
+            w, h = struct.unpack("<HH", head[26:30])
+            return "image/webp", w & 0x3FFF, h & 0x3FFF
+        if kind == b"VP8L":
+            b = int.from_bytes(head[21:25], "little")
+            return "image/webp", (b & 0x3FFF) + 1, ((b >> 14) & 0x3FFF) + 1
+        if kind == b"VP8X":
+            return "image/webp", int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+        return "image/webp", None, None
+    if head[:2] == b"\xff\xd8":
+        i = 2
+        while i + 9 < len(head):
+            if head[i] != 0xFF:
+                i += 1
+                continue
+            marker = head[i + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                i += 1 if marker == 0xFF else 2
+                continue
+            seg = struct.unpack(">H", head[i + 2:i + 4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                h, w = struct.unpack(">HH", head[i + 5:i + 9])
+                return "image/jpeg", w, h
+            i += 2 + seg
+        return "image/jpeg", None, None
+    return None, None, None
+
+def _guard(hosts, url, deadline):
+    if hosts is None:
+        return nullcontext(TIMEOUT if deadline is None else deadline.clip(TIMEOUT))
+    return hosts.guard(url)
+
+def probe(url, hosts=None, deadline=None, session=None):
+    """Aralıklı GET ile tür/boyut/ölçü -> Image ya da None (alınamadı / görsel değil)."""
+    session = session or http_pool.session()
+    try:
+        with _guard(hosts, url, deadline) as timeout:
+            if deadline is not None:
+                timeout = deadline.clip(timeout)
+            r = session.get(url, headers={**HEADERS, "Range": f"bytes=0-{PROBE_BYTES - 1}"},
+                            timeout=timeout, stream=True)
+            with r:
+                r.raise_for_status()
+                head = r.raw.read(PROBE_BYTES, decode_content=True) or b""
+    except Exception as ex:
+        print(f"→ Görsel yoklanamadı ({urlparse(url).hostname}): {ex}")
+        return None
+    total = None
+    crange = r.headers.get("Content-Range", "")
+    if "/" in crange and crange.rsplit("/", 1)[1].isdigit():
+        total = int(crange.rsplit("/", 1)[1])
+    elif r.status_code == 200 and r.headers.get("Content-Length", "").isdigit():
+        total = int(r.headers["Content-Length"])
+    sniffed, w, h = image_size(head)
+    ctype = sniffed or r.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    complete = total is not None and len(head) >= total
+    return Image(r.url, ctype, total, w, h, head if complete else None)
+
+def acceptable(img):
+    """-> None uygunsa, değilse sebep."""
+    if img.ctype not in TYPES:
+        return f"tür {img.ctype or '?'}"
+    if img.size and img.size > MAX_BYTES:
+        return f"çok büyük ({img.size // 1024} KB)"
+    if img.width is None or img.height is None:
+        return "ölçü okunamadı"
+    if img.width < MIN_WIDTH or img.height < MIN_HEIGHT:
+        return f"küçük ({img.width}x{img.height})"
+    if max(img.width / img.height, img.height / img.width) > MAX_ASPECT:
+        return f"oran ({img.width}x{img.height})"
+    return None
+
+def pick(urls, hosts=None, deadline=None, session=None, workers=WORKERS):
+    """Adayları eşzamanlı yokla -> en öncelikli uygun Image ya da None."""
+    urls = [u for u in dict.fromkeys(urls) if u.startswith(("http://", "https://"))]
+    urls = [u for u in urls if not looks_like_logo(u)]
+    if not urls:
+        return None
+    if len(urls) == 1:
+        probed = [probe(urls[0], hosts, deadline, session)]
+    else:
+        with cf.ThreadPoolExecutor(max_workers=min(workers, len(urls)), thread_name_prefix="og") as pool:
+            probed = list(pool.map(lambda u: probe(u, hosts, deadline, session), urls))
+    for img in probed:
+        if img is None:
+            continue
+        why = acceptable(img)
+        if why is None:
+            return img
+        print(f"→ Görsel elendi: {why} — {img.url}")
+    return None
+
+def fetch(img, hosts=None, deadline=None, session=None):
+    """Seçilen görselin baytları (probe'da tamamı geldiyse yeniden indirilmez) ya da None."""
+    if img.data is not None:
+        return img.data
+    session = session or http_pool.session()
+    try:
+        with _guard(hosts, img.url, deadline) as timeout:
+            if deadline is not None:
+                timeout = deadline.clip(timeout)
+            r = session.get(img.url, headers=HEADERS, timeout=timeout, stream=True)
+            with r:
+                r.raise_for_status()
+                data = r.raw.read(MAX_BYTES + 1, decode_content=True)
+    except Exception as ex:
+        print(f"→ Görsel indirilemedi ({urlparse(img.url).hostname}): {ex}")
+        return None
+    return data if len(data) <= MAX_BYTES else None
+
+def from_page_head(link, P, hosts=None, deadline=None, session=None):
+    """
+    Sayfası indirilmemiş bağlantı için: sadece ilk HEAD_BYTES (<head> meta'ları orada) alınır,
+    adaylar çıkarılıp seçilir. -> Image ya da None.
+    """
+    session = session or http_pool.session()
+    try:
+        with _guard(hosts, link, deadline) as timeout:
+            if deadline is not None:
+                timeout = deadline.clip(timeout)
+            r = session.get(link, headers=HEADERS, timeout=timeout, stream=True)
+            with r:
+                r.raise_for_status()
+                raw = r.raw.read(HEAD_BYTES, decode_content=True) or b""
+                encoding = r.encoding
+    except Exception as ex:
+        print(f"→ Sayfa başı alınamadı ({urlparse(link).hostname}): {ex}")
+        return None
+    doc = P.parse_html(raw.decode(encoding or "utf-8", errors="replace"))
+    return pick([urljoin(r.url, u) for u in candidates(doc, P)], hosts, deadline, session)
+
+def main(argv):
+    if not argv:
+        print(__doc__)
+        return 2
+    from page_parser import get_backend
+    P = get_backend()
+    for link in argv:
+        img = from_page_head(link, P)
+        print(f"{link}\n  -> {img or 'uygun görsel yok'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+page_parser.py - Değiştirilebilir HTML/XML ayrıştırıcı arka ucu.
+- "bs4":  BeautifulSoup + lxml tree builder (eski davranış, uyumluluk için)
+- "lxml": doğrudan lxml.html / lxml.etree (Python seviyesinde ağaç kurulmaz; daha az CPU/bellek)
+İkisi de aynı işlemleri sunar: select, find_all, text, meta, attr, drop, child_text.
+Seçim: get_backend("lxml") ya da bot başına env (örn. RSS_PARSER=bs4).
+"""
+
+import os
+from functools import lru_cache
+
+DEFAULT_BACKEND = os.environ.get("PARSER_BACKEND", "lxml")
+
+class SoupBackend:
+    name = "bs4"
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self._soup = BeautifulSoup
+
+    def parse_html(self, markup):
+        return self._soup(markup, "lxml")
+
+    def parse_xml(self, data):
+        return self._soup(data, "xml")
+
+    def select(self, node, css):
+        return node.select(css)
+
+    def find_all(self, node, tag, limit=None):
+        return node.find_all(tag, limit=limit)
+
+    def text(self, node):
+        """get_text(" ", strip=True)"""
+        return node.get_text(" ", strip=True)
+
+    def attr(self, node, name):
+        return node.get(name)
+
+    def tag(self, node):
+        return node.name
+
+    def meta(self, doc, key):
+        m = doc.find("meta", attrs={"property": key}) or doc.find("meta", attrs={"name": key})
+        return m.get("content") if m else None
+
+    def title(self, doc):
+        return doc.title.string if doc.title and doc.title.string else None
+
+    def drop(self, doc, tags):
+        for el in doc(tags):
+            el.decompose()
+
+    def child_text(self, node, tag):
+        """XML: ilk <tag> çocuğunun ham metni (yoksa "")."""
+        child = node.find(tag)
+        return child.text if child else ""
+
+class LxmlBackend:
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+        self._html = lxml.html
+        self._etree = etree
+        self._xml_parser = etree.XMLParser(recover=True, resolve_entities=False, huge_tree=True)
+        # get_text eşleniği: yorum/script/style metni hariç
+        self._xp_text = etree.XPath(".//text()[not(parent::script) and not(parent::style)]")
+
+    def parse_html(self, markup):
+        try:
+            try:
+                return self._html.document_fromstring(markup)
+            except ValueError:
+                # encoding bildirimli str
+                return self._html.document_fromstring(markup.encode("utf-8"))
+        except self._etree.ParserError:
+            # boş / sadece boşluk / sadece yorum: bs4 gibi boş ağaç ("Document is empty" yerine)
+            return self._html.document_fromstring("<html/>")
+
+    def parse_xml(self, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return self._etree.fromstring(data, self._xml_parser)
+
+    def select(self, node, css):
+        return _css(css)(node)
+
+    def find_all(self, node, tag, limit=None):
+        found = _local_xpath(tag)(node)
+        return found[:limit] if limit else found
+
+    def text(self, node):
+        return " ".join(t.strip() for t in self._xp_text(node) if t.strip())
+
+    def attr(self, node, name):
+        return node.get(name)
+
+    def tag(self, node):
+        return node.tag if isinstance(node.tag, str) else None
+
+    def meta(self, doc, key):
+        for attr in ("property", "name"):
+            hits = doc.xpath(f"//meta[@{attr}=$k]/@content", k=key)
+            if hits:
+                return hits[0]
+        return None
+
+    def title(self, doc):
+        hits = doc.xpath("//title")
+        return hits[0].text if hits and hits[0].text else None
+
+    def drop(self, doc, tags):
+        for el in doc.xpath("|".join(f"//{t}" for t in tags)):
+            el.drop_tree()
+
+    def child_text(self, node, tag):
+        for child in node:
+            if isinstance(child.tag, str) and child.tag.rsplit("}", 1)[-1] == tag:
+                return "".join(child.itertext())
+        return ""
+
+@lru_cache(maxsize=None)
+def _css(css):
+    from lxml.cssselect import CSSSelector
+    return CSSSelector(css)
+
+@lru_cache(maxsize=None)
+def _local_xpath(tag):
+    """Namespace'den bağımsız alt eleman araması (RSS 1.0/Atom için de çalışır)."""
+    from lxml import etree
+    return etree.XPath(f".//*[local-name()='{tag}']")
+
+BACKENDS = {"bs4": SoupBackend, "lxml": LxmlBackend}
+
+@lru_cache(maxsize=None)
+def get_backend(name=None):
+    name = (name or DEFAULT_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen parser: {name} (seçenekler: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+paraphrase.py - Tek geçişli kelime/ifade değiştirme (auto_rewriter.simple_paraphrase).
+- Kurallar assets/paraphrase.tsv'de: kalıp <TAB> yerine. Kalıplar tek bir alternasyon
+  regex'ine derlenir (uzun kalıp önce); her kalıp kendi grubundadır, eşleşen grubun numarası
+  (m.lastindex) doğrudan kural tablosunu indeksler.
+- Yerine gelen metin eşleşmenin harf biçimini alır: hepsi büyük -> hepsi büyük, ilk harf
+  büyük -> ilk harf büyük (Türkçe i/İ, ı/I doğru).
+- Derleme ilk kullanımda bir kez yapılır (load lru_cache'li); rewrite_many listeyi tek bir
+  regex taramasıyla işler.
+
+Kullanım:
+    eng = load()
+    eng.rewrite("Son dakika: maç bugün canlı")
+    eng.rewrite_many(tweetler)
+"""
+
+import os
+import re
+import sys
+from functools import lru_cache
+
+PARAPHRASE_PATH = os.environ.get("PARAPHRASE_PATH", os.path.join("assets", "paraphrase.tsv"))
+SEP = "\x00"   # rewrite_many'de metin ayırıcı: kelime karakteri değil, kalıplarda geçmez
+TR_UPPER = str.maketrans({"i": "İ", "ı": "I"})
+
+def tr_upper(s):
+    return s.translate(TR_UPPER).upper()
+
+def read_rules(path=PARAPHRASE_PATH):
+    """-> [(kalıp, yerine)]"""
+    rules = []
+    with open(path, "r", encoding="utf-8") as f:
+        for n, line in enumerate(f, 1):
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            cols = line.split("\t")
+            if len(cols) != 2 or not cols[0].strip():
+                raise ValueError(f"{path}:{n}: geçersiz satır: {line!r}")
+            rules.append((cols[0].strip(), cols[1].strip()))
+    return rules
+
+class Engine:
+    def __init__(self, rules):
+        # aynı kalıp iki kez yazılmışsa ilki geçerli; uzun kalıp önce (alternasyon ilk eşleşeni alır)
+        uniq = {}
+        for pat, rep in rules:
+            uniq.setdefault(pat.lower(), (pat, rep))
+        ordered = sorted(uniq.values(), key=lambda r: len(r[0]), reverse=True)
+        # grup i -> (olduğu gibi, İlk harf büyük, TÜMÜ BÜYÜK)
+        self.table = [None] + [(rep, tr_upper(rep[:1]) + rep[1:], tr_upper(rep)) for _, rep in ordered]
+        alts = "|".join("(" + re.escape(pat) + ")" for pat, _ in ordered)
+        self.regex = re.compile(r"\b(?:" + alts + r")\b", re.IGNORECASE) if ordered else None
+
+    def _swap(self, m):
+        plain, cap, upper = self.table[m.lastindex]
+        src = m.group()
+        if src[:1].isupper():
+            return upper if len(src) > 1 and src.isupper() else cap
+        return plain
+
+    def swap(self, text):
+        """Sadece kural değişimleri (tek geçiş)."""
+        return self.regex.sub(self._swap, text) if self.regex else text
+
+    def rewrite(self, text):
+        """simple_paraphrase: değişimler + kısa metne nokta + boşluk düzeltme."""
+        return finish(self.swap(text))
+
+    def rewrite_many(self, texts):
+        """Liste -> liste. Metinler SEP ile birleştirilip tek taramada değiştirilir."""
+        texts = list(texts)
+        if not texts:
+            return []
+        if any(SEP in t for t in texts):
+            return [self.rewrite(t) for t in texts]
+        return [finish(t) for t in self.swap(SEP.join(texts)).split(SEP)]
+
+MULTI_SPACE = re.compile(r"\s{2,}")
+
+def finish(t):
+    if len(t) < 40 and not t.endswith(("!", "?", ".")):
+        t += "."
+    return MULTI_SPACE.sub(" ", t).strip()
+
+@lru_cache(maxsize=4)
+def load(path=PARAPHRASE_PATH):
+    return Engine(read_rules(path))
+
+def main(argv):
+    eng = load()
+    texts = argv or [line.rstrip("\n") for line in sys.stdin]
+    for out in eng.rewrite_many(texts):
+        print(out)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pipeline.py - Sıralı, aşamalı üretici/tüketici hattı.
+- İndirme: I/O iş parçacığı havuzu (IO_WORKERS). download(iş) ham bayt gibi düz veri döner.
+- İşleme: çekirdek sayısı kadar süreçlik havuz (CPU_WORKERS). process(veri) üst düzey bir
+  fonksiyon olmalı (pickle ile gönderilir); süreç sınırını sadece bayt/str/tuple geçer,
+  soup/ağaç nesneleri süreç içinde kalır.
+- Tüketici: run() sonuçları işlerin sırasıyla verir (tek, sıralı gönderici). Hatta aynı anda
+  en çok `depth` iş bulunur (sınırlı kuyruk); tüketici ilerledikçe yenisi eklenir.
+- Tüketici generator'ı bırakırsa (break/close) bekleyen işler iptal edilir.
+- Her aşama için StageStats: adet, meşgul süre, öğe/sn (ilk başlangıçtan son bitişe).
+- observe(aşama, iş, çıktı, tepe bayt) verilirse her iş/aşama sonunda (I/O iş parçacığında)
+  çağrılır; işçi süreç tracemalloc açıkken işleme aşamasının tepe belleğini ölçer.
+CPU_WORKERS=0 ise işleme indirme iş parçacığında yapılır (süreç havuzu açılmaz).
+
+Kullanım:
+    with Pipeline(download, process) as pipe:
+        for job, result, error in pipe.run(jobs, deadline=budget):
+            ...                         # sırayla; error varsa result None
+    print(pipe.report())
+"""
+
+import os
+import time
+import threading
+import tracemalloc
+import concurrent.futures as cf
+from collections import deque
+
+from deadline import DeadlineExceeded
+
+IO_WORKERS = int(os.environ.get("IO_WORKERS", "8"))
+CPU_WORKERS = int(os.environ.get("CPU_WORKERS", str(os.cpu_count() or 1)))
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.n = 0
+        self.busy = 0.0
+        self.first = None
+        self.last = None
+        self._lock = threading.Lock()
+
+    def add(self, t0, t1):
+        """t0/t1: time.monotonic() (Linux'ta süreçler arası ortak saat)."""
+        with self._lock:
+            self.n += 1
+            self.busy += t1 - t0
+            self.first = t0 if self.first is None else min(self.first, t0)
+            self.last = t1 if self.last is None else max(self.last, t1)
+
+    def rate(self):
+        span = (self.last or 0) - (self.first or 0)
+        return self.n / span if self.n and span > 0 else 0.0
+
+    def __str__(self):
+        avg = self.busy / self.n * 1000 if self.n else 0.0
+        return f"{self.name:10} n={self.n:<5} {self.rate():8.1f} öğe/sn  ort {avg:7.1f} ms  meşgul {self.busy:6.2f} sn"
+
+def _timed(fn, arg, mem=False):
+    """-> (sonuç, t0, t1, tepe bayt). mem: tracemalloc açıksa tepe ölçülür (işçi süreçte)."""
+    tracing = mem and tracemalloc.is_tracing()
+    if tracing:
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    t0 = time.monotonic()
+    out = fn(arg)
+    t1 = time.monotonic()
+    peak = tracemalloc.get_traced_memory()[1] - start if tracing else 0
+    return out, t0, t1, peak
+
+class Pipeline:
+    def __init__(self, download, process, io_workers=None, cpu_workers=None, depth=None, observe=None):
+        self.download = download
+        self.process = process
+        self.observe = observe
+        self.io_workers = max(1, io_workers or IO_WORKERS)
+        self.cpu_workers = CPU_WORKERS if cpu_workers is None else cpu_workers
+        self.depth = depth or 2 * self.io_workers
+        self.stats = {k: StageStats(k) for k in ("indirme", "işleme", "gönderim")}
+        self._procs = self._threads = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._threads:
+            self._threads.shutdown(wait=True, cancel_futures=True)
+        if self._procs:
+            self._procs.shutdown(wait=True, cancel_futures=True)
+        return False
+
+    def _start(self):
+        """Havuzlar ilk işte açılır (iş yoksa süreç başlatma maliyeti yok)."""
+        if self.cpu_workers > 0:
+            self._procs = cf.ProcessPoolExecutor(max_workers=self.cpu_workers)
+            # süreçler iş parçacıkları başlamadan açılsın (fork + thread karışmasın)
+            self._procs.submit(os.getpid).result()
+        self._threads = cf.ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="io")
+
+    def _stage(self, job):
+        """I/O iş parçacığında: indir, sonra işlemeyi süreç havuzuna ver (ya da burada yap)."""
+        data, t0, t1, _ = _timed(self.download, job)
+        self.stats["indirme"].add(t0, t1)
+        if self.observe:
+            self.observe("indirme", job, data, 0)
+        if self._procs is None:
+            out, t0, t1, peak = _timed(self.process, data)
+        else:
+            out, t0, t1, peak = self._procs.submit(_timed, self.process, data, True).result()
+        self.stats["işleme"].add(t0, t1)
+        if self.observe:
+            self.observe("işleme", job, out, peak)
+        return out
+
+    def run(self, jobs, deadline=None, depth=None):
+        """
+        -> (iş, sonuç, hata) işlerin sırasıyla. depth: hatta aynı anda en çok kaç iş (çağıran
+        tüketim hızına göre daraltabilir; callable ise her eklemede sorulur).
+        deadline süresi dolarsa bekleyen sonuç DeadlineExceeded ile döner.
+        """
+        it = iter(jobs)
+        pending = deque()
+        limit = depth or self.depth
+        try:
+            while True:
+                cap = limit() if callable(limit) else limit
+                while len(pending) < max(1, cap):
+                    job = next(it, None)
+                    if job is None:
+                        break
+                    if self._threads is None:
+                        self._start()
+                    pending.append((job, self._threads.submit(self._stage, job)))
+                if not pending:
+                    return
+                job, fut = pending.popleft()
+                try:
+                    timeout = deadline.left() if deadline is not None and deadline.end else None
+                    if timeout is not None and timeout <= 0:
+                        raise DeadlineExceeded("bütçe doldu")
+                    yield job, fut.result(timeout=timeout), None
+                except cf.TimeoutError:
+                    yield job, None, DeadlineExceeded("bütçe doldu")
+                except Exception as ex:
+                    yield job, None, ex
+        finally:
+            for _, fut in pending:
+                fut.cancel()
+
+    def report(self):
+        return "\n".join(str(s) for s in self.stats.values())
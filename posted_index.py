@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+posted_index.py - Botlar arası ortak gönderi geçmişi: aynı/çok benzer metin ikinci kez atılmaz.
+- Her gönderinin 64 bit SimHash parmak izi posted_index.bin'e eklenir (sabit genişlikli kayıt:
+  parmak izi, zaman, bot adı). Dosya sadece sona eklenir; yazımlar kilit dosyasıyla (flock)
+  sıraya girer, birden çok bot aynı anda çalışabilir.
+- SimHash özellikleri: kelimeler + ardışık kelime çiftleri. Küçük harf (Türkçe i/ı), aksanlar
+  katlanır (auto_repost_bot unidecode'lu atar), bağlantı/@hesap ve kalıp sözcükler ("son
+  dakika", "Kaynak", paraphrase ekleri, bağlaçlar) atılır; aynı haber farklı botun
+  biçimlendirmesiyle de aynı parmak izini verir.
+- Yakın tekrar: Hamming uzaklığı <= MAX_DISTANCE. Parmak izi MAX_DISTANCE + 1 banda bölünür;
+  uzaklık bunu geçmiyorsa en az bir bant birebir aynıdır (güvercin yuvası). Her bant için
+  sıralı değer dizisi tutulur, aday sadece aynı bant değerine sahip kayıtlardır
+  (searchsorted), adayların uzaklığı tek vektörel işlemle bulunur -> aylarca geçmişte bile
+  kontrol milisaniyenin altında.
+- Yüklemeden sonra eklenen kayıtlar (bu ya da başka süreçten) dosyanın kuyruğundan okunur;
+  bant dizileri REBAND kayıt biriktikçe yeniden kurulur, arada kalanlar hep aday sayılır.
+- RETENTION_DAYS'ten eski kayıtlar eşleşmez; compact() onları dosyadan atar.
+
+Kullanım:
+    idx = load()
+    dup = idx.find(tweet)        # Match ya da None
+    if dup is None: ...gönder...; idx.add(tweet, "rss")
+    python posted_index.py import tweets_sent.txt tweet   # eski geçmişi ekle
+    python posted_index.py check "metin" | status | compact
+"""
+
+import os
+import re
+import sys
+import time
+import fcntl
+import hashlib
+from functools import lru_cache
+from contextlib import contextmanager
+
+import numpy as np
+
+POSTED_INDEX_PATH = os.environ.get("POSTED_INDEX_PATH", "posted_index.bin")
+MAX_DISTANCE = int(os.environ.get("POSTED_MAX_DISTANCE", "6"))
+RETENTION_DAYS = float(os.environ.get("POSTED_RETENTION_DAYS", "180"))
+REBAND = 256          # bantlara alınmamış en fazla kayıt
+REC = np.dtype([("fp", "<u8"), ("ts", "<f8"), ("bot", "S8")])
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+URL_RE = re.compile(r"https?://\S+|@\w+")
+WORD_RE = re.compile(r"[^\W_]+")
+FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+STOP = frozenset("son dakika flas gelisme kaynak haber itibariyla olarak rt ve ile bir bu da de icin".split())
+
+def features(text):
+    text = URL_RE.sub(" ", text.replace("I", "ı").replace("İ", "i").lower().translate(FOLD))
+    words = [w for w in WORD_RE.findall(text) if w not in STOP]
+    return words + [a + " " + b for a, b in zip(words, words[1:])]
+
+def bands(n):
+    """64 biti n banda böl -> [(kaydırma, maske)]."""
+    out, shift = [], 0
+    for b in range(n):
+        width = 64 // n + (b < 64 % n)
+        out.append((shift, (1 << width) - 1))
+        shift += width
+    return out
+
+def _hash64(feature):
+    return hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+
+def simhash(text):
+    """-> 64 bit parmak izi; kelimesi olmayan metin için None."""
+    feats = features(text)
+    if not feats:
+        return None
+    h = np.frombuffer(b"".join(_hash64(f) for f in feats), dtype=np.uint8)
+    bits = np.unpackbits(h, bitorder="little").reshape(len(feats), 64)
+    major = bits.sum(axis=0, dtype=np.int32) * 2 > len(feats)
+    return int.from_bytes(np.packbits(major, bitorder="little").tobytes(), "little")
+
+class Match:
+    __slots__ = ("fp", "ts", "bot", "distance")
+
+    def __init__(self, fp, ts, bot, distance):
+        self.fp, self.ts, self.bot, self.distance = fp, ts, bot, distance
+
+    def __str__(self):
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.ts))
+        return f"{self.bot} {when}, uzaklık {self.distance}"
+
+class PostedIndex:
+    def __init__(self, path=POSTED_INDEX_PATH, max_distance=MAX_DISTANCE, retention_days=RETENTION_DAYS):
+        if not 0 <= max_distance < 32:
+            raise ValueError(f"max_distance {max_distance}: 0..31 olmalı")
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.max_distance = max_distance
+        self.bands = bands(max_distance + 1)
+        self.retention = retention_days * 86400
+        self.checks = self.hits = self.added = 0
+        self._reset()
+        self._refresh()
+
+    def _reset(self):
+        self.recs = np.zeros(0, dtype=REC)
+        self.fps = np.zeros(0, dtype=np.uint64)    # recs["fp"] / recs["ts"], bitişik kopya
+        self.ts = np.zeros(0, dtype=np.float64)
+        self.size = 0            # okunan bayt
+        self._bands = []         # [(sıralı bant değerleri, kayıt indeksleri)] recs[:_banded] için
+        self._banded = 0
+
+    def __len__(self):
+        return len(self.recs)
+
+    @contextmanager
+    def _locked(self):
+        with open(self.lock_path, "a") as lk:
+            fcntl.flock(lk, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lk, fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """Dosyanın okunmamış kuyruğunu al (başka süreçlerin eklediği kayıtlar dahil)."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        size -= size % REC.itemsize          # yarım kalmış kayıt okunmaz
+        if size < self.size:                 # başka süreç compact etti
+            self._reset()
+        if size == self.size:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.size)
+            data = f.read(size - self.size)
+        self.recs = np.concatenate([self.recs, np.frombuffer(data, dtype=REC)])
+        self.fps = np.ascontiguousarray(self.recs["fp"])
+        self.ts = np.ascontiguousarray(self.recs["ts"])
+        self.size = size
+        if len(self.recs) - self._banded > REBAND:
+            self._reband()
+
+    def _reband(self):
+        fps = self.fps
+        self._bands = []
+        for shift, mask in self.bands:
+            # tek bant (max_distance=0) 64 bit genişliğinde; uint32'ye sığmaz
+            vals = (fps >> np.uint64(shift)) & np.uint64(mask)
+            if mask <= 0xFFFFFFFF:
+                vals = vals.astype(np.uint32)
+            order = np.argsort(vals, kind="stable")
+            self._bands.append((vals[order], order))
+        self._banded = len(self.recs)
+
+    def _candidates(self, fp):
+        """
+        Bantlardan biri birebir tutan kayıtlar + bantlanmamış kuyruk -> indeks dizisi (birden
+        çok bantta tutan kayıt tekrar edebilir; en yakını seçerken zararsız).
+        """
+        parts = [np.arange(self._banded, len(self.recs))]
+        for (shift, mask), (vals, order) in zip(self.bands, self._bands):
+            v = vals.dtype.type((fp >> shift) & mask)
+            lo, hi = np.searchsorted(vals, v, "left"), np.searchsorted(vals, v, "right")
+            parts.append(order[lo:hi])
+        return np.concatenate(parts)
+
+    def find(self, text, now=None):
+        """Geçmişte (saklama süresi içinde) en yakın tekrar -> Match ya da None."""
+        fp = simhash(text)
+        if fp is None:
+            return None
+        self._refresh()
+        self.checks += 1
+        cands = self._candidates(fp)
+        cands = cands[self.ts[cands] >= (now or time.time()) - self.retention]
+        if not len(cands):
+            return None
+        x = self.fps[cands] ^ np.uint64(fp)
+        dist = POPCOUNT[x.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+        k = int(dist.argmin())
+        if dist[k] > self.max_distance:
+            return None
+        self.hits += 1
+        r = self.recs[cands[k]]
+        return Match(int(r["fp"]), float(r["ts"]), r["bot"].decode(errors="replace"), int(dist[k]))
+
+    def add(self, text, bot, now=None):
+        """Gönderilen metni kaydet (gönderim başarılı olduktan sonra)."""
+        fp = simhash(text)
+        if fp is None:
+            return
+        rec = np.array([(fp, now or time.time(), bot.encode()[:8])], dtype=REC)
+        with self._locked(), open(self.path, "ab") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size % REC.itemsize:
+                f.truncate(size - size % REC.itemsize)
+            f.write(rec.tobytes())
+        self.added += 1
+        self._refresh()
+
+    def compact(self, now=None):
+        """Saklama süresini aşan kayıtları at. -> (eski, yeni) kayıt sayısı."""
+        cutoff = (now or time.time()) - self.retention
+        with self._locked():
+            self._refresh()
+            old = len(self.recs)
+            keep = self.recs[self.recs["ts"] >= cutoff]
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(keep.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self._reset()
+            self._refresh()
+        return old, len(keep)
+
+    def report(self):
+        return (f"geçmiş {len(self.recs)} kayıt | bu çalıştırmada {self.checks} kontrol,"
+                f" {self.hits} tekrar engellendi, {self.added} eklendi")
+
+@lru_cache(maxsize=4)
+def load(path=POSTED_INDEX_PATH):
+    return PostedIndex(path)
+
+def main(argv):
+    idx = load()
+    if len(argv) >= 2 and argv[0] == "import":
+        bot = argv[2] if len(argv) > 2 else "import"
+        with open(argv[1], "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+        for line in lines:
+            if idx.find(line) is None:
+                idx.add(line, bot)
+        print(f"{argv[1]}: {len(lines)} satır, {idx.added} eklendi | {idx.report()}")
+        return 0
+    if len(argv) >= 2 and argv[0] == "check":
+        dup = idx.find(" ".join(argv[1:]))
+        print(f"tekrar: {dup}" if dup else "yeni")
+        return 0
+    if argv and argv[0] == "compact":
+        old, new = idx.compact()
+        print(f"sıkıştırıldı: {idx.path} {old} -> {new} kayıt")
+        return 0
+    if argv and argv[0] == "status":
+        print(idx.report())
+        return 0
+    print(__doc__)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+runner.py - Tüm botları tek süreçte eklenti olarak çalıştırır.
+- Eklentiler: rss (auto_rss_bot), fx (auto_fx_bot), rewriter (auto_rewriter), repost
+  (auto_repost_bot), bundle (auto_news_bundle_bot). Her biri botun kendi main(argv, client)
+  girişidir; argv assets/runner.yaml'daki args (tek başına çalıştırmadaki komut satırı).
+- Ortak olanlar:
+  * tek X istemcisi (x_client.client()); her eklentiye ScheduledClient ile sarılı verilir,
+  * tek gönderi zamanlayıcı (x_client.PostScheduler): botlar arası aralık, saatlik toplam
+    sınır, 429'da hepsi birden durur,
+  * tek HTTP bağlantı havuzu (http_pool), tek durum deposu (state_store),
+  * modül düzeyi önbellekler (langid, gazetteer, paraphrase, posted_index) ilk turdan sonra
+    sıcak kalır; her bot için ayrı Python/bağımlılık açılışı yok.
+- Her eklenti kendi aralığında (every, dk) çalışır; son çalışma zamanları runner_state.json'da,
+  --once ile cron/Actions altında da aralıklar korunur. Eklentiler sırayla çalışır; birinin
+  hatası (SystemExit dahil) diğerlerini durdurmaz, durum önbelleği atılır (state_store.forget).
+- --dry: zamanlayıcı hiç göndermez, dry bayrağı olan botlara bayrak eklenir (rewriter'dan
+  --post çıkarılır).
+
+Kullanım:
+    python runner.py                      # sürekli
+    python runner.py --once               # sırası gelenleri bir kez çalıştır, çık
+    python runner.py --once --only rss,fx --force --dry
+    python runner.py --list
+"""
+
+import os
+import sys
+import time
+import shlex
+import argparse
+import importlib
+import traceback
+
+import yaml
+
+import state_store
+import x_client
+from x_client import PostScheduler, ScheduledClient, RUNNER_STATE_PATH
+
+RUNNER_CONFIG = os.environ.get("RUNNER_CONFIG", os.path.join("assets", "runner.yaml"))
+IDLE_MAX = 60          # sürekli modda en uzun uyku (sn)
+
+class Plugin:
+    __slots__ = ("name", "module", "every", "args", "enabled", "dry_args", "live_args")
+
+    def __init__(self, name, module, every=60, args="", enabled=True, dry_args=(), live_args=()):
+        self.name = name
+        self.module = module
+        self.every = every * 60
+        self.args = shlex.split(args or "")
+        self.enabled = enabled
+        self.dry_args = list(dry_args)
+        self.live_args = set(live_args)
+
+    def argv(self, dry):
+        if not dry:
+            return list(self.args)
+        return [a for a in self.args if a not in self.live_args] + [a for a in self.dry_args if a not in self.args]
+
+# ad -> (modül, dry'de eklenen bayraklar, dry'de çıkarılan bayraklar)
+PLUGINS = {
+    "rss": ("auto_rss_bot", ["--dry"], []),
+    "fx": ("auto_fx_bot", [], []),
+    "rewriter": ("auto_rewriter", [], ["--post"]),
+    "repost": ("auto_repost_bot", [], []),
+    "bundle": ("auto_news_bundle_bot", ["--dry"], []),
+}
+
+def parse_config(doc, where=RUNNER_CONFIG):
+    """YAML belgesi -> (tempo ayarları, [Plugin]). Bilinmeyen eklenti/alan ValueError."""
+    doc = doc or {}
+    plugins = []
+    for name, spec in (doc.get("plugins") or {}).items():
+        if name not in PLUGINS:
+            raise ValueError(f"{where}: bilinmeyen eklenti {name!r} (olanlar: {', '.join(PLUGINS)})")
+        spec = spec or {}
+        extra = set(spec) - {"every", "args", "enabled"}
+        if extra:
+            raise ValueError(f"{where}: {name}: bilinmeyen alan(lar) {', '.join(sorted(extra))}")
+        module, dry_args, live_args = PLUGINS[name]
+        every = float(spec.get("every", 60))
+        if every <= 0:
+            raise ValueError(f"{where}: {name}: every > 0 olmalı")
+        plugins.append(Plugin(name, module, every, spec.get("args", ""), bool(spec.get("enabled", True)),
+                              dry_args, live_args))
+    pace = {
+        "gap": float(os.environ.get("POST_GAP", doc.get("post_gap", x_client.POST_GAP))),
+        "per_hour": int(os.environ.get("POSTS_PER_HOUR", doc.get("posts_per_hour", x_client.POSTS_PER_HOUR))),
+        "max_wait": float(os.environ.get("POST_MAX_WAIT", doc.get("max_wait", x_client.MAX_WAIT))),
+    }
+    return pace, plugins
+
+def load_config(path=RUNNER_CONFIG):
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_config(yaml.safe_load(f), path)
+
+class Runner:
+    def __init__(self, plugins, scheduler, dry=False, path=RUNNER_STATE_PATH):
+        self.plugins = plugins
+        self.scheduler = scheduler
+        self.dry = dry
+        self.path = path
+        self.state = state_store.load(path)          # zamanlayıcıyla aynı belge
+        self.last = self.state.setdefault("last_run", {})
+        self.stats = {}
+
+    def next_due(self, p):
+        return self.last.get(p.name, 0) + p.every
+
+    def due(self, now=None):
+        now = now or time.time()
+        return [p for p in self.plugins if self.next_due(p) <= now]
+
+    def run_one(self, p):
+        print(f"\n===== [{p.name}] {time.strftime('%H:%M:%S')} {' '.join(p.argv(self.dry))}".rstrip(), flush=True)
+        st = self.stats.setdefault(p.name, {"runs": 0, "errors": 0, "seconds": 0.0})
+        started, t0 = time.time(), time.perf_counter()
+        try:
+            mod = importlib.import_module(p.module)
+            mod.main(p.argv(self.dry), client=ScheduledClient(x_client.client(), self.scheduler, p.name))
+        except SystemExit as ex:
+            if ex.code not in (0, None):
+                st["errors"] += 1
+                print(f"→ [{p.name}] çıkış kodu {ex.code}")
+                state_store.forget()
+        except Exception:
+            st["errors"] += 1
+            print(f"→ [{p.name}] hata:")
+            traceback.print_exc()
+            # kaydedilmemiş yarım durum sonraki tura taşınmasın: hepsi diskten yeniden okunur
+            # (runner/zamanlayıcı kendi belgelerini save'e açıkça verir)
+            state_store.forget()
+        took = time.perf_counter() - t0
+        st["runs"] += 1
+        st["seconds"] += took
+        self.last[p.name] = started
+        state_store.save(self.path, self.state)
+        print(f"===== [{p.name}] bitti ({took:.1f} sn)", flush=True)
+
+    def run(self, once=False, force=False):
+        if once:
+            for p in (self.plugins if force else self.due()):
+                self.run_one(p)
+            return
+        while True:
+            for p in self.due():
+                self.run_one(p)
+            nxt = min(self.next_due(p) for p in self.plugins)
+            time.sleep(min(IDLE_MAX, max(1.0, nxt - time.time())))
+
+    def report(self):
+        lines = []
+        for p in self.plugins:
+            st = self.stats.get(p.name)
+            if st:
+                lines.append(f"{p.name:9} {st['runs']} tur | {st['errors']} hata | {st['seconds']:.1f} sn")
+        lines.append(f"gönderiler: {self.scheduler.report()}")
+        return "\n".join(lines)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Tüm botlar tek süreçte")
+    ap.add_argument("--config", default=RUNNER_CONFIG)
+    ap.add_argument("--once", action="store_true", help="Sırası gelenleri bir kez çalıştır ve çık")
+    ap.add_argument("--only", help="Sadece bu eklentiler (virgülle; enabled: false olanlar da)")
+    ap.add_argument("--force", action="store_true", help="--once ile: aralığa bakmadan hepsini çalıştır")
+    ap.add_argument("--dry", action="store_true", help="Hiçbir şey gönderme")
+    ap.add_argument("--list", action="store_true", help="Eklentileri ve sıradaki çalışma zamanlarını yaz")
+    args = ap.parse_args(argv)
+
+    pace, plugins = load_config(args.config)
+    if args.only:
+        wanted = [s.strip() for s in args.only.split(",") if s.strip()]
+        unknown = set(wanted) - {p.name for p in plugins}
+        if unknown:
+            ap.error(f"yapılandırmada olmayan eklenti: {', '.join(sorted(unknown))}")
+        plugins = [p for p in plugins if p.name in wanted]
+    else:
+        plugins = [p for p in plugins if p.enabled]
+    if not plugins:
+        ap.error("çalıştırılacak eklenti yok")
+
+    scheduler = PostScheduler(dry=args.dry, **pace)
+    runner = Runner(plugins, scheduler, dry=args.dry)
+    if args.list:
+        for p in plugins:
+            nxt = runner.next_due(p)
+            when = "şimdi" if nxt <= time.time() else time.strftime("%Y-%m-%d %H:%M", time.localtime(nxt))
+            print(f"{p.name:9} her {p.every / 60:g} dk | sıradaki: {when} | {p.module} {' '.join(p.args)}")
+        return 0
+    miss = x_client.missing()
+    if miss and not args.dry:
+        raise SystemExit("Eksik X anahtarı: " + ", ".join(miss))
+    try:
+        runner.run(once=args.once, force=args.force)
+    except KeyboardInterrupt:
+        print("\nDurduruldu.")
+    finally:
+        state_store.save(runner.path, runner.state)
+        print("\n[RUNNER]")
+        print(runner.report())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
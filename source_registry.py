@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+source_registry.py - X hesapları ve RSS beslemeleri için tek kaynak kayıt defteri.
+- assets/sources.yaml: üst düzey anahtarlar katmandır (official, press, unofficial...); her
+  kaynak "handle" (X) ya da "rss" (besleme) taşır. "tiers" katman ayarlarını, "read_quota"
+  çalıştırma başına X okuma kotasını verir.
+- Katman: every (dk, okuma aralığı), quota (okuma kotası payı), priority (gönderim çarpanı).
+  İlk katman her çalıştırmada okunur; alt katmanlar aralıkları dolmuşsa ve bütçe kaldıysa.
+- Okuma kotası katman paylarına bölünür; kullanılmayan pay alt katmana geçer. Katman içinde
+  en uzun süredir okunmayan kaynak önce gelir (kota yetmezse kaynaklar sırayla döner).
+- Son okuma zamanları source_polls.json'da bot başına (scope) tutulur: bir botun okuması
+  diğerinin sırasını etkilemez.
+- YAML yoksa düz listelere düşülür (sources.txt / rss_sources.txt, tek katman, kota sınırsız).
+  YAML varken bu listeler (ve eski accounts.txt) okunmaz; yanında duruyorlarsa uyarı basılır.
+
+Kullanım:
+    reg = Registry.load(scope="repost")
+    due = reg.due("x")                      # bu çalıştırmada okunacak X kaynakları
+    read, deferred = reg.plan_reads(due)    # okuma kotasına göre
+    for src in read: ...; reg.mark(src)
+    reg.save(); print(reg.report())
+"""
+
+import os
+import re
+import sys
+import json
+import time
+
+import yaml
+
+REGISTRY_PATH = os.environ.get("SOURCES_YAML", os.path.join("assets", "sources.yaml"))
+SOURCE_POLLS_PATH = os.environ.get("SOURCE_POLLS_PATH", "source_polls.json")
+X_FALLBACK = "sources.txt"
+RSS_FALLBACK = "rss_sources.txt"
+LEGACY_LISTS = (X_FALLBACK, RSS_FALLBACK, "accounts.txt")
+DEFAULT_READ_QUOTA = 4
+KINDS = ("x", "rss")
+
+class Tier:
+    __slots__ = ("name", "rank", "every", "quota", "priority")
+
+    def __init__(self, name, rank, every=0, quota=1.0, priority=1.0):
+        self.name = name
+        self.rank = rank            # 0 = en öncelikli
+        self.every = every          # dk; 0 = her çalıştırma
+        self.quota = quota          # okuma kotası payı (oranlanır)
+        self.priority = priority    # gönderim değer çarpanı
+
+    def __repr__(self):
+        return f"Tier({self.name!r}, every={self.every}, quota={self.quota}, priority={self.priority})"
+
+class Source:
+    __slots__ = ("kind", "ident", "display", "tier")
+
+    def __init__(self, kind, ident, display, tier):
+        self.kind = kind            # "x" | "rss"
+        self.ident = ident          # X kullanıcı adı (@ olmadan) ya da besleme URL'si
+        self.display = display
+        self.tier = tier
+
+    @property
+    def key(self):
+        return f"{self.kind}:{self.ident.lower() if self.kind == 'x' else self.ident}"
+
+    @property
+    def priority(self):
+        return self.tier.priority
+
+    def __repr__(self):
+        return f"Source({self.kind}:{self.ident!r}, {self.tier.name})"
+
+def _read_lines(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [s.strip() for s in f if s.strip() and not s.strip().startswith("#")]
+
+_warned = set()
+
+def _warn_legacy(path):
+    """YAML kullanılırken yanında duran düz listeler sessizce yok sayılmasın (süreç başına bir kez)."""
+    stale = [p for p in LEGACY_LISTS if os.path.exists(p) and p not in _warned]
+    if stale:
+        _warned.update(stale)
+        print(f"[KAYNAK] UYARI: {path} kullanılıyor; {', '.join(stale)} kayıt defterince okunmuyor "
+              f"(kaynakları YAML'a taşıyıp bu dosyaları silin).")
+
+def _handle(s):
+    return re.sub(r"^@", "", str(s).strip())
+
+def parse_registry(data, path=REGISTRY_PATH):
+    """YAML verisi -> (katmanlar, kaynaklar, okuma kotası). Katman sırası dosyadaki sıradır."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: kök eşleme (mapping) olmalı")
+    conf = data.get("tiers") or {}
+    names = [k for k in data if k not in ("tiers", "read_quota")]
+    # ayarı olup kaynağı olmayan katman da sıraya girer (kaynak sonradan eklenebilir)
+    names += [k for k in conf if k not in names]
+    tiers = {}
+    for rank, name in enumerate(names):
+        c = conf.get(name) or {}
+        tiers[name] = Tier(name, rank, every=float(c.get("every", 0)), quota=float(c.get("quota", 1.0)),
+                           priority=float(c.get("priority", 1.0)))
+
+    sources, keys = [], set()
+    for name in names:
+        for n, item in enumerate(data.get(name) or [], 1):
+            if not isinstance(item, dict) or ("handle" in item) == ("rss" in item):
+                raise ValueError(f"{path}: {name}[{n}]: 'handle' ya da 'rss' anahtarlarından biri olmalı")
+            kind = "x" if "handle" in item else "rss"
+            ident = _handle(item["handle"]) if kind == "x" else str(item["rss"]).strip()
+            src = Source(kind, ident, item.get("display") or ident, tiers[name])
+            if src.key in keys:
+                raise ValueError(f"{path}: {name}[{n}]: {ident} birden fazla katmanda")
+            keys.add(src.key)
+            sources.append(src)
+    quota = int(data.get("read_quota", DEFAULT_READ_QUOTA))
+    return tiers, sources, quota
+
+class Registry:
+    def __init__(self, tiers, sources, read_quota=DEFAULT_READ_QUOTA, polls=None,
+                 polls_path=SOURCE_POLLS_PATH, scope="default"):
+        self.tiers = tiers
+        self.sources = sorted(sources, key=lambda s: s.tier.rank)
+        self.read_quota = read_quota
+        self.all_polls = polls or {}  # scope -> {kaynak anahtarı -> son okuma (epoch sn)}
+        self.polls = self.all_polls.setdefault(scope, {})
+        self.polls_path = polls_path
+        self.status = {}            # bu çalıştırma: anahtar -> "okundu" | "ertelendi" | "sırası değil"
+
+    @classmethod
+    def load(cls, path=REGISTRY_PATH, polls_path=SOURCE_POLLS_PATH, scope="default"):
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                tiers, sources, quota = parse_registry(yaml.safe_load(f), path)
+            _warn_legacy(path)
+        else:
+            tier = Tier("default", 0)
+            tiers = {tier.name: tier}
+            sources = [Source("x", _handle(s), _handle(s), tier) for s in _read_lines(X_FALLBACK)]
+            sources = list({s.key: s for s in sources}.values())
+            quota = len(sources)  # düz listede eski davranış: her hesap okunur
+            sources += [Source("rss", u, u, tier) for u in _read_lines(RSS_FALLBACK)]
+        try:
+            with open(polls_path, "r", encoding="utf-8") as f:
+                polls = json.load(f)
+        except (OSError, ValueError):
+            polls = {}
+        return cls(tiers, sources, quota, polls, polls_path, scope)
+
+    def save(self):
+        tmp = self.polls_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.all_polls, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.polls_path)
+
+    def extend(self, kind, idents, tier=None):
+        """Kayıtta olmayan kaynakları ekler (varsayılan: ilk katman)."""
+        if tier is None and not self.tiers:
+            self.tiers["default"] = Tier("default", 0)
+        tier = tier or min(self.tiers.values(), key=lambda t: t.rank)
+        have = {s.key for s in self.sources}
+        for ident in idents:
+            src = Source(kind, _handle(ident) if kind == "x" else ident, ident, tier)
+            if src.key not in have:
+                have.add(src.key)
+                self.sources.append(src)
+        self.sources.sort(key=lambda s: s.tier.rank)
+
+    def of(self, kind):
+        """Bir türün tüm kaynakları, katman sırasıyla."""
+        return [s for s in self.sources if s.kind == kind]
+
+    def find(self, kind, ident):
+        key = Source(kind, ident, "", None).key
+        return next((s for s in self.sources if s.key == key), None)
+
+    def is_due(self, src, now=None):
+        if src.tier.rank == 0 or src.tier.every <= 0:
+            return True
+        return (now or time.time()) - self.polls.get(src.key, 0) >= src.tier.every * 60
+
+    def budget_allows(self, src, budget):
+        """İlk katman bütçeden bağımsız denenir; alt katmanlar bütçe bitmişse okunmaz."""
+        return src.tier.rank == 0 or budget is None or not budget.expired()
+
+    def due(self, kind, now=None):
+        """
+        Bu çalıştırmada okunması gereken kaynaklar: katman sırası, katman içinde en uzun süredir
+        okunmayan önce. Aralığı dolmamış kaynaklar "sırası değil" diye işaretlenir.
+        """
+        now = now or time.time()
+        out = []
+        for s in self.of(kind):
+            if self.is_due(s, now):
+                out.append(s)
+            else:
+                self.status[s.key] = "sırası değil"
+        out.sort(key=lambda s: (s.tier.rank, self.polls.get(s.key, 0)))
+        return out
+
+    def plan_reads(self, sources, quota=None):
+        """
+        Okuma kotasını katman paylarına böler -> (okunacaklar, ertelenenler).
+        Pay kesirli tutulur; katmanın kullanmadığı kısım sonraki katmana devreder. İlk katman
+        kota varken en az bir okuma alır.
+        """
+        quota = self.read_quota if quota is None else quota
+        groups = {}
+        for s in sources:
+            groups.setdefault(s.tier.rank, []).append(s)
+        ranked = sorted(self.tiers.values(), key=lambda t: t.rank)
+        total = sum(t.quota for t in ranked) or 1.0
+        read, deferred, carry = [], [], 0.0
+        for t in ranked:
+            group = groups.get(t.rank, [])
+            share = quota * t.quota / total + carry
+            allow = int(share + 1e-9)
+            if t.rank == 0 and quota > 0:
+                allow = max(allow, 1)
+            take = group[:allow]
+            read += take
+            deferred += group[allow:]
+            carry = max(0.0, share - len(take))
+        for s in deferred:
+            self.status[s.key] = "ertelendi"
+        return read, deferred
+
+    def mark(self, src, now=None):
+        self.polls[src.key] = now or time.time()
+        self.status[src.key] = "okundu"
+
+    def report(self, kind=None):
+        now = time.time()
+        lines = [f"{'katman':11} {'kaynak':40} {'son okuma':>10} durum"]
+        for s in self.sources:
+            if kind and s.kind != kind:
+                continue
+            last = self.polls.get(s.key)
+            ago = f"{(now - last) / 60:7.0f} dk" if last else f"{'-':>10}"
+            lines.append(f"{s.tier.name[:11]:11} {(s.kind + ':' + s.display)[:40]:40} {ago} {self.status.get(s.key, '-')}")
+        return "\n".join(lines)
+
+def main(argv):
+    reg = Registry.load(scope=argv[1] if len(argv) > 1 else "default")
+    kind = argv[0] if argv and argv[0] in KINDS else None
+    print(f"okuma kotası: {reg.read_quota}")
+    for t in sorted(reg.tiers.values(), key=lambda t: t.rank):
+        print(f"  {t!r}")
+    if kind == "x" or kind is None:
+        read, deferred = reg.plan_reads(reg.due("x"))
+        print(f"X planı: okunacak {[s.ident for s in read]} | ertelenen {[s.ident for s in deferred]}")
+    if kind == "rss" or kind is None:
+        print(f"RSS planı: {[s.display for s in reg.due('rss')]}")
+    print(reg.report(kind))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
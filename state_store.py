@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+state_store.py - Botların JSON durum dosyaları için ortak depo.
+- load(path) dosyayı bir kez okur, sonra aynı sözlüğü döndürür (mutlak yol anahtar); runner.py
+  altında bir bot her turda durumunu diskten yeniden ayrıştırmaz. Dosya başka bir süreç
+  tarafından değiştirildiyse (mtime/boyut tutmaz; örn. aynı botun ayrı cron çalışması)
+  önbellek atılır, diskten yeniden okunur.
+- forget(): hata veren bir botun yarım kalmış (kaydedilmemiş) değişiklikleri bir sonraki
+  turuna taşınmasın diye runner.py bunu çağırır.
+- save(path, data) atomik yazar (tmp + os.replace): yarıda kesilen süreç dosyayı bozmaz.
+- Dosya yoksa ya da bozuksa default() (verilmezse boş sözlük) döner; bozuk dosya uyarıyla
+  yeniden başlatılır.
+- Dosya biçimleri değişmez (rss_state.json, state.json, bundle_state.json...); botlar tek
+  başına çalıştırıldığında da aynı dosyaları okur/yazar.
+"""
+
+import os
+import json
+import threading
+
+_docs = {}
+_lock = threading.Lock()
+
+def _key(path):
+    return os.path.abspath(path)
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def load(path, default=None):
+    """-> durum sözlüğü (önbellekten; ilk çağrıda ya da dosya dışarıda değiştiyse diskten)."""
+    key = _key(path)
+    with _lock:
+        stamp = _stamp(path)
+        cached = _docs.get(key)
+        if cached is not None and cached[1] == stamp:
+            return cached[0]
+        data = None
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as ex:
+                print(f"→ Durum dosyası okunamadı ({path}): {ex}; sıfırdan başlanıyor.")
+        if not isinstance(data, dict):
+            data = default() if default else {}
+        _docs[key] = (data, stamp)
+        return data
+
+def save(path, data=None):
+    """data verilirse önbellekteki sözlüğün yerine geçer; sonra atomik yazılır."""
+    key = _key(path)
+    with _lock:
+        if data is None:
+            cached = _docs.get(key)
+            if cached is None:
+                return
+            data = cached[0]
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+        _docs[key] = (data, _stamp(path))
+
+def forget(path=None):
+    """Önbellekten at (path yoksa hepsini); sonraki load() diskten okur."""
+    with _lock:
+        if path is None:
+            _docs.clear()
+        else:
+            _docs.pop(_key(path), None)
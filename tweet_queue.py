@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+tweet_queue.py - tweets.txt için imleçli, indeksli kuyruk (auto_tweet --mode next).
+- Kuyruk dosyası düz metindir: satır başına bir tweet, sona ekleyerek beslenir. Gönderilen
+  satırlar dosyadan silinmez; okuma imleci (bayt ofseti) ilerler. Kalanı yeniden yazmak yok.
+- İsteğe bağlı zamanlama: "[2026-10-20 09:00] metin" (ISO tarih/saat, saat dilimi yoksa
+  yerel). Zamanlı satırlar <dosya>.idx'te (due, ofset) sıralı sabit genişlikli kayıtlardır;
+  vadesi gelen en erken kayıt idx imlecindedir. Zamanı gelen zamanlı satır sıradakinden önce gider.
+- İmleç <dosya>.cursor'da (JSON): fifo ofseti, idx imleci, taranan bayt, dosya başı imzası.
+  Her güncelleme tmp + fsync + os.replace ile atomiktir; yarıda kalan yazım eski imleci bırakır.
+- Sıradakini bulmak O(1): fifo ofsetine seek + readline (zamanlı/boş satırlar atlanır),
+  idx'te tek kayıt okuma. Sona eklenen satırlar sadece bir kez taranır; yeni zamanlı satır
+  gelirse idx'in kalanıyla birleştirilir.
+- Sonunda \n olmayan son satır yazılıyor olabilir; dosya SETTLE_SEC'ten uzun süredir
+  değişmediyse tamamlanmış sayılır (elle düzenlenmiş dosyalarda son satırsonu çoğu zaman yok).
+- Dosya baştan değiştirilirse (imza tutmaz ya da kısalırsa: elle düzenleme, gönderilmiş satırı
+  silme, editörün dosyayı yeniden yazması) imleç sıfırdan değil arşivden yeniden kurulur:
+  metni tweets_sent.txt'te olan satırlar (arşivdeki adet kadar) gönderilmiş sayılır. Baştaki
+  gönderilmiş dizinin sonuna fifo konur, aradakiler "skip" ofsetlerine yazılır, gönderilmiş
+  zamanlılar idx'e girmez. Arşivdeki bir metni kuyruğa bilerek yeniden koymak için compact
+  sonrası eklenmeli (compact'ten sonra dosya yeni kuyruk sayılır).
+- compact(): gönderilmiş satırları dosyadan atar, idx'i yeniden kurar.
+Sıra: gönder -> arşive ekle -> imleci ilerlet; çökme olursa satır en fazla bir kez tekrarlanır.
+
+Kullanım:
+    q = TweetQueue("tweets.txt")
+    e = q.peek()                  # QueueEntry ya da None
+    ...gönder...; q.commit(e)     # gönderilmeyecekse: q.skip(e)
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import struct
+import hashlib
+from collections import Counter
+from datetime import datetime
+
+SENT_PATH = "tweets_sent.txt"
+SCHED_RE = re.compile(rb"^\[(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2})?(?:Z|[+-]\d{2}:?\d{2})?)\]\s+")
+REC = struct.Struct("<dQ")   # (due epoch sn, satır ofseti)
+HEAD_BYTES = 256             # dosya imzası için baştaki bayt
+SETTLE_SEC = 5               # satırsonsuz son satır bu kadar eskiyse tamam sayılır
+
+class QueueEntry:
+    __slots__ = ("text", "offset", "end", "due")
+
+    def __init__(self, text, offset, end, due=None):
+        self.text = text
+        self.offset = offset     # satır başı
+        self.end = end           # sonraki satırın başı
+        self.due = due           # zamanlıysa epoch sn
+
+    def __repr__(self):
+        return f"QueueEntry({self.offset}, due={self.due}, {self.text[:40]!r})"
+
+def parse_due(stamp):
+    s = stamp.decode() if isinstance(stamp, bytes) else stamp
+    dt = datetime.fromisoformat(s.replace("Z", "+00:00").replace(" ", "T"))
+    return dt.timestamp()   # saat dilimi yoksa yerel saat
+
+def split_line(raw):
+    """Ham satır (bayt) -> (metin, due ya da None). Boş satır -> ("", None)."""
+    m = SCHED_RE.match(raw)
+    due = None
+    if m:
+        try:
+            due = parse_due(m.group(1))
+            raw = raw[m.end():]
+        except ValueError:
+            due = None
+    return raw.decode("utf-8", errors="replace").strip(), due
+
+def _write_atomic(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+class TweetQueue:
+    def __init__(self, path, sent_path=SENT_PATH):
+        self.path = path
+        self.sent_path = sent_path
+        self.idx_path = path + ".idx"
+        self.cursor_path = path + ".cursor"
+        self.cur = self._load_cursor()
+
+    # ——— imleç / indeks ———————————————————————————————
+
+    def _fresh(self):
+        return {"fifo": 0, "due": 0, "scanned": 0, "head": "", "skip": []}
+
+    def _load_cursor(self):
+        try:
+            with open(self.cursor_path, "r", encoding="utf-8") as f:
+                cur = json.load(f)
+            return {**self._fresh(), **cur}
+        except (OSError, ValueError):
+            return self._fresh()
+
+    def _save_cursor(self):
+        _write_atomic(self.cursor_path, json.dumps(self.cur).encode())
+
+    def _head(self, f, n):
+        """Dosyanın ilk n baytının özeti (n: taranan kısım, en çok HEAD_BYTES)."""
+        f.seek(0)
+        return hashlib.sha1(f.read(min(n, HEAD_BYTES))).hexdigest()
+
+    def _read_recs(self, start=0):
+        """idx kayıtları [start:] -> [(due, ofset)]."""
+        try:
+            with open(self.idx_path, "rb") as f:
+                f.seek(start * REC.size)
+                data = f.read()
+        except OSError:
+            return []
+        return [REC.unpack_from(data, i) for i in range(0, len(data) - REC.size + 1, REC.size)]
+
+    def _rec_at(self, i):
+        try:
+            with open(self.idx_path, "rb") as f:
+                f.seek(i * REC.size)
+                data = f.read(REC.size)
+        except OSError:
+            return None
+        return REC.unpack(data) if len(data) == REC.size else None
+
+    def _write_recs(self, recs):
+        _write_atomic(self.idx_path, b"".join(REC.pack(d, o) for d, o in recs))
+
+    def _sent_counts(self):
+        """Arşivdeki metinler -> adet (imleç yeniden kurulurken gönderilmişleri tanımak için)."""
+        try:
+            with open(self.sent_path, "r", encoding="utf-8", errors="replace") as f:
+                return Counter(line.strip() for line in f if line.strip())
+        except OSError:
+            return Counter()
+
+    def _sync(self, f):
+        """
+        Dosya baştan değiştiyse imleci arşivden yeniden kur; sona eklenen (tam) satırları tara,
+        zamanlıları idx'e ekle. Gerekirse imleci kaydeder.
+        """
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        settled = time.time() - st.st_mtime >= SETTLE_SEC
+        cur = self.cur
+        scanned = cur["scanned"]
+        sent = None
+        # taranan kısmın başı değiştiyse ya da dosya kısaldıysa: gönderilenler arşivle eşleştirilir
+        if size < scanned or (scanned and self._head(f, scanned) != cur["head"]):
+            print(f"[KUYRUK] {self.path} değişmiş; imleç {self.sent_path} ile yeniden kuruluyor.")
+            self.cur = cur = self._fresh()
+            self._write_recs([])
+            scanned = 0
+            sent = self._sent_counts()
+        if size == scanned:
+            return
+        f.seek(scanned)
+        new, pos = [], scanned
+        leading = sent is not None      # baştaki gönderilmiş/boş/zamanlı dizide miyiz
+        for raw in f:
+            if not raw.endswith(b"\n") and not settled:
+                print(f"[KUYRUK] {self.path}: son satır satırsonsuz ve dosya yeni değişti; "
+                      f"{SETTLE_SEC} sn sonra okunacak.")
+                break  # yarım satır (yazılıyor olabilir); sonraki çalıştırmada
+            m = SCHED_RE.match(raw)
+            done = False
+            if sent is not None:
+                text, _ = split_line(raw)
+                if text and sent[text] > 0:
+                    sent[text] -= 1
+                    done = True
+                if done and not m and not leading:
+                    cur["skip"].append(pos)
+                leading = leading and (done or not text or bool(m))
+                if leading:
+                    cur["fifo"] = pos + len(raw)
+            if m and not done:
+                try:
+                    new.append((parse_due(m.group(1)), pos))
+                except ValueError:
+                    pass
+            pos += len(raw)
+        if new:
+            recs = sorted(self._read_recs(cur["due"]) + new)
+            self._write_recs(recs)
+            cur["due"] = 0
+        cur["scanned"] = pos
+        cur["head"] = self._head(f, pos)
+        self._save_cursor()
+
+    # ——— kuyruk ———————————————————————————————————————
+
+    def peek(self, now=None):
+        """Sıradaki gönderilecek satır: vadesi gelmiş en erken zamanlı satır, yoksa fifo'daki."""
+        if not os.path.exists(self.path):
+            return None
+        now = now or time.time()
+        with open(self.path, "rb") as f:
+            self._sync(f)
+            rec = self._rec_at(self.cur["due"])
+            if rec and rec[0] <= now:
+                f.seek(rec[1])
+                raw = f.readline()
+                text, due = split_line(raw)
+                return QueueEntry(text, rec[1], rec[1] + len(raw), due)
+            pos = start = self.cur["fifo"]
+            skip = set(self.cur["skip"])
+            f.seek(pos)
+            found = None
+            while pos < self.cur["scanned"]:
+                raw = f.readline()
+                text, due = split_line(raw)
+                if text and due is None and pos not in skip:
+                    found = QueueEntry(text, pos, pos + len(raw))
+                    break
+                pos += len(raw)  # boş, zamanlı (idx'ten gider) ya da gönderilmiş satır
+        if pos != start:
+            # atlanan satırlar fifo'ya ait değil; bir daha taranmasın
+            self.cur["fifo"] = pos
+            self.cur["skip"] = [o for o in self.cur["skip"] if o >= pos]
+            self._save_cursor()
+        return found
+
+    def next_due(self):
+        """Bekleyen en erken zamanlı satırın vakti (yoksa None)."""
+        rec = self._rec_at(self.cur["due"])
+        return rec[0] if rec else None
+
+    def commit(self, entry):
+        """Gönderilen satırı arşive ekle, imleci atomik ilerlet."""
+        with open(self.sent_path, "a", encoding="utf-8") as af:
+            af.write(entry.text + "\n")
+        self.skip(entry)
+
+    def skip(self, entry):
+        """Gönderilmeyen satırı (örn. tekrar) arşive yazmadan geç: sadece imleç ilerler."""
+        if entry.due is not None:
+            self.cur["due"] += 1
+        else:
+            self.cur["fifo"] = entry.end
+            self.cur["skip"] = [o for o in self.cur["skip"] if o >= entry.end]
+        self._save_cursor()
+
+    def compact(self):
+        """
+        Gönderilmiş satırları at: fifo'dan önceki bekleyen zamanlı satırlar + fifo'dan sonraki
+        (gönderilmiş zamanlılar hariç) satırlar yeni dosyaya yazılır. -> (eski bayt, yeni bayt).
+        """
+        if not os.path.exists(self.path):
+            return 0, 0
+        with open(self.path, "rb") as f:
+            self._sync(f)
+            old = os.fstat(f.fileno()).st_size
+            done = {o for _, o in self._read_recs()[:self.cur["due"]]} | set(self.cur["skip"])
+            pending = [o for _, o in self._read_recs(self.cur["due"])]
+            fifo, scanned = self.cur["fifo"], self.cur["scanned"]
+            out = []
+            for o in sorted(o for o in pending if o < fifo):
+                f.seek(o)
+                out.append(f.readline())
+            f.seek(fifo)
+            pos = fifo
+            for raw in f:
+                if pos >= scanned:
+                    out.append(raw)  # taranmamış yarım satır olduğu gibi kalır
+                elif pos not in done and raw.strip():
+                    out.append(raw)
+                pos += len(raw)
+        _write_atomic(self.path, b"".join(out))
+        self.cur = self._fresh()
+        self._write_recs([])
+        with open(self.path, "rb") as f:
+            self._sync(f)
+        return old, os.path.getsize(self.path)
+
+    def status(self):
+        """Bekleyen satır sayıları (tam tarama; sadece bilgi için)."""
+        if not os.path.exists(self.path):
+            return {"fifo": 0, "scheduled": 0, "due_now": 0}
+        with open(self.path, "rb") as f:
+            self._sync(f)
+            f.seek(self.cur["fifo"])
+            n = sum(1 for raw in f if raw.strip() and not SCHED_RE.match(raw))
+        recs = self._read_recs(self.cur["due"])
+        now = time.time()
+        return {"fifo": n, "scheduled": len(recs), "due_now": sum(1 for d, _ in recs if d <= now)}
+
+def main(argv):
+    path = argv[1] if len(argv) > 1 else "tweets.txt"
+    q = TweetQueue(path)
+    if argv and argv[0] == "compact":
+        old, new = q.compact()
+        print(f"sıkıştırıldı: {path} {old} -> {new} bayt")
+        return 0
+    if argv and argv[0] == "status":
+        print(q.status(), "| sıradaki:", q.peek())
+        return 0
+    print(__doc__)
+    return 2
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+tweet_text.py - X ağırlıklı uzunluğu ve ortak tweet kısaltıcı (tüm botlar).
+- Ağırlıklı uzunluk (twitter-text v3 kuralları, sınır 280):
+  * bağlantılar (http/https ve www.) uzunluğu ne olursa olsun 23 (t.co); şemasız alan adı
+    (ornek.com.tr) en az 23 sayılır (X bağlantı saysa da saymasa da sınır aşılmaz),
+  * U+0000-10FF (Latin, Türkçe harfler, Kiril, Arapça...), U+2000-200D, U+2010-201F
+    (— – “ ” ‘ ’), U+2032-2037 ağırlığı 1,
+  * diğer her şey (CJK, emoji, … U+2026 dahil) 2; emoji dizisi (ZWJ aileleri, ten rengi,
+    bayrak, tuş başlığı 1️⃣) tek emoji sayılır, toplam 2.
+  Uzunluk kod noktasıyla sayılır (UTF-16 vekil çiftleri tek karakter).
+- fit(): metni tek doğrusal geçişte tarar; geçerken son cümle sonu (. ! ? … ya da satır
+  sonu), son yan cümle sınırı (, ; : —) ve son kelime sınırı tutulur, sınır aşılınca durulur.
+  Seçim: sınırın en az KEEP_MIN'i dolduruluyorsa cümle sonu (… eklenmez), yoksa yan cümle,
+  yoksa kelime sınırı (+ …), hiçbiri yoksa karakter sınırı (+ …). Bağlantı ve emoji dizisi
+  bölünmez. Sığan metin aynen döner; sığmayan metinde sınır üç noktanın ağırlığından (2) bile
+  küçükse boş metin döner. Düz kelimeler tek regex adımıyla geçilir, bağlantı
+  araması sadece sığabilecek kısımda yapılır (uzun gövdenin tamamı taranmaz).
+- compose(gövde, kuyruk): kuyruk (kaynak, bağlantı) hiç kesilmez, gövde kalan yere sığdırılır.
+
+Kullanım:
+    weighted_length("Deprem 🇹🇷 https://ornek.com/haber/123")   # 7 + 2 + 1 + 23 = 33
+    fit(uzun_metin)                       # <= 280
+    compose(ozet, f" — Kaynak: {host} {url}")
+"""
+
+import re
+
+MAX_LEN = 280
+URL_WEIGHT = 23
+ELLIPSIS = "…"
+KEEP_MIN = 0.5              # cümle/yan cümle sınırı için sınırın en az bu oranı dolu olmalı
+SENT_END = frozenset(".!?…")
+CLAUSE_END = frozenset(",;:—–-")
+CLOSERS = frozenset("\"'”’»)]")
+# twitter-text v3: ağırlığı 1 olan aralıklar (geri kalan 2)
+LIGHT = ((0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037))
+# şemalı/www. bağlantı ya da şemasız alan adı (ornek.com.tr/yol); X ikisini de t.co'ya çevirir
+URL_RE = re.compile(
+    r"(?:https?://|www\.)[^\s<>\"]*[^\s<>\".,;:!?'\")\]]"
+    r"|(?<![\w@.])[a-z0-9][a-z0-9-]*(?:\.[a-z0-9-]+)*\."
+    r"(?:com|net|org|info|biz|gov|edu|io|co|me|tv|ly|gl|ai|app|dev|news|tr|uk|de|eu|us)\b"
+    r"(?:/[^\s<>\"]*[^\s<>\".,;:!?'\")\]])?", re.I)
+HEAVY = "\u1100-\u1fff\u200e\u200f\u2020-\u2031\u2038-\U0010ffff"
+# (önünde tek boşlukla) ağırlığı 1 olan ve emoji dizisi başlatmayan karakterler: bir kelime,
+# tek adımda C hızında geçilir
+RUN_RE = re.compile(rf"[ \t\n\r]?(?:[^\s{HEAVY}](?![\ufe0f\u20e3]))+")
+# len()'e ek ağırlık getirebilecek yerler: ağır karakter ya da ©️ / 1️⃣ gibi dizinin başı
+SPECIAL_RE = re.compile(rf"[{HEAVY}]|.(?=[\ufe0f\u20e3])", re.S)
+SPACE_RE = re.compile(r"\s")
+ZWJ, VS16, KEYCAP = 0x200D, 0xFE0F, 0x20E3
+
+def _light(cp):
+    for lo, hi in LIGHT:
+        if lo <= cp <= hi:
+            return True
+    return False
+
+def _emoji_base(cp):
+    return (0x1F000 <= cp <= 0x1FAFF or 0x2600 <= cp <= 0x27BF or 0x2B00 <= cp <= 0x2BFF
+            or 0x2300 <= cp <= 0x23FF or cp in (0x00A9, 0x00AE, 0x203C, 0x2049, 0x2122, 0x2139, 0x3030, 0x303D))
+
+def _emoji_tail(cp):
+    return cp == VS16 or cp == KEYCAP or 0x1F3FB <= cp <= 0x1F3FF or 0xE0020 <= cp <= 0xE007F
+
+def _token(text, i, n):
+    """text[i]'den başlayan karakter ya da emoji dizisi -> (bitiş, ağırlık)."""
+    cp = ord(text[i])
+    if 0x1F1E6 <= cp <= 0x1F1FF:                      # bayrak: iki bölgesel harf
+        if i + 1 < n and 0x1F1E6 <= ord(text[i + 1]) <= 0x1F1FF:
+            return i + 2, 2
+        return i + 1, 2
+    if cp < 0x80 and not (i + 1 < n and ord(text[i + 1]) in (VS16, KEYCAP)):
+        return i + 1, 1                               # en sık yol: ASCII
+    keycap = text[i] in "0123456789#*"
+    if not (_emoji_base(cp) or keycap):
+        return i + 1, 1 if _light(cp) else 2
+    j = i + 1
+    while j < n:
+        c = ord(text[j])
+        if _emoji_tail(c):
+            j += 1
+        elif c == ZWJ and j + 1 < n and _emoji_base(ord(text[j + 1])):
+            j += 2
+        else:
+            break
+    if keycap and j == i + 1:                         # tek başına rakam/#/*
+        return i + 1, 1
+    return j, 2
+
+def _url_weight(m):
+    """Şemasız alan adını X her zaman bağlantı saymayabilir; uzun olanı alınır (taşma olmaz)."""
+    s = m.group()
+    if s[:4].lower() in ("http", "www."):
+        return URL_WEIGHT
+    return max(URL_WEIGHT, len(s))
+
+def _plain_length(text, start, end):
+    """text[start:end] (bağlantısız) ağırlığı: len + ağır karakter/emoji düzeltmesi."""
+    total, i = end - start, start
+    for m in SPECIAL_RE.finditer(text, start, end):
+        k = m.start()
+        if k < i:                        # önceki emoji dizisinin içinde
+            continue
+        i, w = _token(text, k, end)
+        total += w - (i - k)
+    return total
+
+def weighted_length(text):
+    total, i = 0, 0
+    for m in URL_RE.finditer(text):
+        total += _plain_length(text, i, m.start()) + _url_weight(m)
+        i = m.end()
+    return total + _plain_length(text, i, len(text))
+
+def _sentence_end(text, i):
+    """text[:i] bir cümle sonuyla mı bitiyor (kapanan tırnak/parantez atlanır)?"""
+    k = i - 1
+    while k >= 0 and text[k] in CLOSERS:
+        k -= 1
+    return k >= 0 and text[k] in SENT_END
+
+def fit(text, limit=MAX_LEN, ellipsis=ELLIPSIS):
+    """Ağırlıklı uzunluğu limit'i aşmayacak şekilde en doğal sınırdan kes (tek geçiş)."""
+    text = text.strip()
+    n = len(text)
+    ew = weighted_length(ellipsis)
+    total = 0
+    sent = clause = word = hard = 0          # aday kesim noktaları (text[:k])
+    sent_w = clause_w = 0
+    url, scope = None, 0                     # bağlantı araması sadece sığabilecek kısımda
+    i = 0
+    while i < n:
+        if url is not None and url.start() < i:
+            url = None
+        if url is None and i >= scope:
+            sp = SPACE_RE.search(text, i + limit - total + 1)
+            scope = sp.start() if sp else n   # bağlantı boşluk içermez: bölünmez
+            url = URL_RE.search(text, i, scope)
+        stop = scope if url is None else url.start()
+        run = None
+        if i == stop:
+            j, w = url.end(), _url_weight(url)
+            scope = 0                         # sonraki bağlantı için yeniden ara
+        else:
+            run = RUN_RE.match(text, i, stop)
+            if run:
+                j = run.end()
+                w = j - i
+            else:
+                j, w = _token(text, i, stop)
+        ch = text[i]
+        if ch.isspace() and i:
+            if ch == "\n" or _sentence_end(text, i):
+                sent, sent_w = i, total
+            elif total + ew <= limit:
+                if text[i - 1] in CLAUSE_END:
+                    clause, clause_w = i, total
+                word = i
+        if total + w > limit:
+            if run and total + ew < limit:        # düz dizinin sığan kısmına kadar
+                hard = i + limit - ew - total
+            break
+        total += w
+        if total + ew <= limit:
+            hard = j
+        i = j
+    else:
+        return text
+    floor = limit * KEEP_MIN
+    if sent and sent_w >= floor:
+        return text[:sent].rstrip()
+    if clause and clause_w >= floor:
+        return text[:clause].rstrip(" ,;:—–-") + ellipsis
+    if word:
+        return text[:word].rstrip(" ,;:—–-") + ellipsis
+    if sent:
+        return text[:sent].rstrip()
+    if limit < ew:                            # "…" bile sığmıyor
+        return ""
+    return text[:hard].rstrip() + ellipsis
+
+def compose(body, tail="", limit=MAX_LEN, ellipsis=ELLIPSIS):
+    """Gövde + kuyruk; kuyruk kesilmez (sığmıyorsa ikisi birlikte fit'ten geçer)."""
+    room = limit - weighted_length(tail)
+    if room < 1:
+        return fit(body.strip() + tail, limit, ellipsis)
+    return fit(body, room, ellipsis) + tail
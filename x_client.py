@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+x_client.py - Ortak X (Twitter) istemcisi ve gönderi zamanlayıcı.
+- credentials(): .env / ortamdan anahtarlar; iki adlandırma da okunur (API_KEY ya da
+  TW_API_KEY, ACCESS_TOKEN_SECRET ya da TW_ACCESS_SECRET).
+- client(): süreç başına tek tweepy.Client (kullanıcı anahtarları + bearer; okumalar bearer,
+  create_tweet kullanıcı bağlamıyla). api_v11(): medya yükleme için v1.1 API (v2 Client'ta
+  media_upload yok); upload_media() dosyadan ya da bellekteki baytlardan yükler.
+- PostScheduler: tüm botların gönderilerini tek yerden geçirir.
+  * iki gönderi arasında en az POST_GAP sn (kısa bekleme uyunur, uzunsa ertelenir),
+  * son bir saatte en fazla POSTS_PER_HOUR gönderi (tüm botlar toplamı),
+  * X 429 dönerse x-rate-limit-reset'e kadar hiçbir bot göndermez,
+  * dry ise hiç gönderilmez.
+  Gönderilemeyen tweet için PostDeferred (tweepy.TweepyException) atılır: botların mevcut
+  hata yolları gönderilmemiş sayar, geçmişe (posted_index) eklemez.
+  Gönderim kaydı durum deposunda (runner_state.json) tutulur, saatlik sınır yeniden
+  başlatmada sıfırlanmaz.
+- ScheduledClient(client, scheduler, bot): tweepy.Client gibi davranır, create_tweet
+  zamanlayıcıdan geçer; runner.py her eklentiye bunu verir.
+- can_post(client): görsel yüklemeden önce sorulur; zamanlayıcı erteleyecekse (ya da dry)
+  False, v1.1 yüklemesi boşa harcanmaz. Düz tweepy.Client için her zaman True.
+"""
+
+import io
+import os
+import time
+import threading
+from functools import lru_cache
+
+import tweepy
+from dotenv import load_dotenv
+
+import state_store
+
+RUNNER_STATE_PATH = os.environ.get("RUNNER_STATE_PATH", "runner_state.json")
+POST_GAP = float(os.environ.get("POST_GAP", "60"))               # sn
+POSTS_PER_HOUR = int(os.environ.get("POSTS_PER_HOUR", "10"))
+MAX_WAIT = float(os.environ.get("POST_MAX_WAIT", "90"))          # bundan uzun bekleme ertelenir
+RATE_PAUSE = 15 * 60                                             # 429'da başlık yoksa
+KEYS = {
+    "API_KEY": ("API_KEY", "TW_API_KEY"),
+    "API_SECRET": ("API_SECRET", "TW_API_SECRET"),
+    "ACCESS_TOKEN": ("ACCESS_TOKEN", "TW_ACCESS_TOKEN"),
+    "ACCESS_TOKEN_SECRET": ("ACCESS_TOKEN_SECRET", "TW_ACCESS_SECRET"),
+    "BEARER_TOKEN": ("BEARER_TOKEN", "TW_BEARER_TOKEN"),
+}
+
+class PostDeferred(tweepy.TweepyException):
+    """Zamanlayıcı şu an göndermeye izin vermiyor (aralık, saatlik sınır, 429 beklemesi, dry)."""
+
+def credentials():
+    """-> {API_KEY: ..., ...}; eksik olanlar None."""
+    load_dotenv()
+    return {k: next((os.getenv(n) for n in names if os.getenv(n)), None) for k, names in KEYS.items()}
+
+def missing(creds=None):
+    creds = creds or credentials()
+    return [k for k, v in creds.items() if not v]
+
+@lru_cache(maxsize=2)
+def client(wait_on_rate_limit=False):
+    c = credentials()
+    return tweepy.Client(
+        consumer_key=c["API_KEY"],
+        consumer_secret=c["API_SECRET"],
+        access_token=c["ACCESS_TOKEN"],
+        access_token_secret=c["ACCESS_TOKEN_SECRET"],
+        bearer_token=c["BEARER_TOKEN"],
+        wait_on_rate_limit=wait_on_rate_limit,
+    )
+
+@lru_cache(maxsize=1)
+def api_v11():
+    c = credentials()
+    auth = tweepy.OAuth1UserHandler(c["API_KEY"], c["API_SECRET"], c["ACCESS_TOKEN"], c["ACCESS_TOKEN_SECRET"])
+    return tweepy.API(auth)
+
+def can_post(client):
+    check = getattr(type(client), "can_post", None)
+    return check(client) if check else True
+
+def upload_media(path=None, data=None, filename="image.jpg"):
+    """Görsel yükle -> media_id; hata olursa None (gönderi görselsiz devam eder)."""
+    try:
+        if data is not None:
+            media = api_v11().media_upload(filename=filename, file=io.BytesIO(data))
+        else:
+            media = api_v11().media_upload(filename=path)
+        return media.media_id
+    except Exception as ex:
+        print(f"→ Görsel yüklenemedi: {ex} — görselsiz devam.")
+        return None
+
+class PostScheduler:
+    def __init__(self, gap=POST_GAP, per_hour=POSTS_PER_HOUR, max_wait=MAX_WAIT, dry=False,
+                 path=RUNNER_STATE_PATH, sleep=time.sleep):
+        self.gap = gap
+        self.per_hour = per_hour
+        self.max_wait = max_wait
+        self.dry = dry
+        self.path = path
+        self.sleep = sleep
+        self.state = state_store.load(path)
+        self.log = self.state.setdefault("posts", [])       # [[zaman, bot], ...]
+        self.counts = {}                                      # bot -> {"sent", "deferred", "failed"}
+        self._lock = threading.Lock()
+
+    def _count(self, bot, key):
+        c = self.counts.setdefault(bot, {"sent": 0, "deferred": 0, "failed": 0})
+        c[key] += 1
+
+    def _wait_needed(self, now):
+        """-> (beklenecek sn, sebep); sn None ise bu saatte/şu an gönderilemez."""
+        if self.dry:
+            return None, "dry"
+        paused = self.state.get("paused_until", 0)
+        if paused > now:
+            return None, f"X rate limit, {time.strftime('%H:%M', time.localtime(paused))}'e kadar"
+        recent = [t for t, _ in self.log if t > now - 3600]
+        if self.per_hour and len(recent) >= self.per_hour:
+            return None, f"saatlik sınır ({self.per_hour})"
+        last = self.log[-1][0] if self.log else 0
+        return max(0.0, last + self.gap - now), "aralık"
+
+    def can_post(self):
+        """Şimdi create_tweet çağrılsa gönderilir mi (bekleme max_wait içinde)?"""
+        with self._lock:
+            wait, _ = self._wait_needed(time.time())
+            return wait is not None and wait <= self.max_wait
+
+    def post(self, c, bot, **kw):
+        """Zamanlayıcıdan geçirerek create_tweet; gönderilemezse PostDeferred."""
+        with self._lock:
+            wait, why = self._wait_needed(time.time())
+            if wait is None or wait > self.max_wait:
+                self._count(bot, "deferred")
+                raise PostDeferred(f"gönderi ertelendi ({bot}): {why}"
+                                   + (f", {wait:.0f} sn beklemek gerekirdi" if wait else ""))
+            if wait > 0:
+                print(f"→ Gönderi aralığı: {wait:.0f} sn bekleniyor ({bot}).")
+                self.sleep(wait)
+            try:
+                r = c.create_tweet(**kw)
+            except tweepy.TooManyRequests as ex:
+                reset = ex.response.headers.get("x-rate-limit-reset") if ex.response is not None else None
+                self.state["paused_until"] = float(reset) if reset else time.time() + RATE_PAUSE
+                self._count(bot, "failed")
+                self.save()
+                raise
+            except Exception:
+                self._count(bot, "failed")
+                raise
+            now = time.time()
+            self.log.append([now, bot])
+            del self.log[:-max(self.per_hour, 1) * 4]
+            self._count(bot, "sent")
+            self.save()
+            return r
+
+    def save(self):
+        state_store.save(self.path, self.state)
+
+    def report(self):
+        if not self.counts:
+            return "gönderi yok"
+        parts = [f"{bot}: {c['sent']} gönderildi, {c['deferred']} ertelendi, {c['failed']} hata"
+                 for bot, c in sorted(self.counts.items())]
+        now = time.time()
+        recent = sum(1 for t, _ in self.log if t > now - 3600)
+        return " | ".join(parts) + f" | son 1 saat {recent}/{self.per_hour or '∞'}"
+
+class ScheduledClient:
+    """tweepy.Client sarmalayıcı: create_tweet zamanlayıcıdan geçer, gerisi aynen."""
+
+    def __init__(self, inner, scheduler, bot):
+        self._inner = inner
+        self._scheduler = scheduler
+        self.bot = bot
+
+    def create_tweet(self, **kw):
+        return self._scheduler.post(self._inner, self.bot, **kw)
+
+    def can_post(self):
+        return self._scheduler.can_post()
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)